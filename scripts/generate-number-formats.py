@@ -0,0 +1,56 @@
+"""Generate the number format table of the shipped locales from CLDR data.
+
+For every locale in src/humanize/locale, write its decimal separator, group separator
+and grouping sizes to src/humanize/_locale_formats.py, so humanize can look them up
+without parsing anything at import time.
+
+Requires Babel:
+
+    python -m pip install babel
+    python scripts/generate-number-formats.py
+"""
+import os
+
+from babel import Locale, numbers
+
+ROOT = os.path.join(os.path.dirname(__file__), os.pardir, "src", "humanize")
+
+# Humanize always writes ASCII digits and plain spaces
+SPACES = {"\u00a0", "\u202f"}
+
+HEADER = '''\
+"""Number format symbols of the shipped locales.
+
+Generated by scripts/generate-number-formats.py from CLDR data. Do not edit.
+"""
+
+# Locale: (decimal separator, group separator, (primary grouping, secondary grouping))
+'''
+
+
+def number_format(name):
+    locale = Locale.parse(name)
+    decimal = numbers.get_decimal_symbol(locale, numbering_system="latn")
+    group = numbers.get_group_symbol(locale, numbering_system="latn")
+    if group in SPACES:
+        group = " "
+    return decimal, group, locale.decimal_formats[None].grouping
+
+
+def main():
+    names = sorted(
+        name
+        for name in os.listdir(os.path.join(ROOT, "locale"))
+        if os.path.isdir(os.path.join(ROOT, "locale", name))
+    )
+    table = {name: number_format(name) for name in names}
+    with open(os.path.join(ROOT, "_locale_formats.py"), "w", encoding="utf-8") as f:
+        f.write(HEADER)
+        f.write("NUMBER_FORMATS = {\n")
+        for name, (decimal, group, grouping) in table.items():
+            f.write(f'    "{name}": ("{decimal}", "{group}", {grouping}),\n')
+        f.write("}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,3 +11,6 @@ for d in src/humanize/locale/*/; do
     # compile to binary .mo
     /usr/local/opt/gettext/bin/msgfmt --check -o src/humanize/locale/$locale/LC_MESSAGES/humanize{.mo,.po}
 done
+
+# regenerate the number format table of the locales
+python scripts/generate-number-formats.py
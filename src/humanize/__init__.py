@@ -1,22 +1,70 @@
 """Main package for humanize."""
 
-from humanize.filesize import naturalsize
-from humanize.i18n import activate, deactivate, thousands_separator
+from humanize.filesize import (
+    DirSize,
+    RateMeter,
+    SizeFormatter,
+    dirsizes,
+    naturalsize,
+    naturalsize_column,
+    naturalsize_into,
+    naturalsize_many_into,
+    naturalsize_parts,
+    parse_size,
+    parse_size_many,
+)
+from humanize.i18n import (
+    activate,
+    deactivate,
+    decimal_separator,
+    thousands_separator,
+)
 from humanize.number import (
+    IntwordFormatter,
+    QuantityFormatter,
     apnumber,
     clamp,
+    engineering,
     fractional,
+    fractional_many,
     intcomma,
+    intcomma_into,
+    intcomma_many,
+    intcomma_many_into,
     intword,
+    intword_into,
+    intword_many,
+    intword_many_into,
+    intword_parts,
+    naturalquantity,
     ordinal,
+    parse_intword,
+    parse_intword_many,
     scientific,
+    scientific_many,
 )
 from humanize.time import (
+    CoarseClock,
+    DeltaFormatter,
+    FrozenClock,
+    NaturalTimeScheduler,
+    PreciseDeltaFormatter,
     naturaldate,
+    naturaldate_many,
     naturalday,
+    naturalday_many,
     naturaldelta,
+    naturaldelta_ns,
+    naturaldelta_ns_many,
     naturaltime,
+    naturaltime_many,
+    naturaltime_ns,
+    naturaltime_transition,
     precisedelta,
+    precisedelta_ns,
+    precisedelta_ns_many,
+    set_clock,
+    use_clock,
 )
 
 try:
@@ -34,18 +82,60 @@ __all__ = [
     "activate",
     "apnumber",
     "clamp",
+    "CoarseClock",
     "deactivate",
+    "decimal_separator",
+    "DeltaFormatter",
+    "DirSize",
+    "dirsizes",
+    "engineering",
     "fractional",
+    "fractional_many",
+    "FrozenClock",
     "intcomma",
+    "intcomma_into",
+    "intcomma_many",
+    "intcomma_many_into",
     "intword",
+    "intword_into",
+    "intword_many",
+    "intword_many_into",
+    "intword_parts",
+    "IntwordFormatter",
     "naturaldate",
+    "naturaldate_many",
     "naturalday",
+    "naturalday_many",
     "naturaldelta",
+    "naturaldelta_ns",
+    "naturaldelta_ns_many",
+    "naturalquantity",
     "naturalsize",
+    "naturalsize_column",
+    "naturalsize_into",
+    "naturalsize_many_into",
+    "naturalsize_parts",
     "naturaltime",
+    "naturaltime_many",
+    "naturaltime_ns",
+    "naturaltime_transition",
+    "NaturalTimeScheduler",
     "ordinal",
+    "parse_intword",
+    "parse_intword_many",
+    "parse_size",
+    "parse_size_many",
     "precisedelta",
+    "precisedelta_ns",
+    "precisedelta_ns_many",
+    "PreciseDeltaFormatter",
+    "QuantityFormatter",
+    "RateMeter",
     "scientific",
+    "scientific_many",
+    "set_clock",
+    "SizeFormatter",
     "thousands_separator",
+    "use_clock",
     "VERSION",
 ]
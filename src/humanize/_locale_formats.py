@@ -0,0 +1,34 @@
+"""Number format symbols of the shipped locales.
+
+Generated by scripts/generate-number-formats.py from CLDR data. Do not edit.
+"""
+
+# Locale: (decimal separator, group separator, (primary grouping, secondary grouping))
+NUMBER_FORMATS = {
+    "ar_SA": (".", ",", (3, 3)),
+    "bn_BD": (".", ",", (3, 2)),
+    "ca_ES": (",", ".", (3, 3)),
+    "da_DK": (",", ".", (3, 3)),
+    "de_DE": (",", ".", (3, 3)),
+    "es_ES": (",", ".", (3, 3)),
+    "fa_IR": (".", ",", (3, 3)),
+    "fi_FI": (",", " ", (3, 3)),
+    "fr_FR": (",", " ", (3, 3)),
+    "id_ID": (",", ".", (3, 3)),
+    "it_IT": (",", ".", (3, 3)),
+    "ja_JP": (".", ",", (3, 3)),
+    "ko_KR": (".", ",", (3, 3)),
+    "nl_NL": (",", ".", (3, 3)),
+    "pl_PL": (",", " ", (3, 3)),
+    "pt_BR": (",", ".", (3, 3)),
+    "pt_PT": (",", " ", (3, 3)),
+    "ru_RU": (",", " ", (3, 3)),
+    "sk_SK": (",", " ", (3, 3)),
+    "sl_SI": (",", ".", (3, 3)),
+    "sv_SE": (",", " ", (3, 3)),
+    "tr_TR": (",", ".", (3, 3)),
+    "uk_UA": (",", " ", (3, 3)),
+    "vi_VN": (",", ".", (3, 3)),
+    "zh_CN": (".", ",", (3, 3)),
+    "zh_HK": (".", ",", (3, 3)),
+}
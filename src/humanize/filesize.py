@@ -2,6 +2,21 @@
 
 """Bits and bytes related humanization."""
 
+import os
+import re
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+
+from .i18n import decimal_separator
+from .number import (
+    QuantityFormatter,
+    _number_pattern,
+    _scaled_int,
+    _write_many_into,
+)
+
 suffixes = {
     "decimal": ("kB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB"),
     "binary": ("KiB", "MiB", "GiB", "TiB", "PiB", "EiB", "ZiB", "YiB"),
@@ -9,7 +24,111 @@ suffixes = {
 }
 
 
-def naturalsize(value, binary=False, gnu=False, format="%.1f"):
+class SizeFormatter(QuantityFormatter):
+    """Reusable, precompiled filesize formatter.
+
+    This is a `QuantityFormatter` with the filesize suffix tables: the thresholds for
+    every suffix and the output templates are built once, so formatting a value is a
+    single bisect plus one string format. Use it instead of `naturalsize` when
+    formatting many values with the same options.
+
+    Examples:
+        ```pycon
+        >>> fmt = SizeFormatter()
+        >>> fmt(3000000)
+        '3.0 MB'
+        >>> SizeFormatter(binary=True)(3000)
+        '2.9 KiB'
+        >>> SizeFormatter(gnu=True, format="%.3f")(3000)
+        '2.930K'
+        >>> SizeFormatter(bits=True)(96000000)
+        '96.0 Mbit'
+
+        ```
+    Args:
+        binary (bool): If `True`, uses binary suffixes (KiB, MiB) with base
+            2<sup>10</sup> instead of 10<sup>3</sup>.
+        gnu (bool): If `True`, the binary argument is ignored and GNU-style
+            (`ls -sh` style) prefixes are used (K, M) with the 2**10 definition.
+        format (str): Custom formatter.
+        bits (bool): If `True`, formats a number of bits (kbit, Mbit) instead of
+            bytes.
+    """
+
+    def __init__(self, binary=False, gnu=False, format="%.1f", bits=False):
+        """Build the suffix table of the chosen options."""
+        if gnu:
+            suffix = suffixes["gnu"]
+        elif binary:
+            suffix = suffixes["binary"]
+        else:
+            suffix = suffixes["decimal"]
+
+        self.binary = binary
+        self.gnu = gnu
+        self.format = format
+        self.bits = bits
+
+        if gnu and bits:
+            suffix = tuple(s + "b" for s in suffix)
+            byte_units = ("b", "b")
+        elif gnu:
+            byte_units = ("B", "B")
+        elif bits:
+            suffix = tuple(s[:-1] + "bit" for s in suffix)
+            byte_units = ("bit", "bits")
+        else:
+            byte_units = ("Byte", "Bytes")
+
+        base = 1024 if (gnu or binary) else 1000
+        self._base = base
+        separator = "" if gnu else " "
+        # Bytes are shown as integers; each suffix covers [base**k, base**(k + 1))
+        # and, as it always has, is scaled as `base * value / base**(k + 1)`
+        rows = [(0, (1, 1), "%d", byte_units[1], 0)]
+        for k, s in enumerate(suffix, 1):
+            rows.append((base**k, (base, base ** (k + 1)), format, s, k))
+        # Exactly one byte is singular, which `_resolve` picks explicitly
+        rows.append((None, (1, 1), "%d", byte_units[0], 0))
+        self._set_table(rows, separator)
+        self._singular = len(rows) - 1
+
+    def _row_template(self, row, scaled):
+        if row == 0 and abs(scaled) == 1:
+            return self._singular
+        return row
+
+    def _resolve(self, value):
+        scaled, row = super()._resolve(value)
+        return scaled, self._row_template(row, scaled)
+
+    def parts(self, value):
+        """Format a number of bytes, keeping the number and the unit apart.
+
+        Examples:
+            ```pycon
+            >>> SizeFormatter().parts(3000000)
+            Parts(value=3.0, mantissa='3.0', unit='MB', index=2)
+            >>> SizeFormatter(gnu=True).parts(300)
+            Parts(value=300.0, mantissa='300', unit='B', index=0)
+
+            ```
+        Args:
+            value (int, float, str): Integer to convert.
+
+        Returns:
+            Parts: The scaled value, its formatted text, the unit and the power of
+            the base the unit stands for (0 for bytes, 1 for kB, ...).
+        """
+        return super().parts(value)
+
+
+@lru_cache()
+def _size_formatter(binary, gnu, format, bits=False):
+    return SizeFormatter(binary, gnu, format, bits)
+
+
+def naturalsize(value, binary=False, gnu=False, format="%.1f", fixed_width=False):
     """Format a number of bytes like a human readable filesize (e.g. 10 kB).
 
     By default, decimal suffixes (kB, MB) are used.
@@ -28,6 +147,8 @@ def naturalsize(value, binary=False, gnu=False, format="%.1f"):
         '2.930K'
         >>> naturalsize(3000, True)
         '2.9 KiB'
+        >>> naturalsize(3000, fixed_width=True)
+        '    3.0 kB'
 
         ```
     Args:
@@ -37,34 +158,467 @@ def naturalsize(value, binary=False, gnu=False, format="%.1f"):
         gnu (bool): If `True`, the binary argument is ignored and GNU-style
             (`ls -sh` style) prefixes are used (K, M) with the 2**10 definition.
         format (str): Custom formatter.
+        fixed_width (bool): If `True`, the output is right-aligned to the width of the
+            longest output of these options, so it can be redrawn in place.
 
     Returns:
         str: Human readable representation of a filesize.
     """
-    if gnu:
-        suffix = suffixes["gnu"]
-    elif binary:
-        suffix = suffixes["binary"]
-    else:
-        suffix = suffixes["decimal"]
-
-    base = 1024 if (gnu or binary) else 1000
-    bytes = float(value)
-    abs_bytes = abs(bytes)
-
-    if abs_bytes == 1 and not gnu:
-        return "%d Byte" % bytes
-    elif abs_bytes < base and not gnu:
-        return "%d Bytes" % bytes
-    elif abs_bytes < base and gnu:
-        return "%dB" % bytes
-
-    for i, s in enumerate(suffix):
-        unit = base ** (i + 2)
-        if abs_bytes < unit and not gnu:
-            return (format + " %s") % ((base * bytes / unit), s)
-        elif abs_bytes < unit and gnu:
-            return (format + "%s") % ((base * bytes / unit), s)
-    if gnu:
-        return (format + "%s") % ((base * bytes / unit), s)
-    return (format + " %s") % ((base * bytes / unit), s)
+    if fixed_width:
+        return _size_formatter(binary, gnu, format).fixed(value)
+    return _size_formatter(binary, gnu, format)(value)
+
+
+def naturalsize_column(values, binary=False, gnu=False, format="%.1f", policy="max"):
+    """Format a sequence of filesizes, all with the same suffix.
+
+    Unlike calling `naturalsize` on every value, the suffix is chosen once for the
+    whole sequence, so a table column lines up and sorts visually.
+
+    Examples:
+        ```pycon
+        >>> naturalsize_column([300, 3000, 3_000_000])
+        ['0.0 MB', '0.0 MB', '3.0 MB']
+        >>> naturalsize_column([300, 3000, 3_000_000], format="%.3f")
+        ['0.000 MB', '0.003 MB', '3.000 MB']
+        >>> naturalsize_column([300, 3000, 3_000_000], policy="median")
+        ['0.3 kB', '3.0 kB', '3000.0 kB']
+        >>> naturalsize_column([1, 300], gnu=True)
+        ['1B', '300B']
+
+        ```
+    Args:
+        values (iterable): Numbers of bytes.
+        binary (bool): If `True`, uses binary suffixes (KiB, MiB) with base
+            2<sup>10</sup> instead of 10<sup>3</sup>.
+        gnu (bool): If `True`, the binary argument is ignored and GNU-style
+            (`ls -sh` style) prefixes are used (K, M) with the 2**10 definition.
+        format (str): Custom formatter.
+        policy (str or callable): How to pick the suffix: "max" uses the suffix of the
+            largest size, "median" the suffix of the median size. A callable receives
+            the list of absolute sizes and returns the size whose suffix is used.
+
+    Returns:
+        list: Human readable representations of the filesizes.
+    """
+    return _size_formatter(binary, gnu, format).column(values, policy)
+
+
+def naturalsize_parts(value, binary=False, gnu=False, format="%.1f"):
+    """Like `naturalsize`, but return the number and the unit separately.
+
+    Useful to style the number and the unit differently without parsing the output
+    of `naturalsize`.
+
+    Examples:
+        ```pycon
+        >>> naturalsize_parts(3000000)
+        Parts(value=3.0, mantissa='3.0', unit='MB', index=2)
+        >>> naturalsize_parts(3000, binary=True)
+        Parts(value=2.9296875, mantissa='2.9', unit='KiB', index=1)
+        >>> naturalsize_parts(1)
+        Parts(value=1.0, mantissa='1', unit='Byte', index=0)
+
+        ```
+    Args:
+        value (int, float, str): Integer to convert.
+        binary (bool): If `True`, uses binary suffixes (KiB, MiB) with base
+            2<sup>10</sup> instead of 10<sup>3</sup>.
+        gnu (bool): If `True`, the binary argument is ignored and GNU-style
+            (`ls -sh` style) prefixes are used (K, M) with the 2**10 definition.
+        format (str): Custom formatter.
+
+    Returns:
+        Parts: The scaled value, its formatted text, the unit and the power of the
+        base the unit stands for (0 for bytes, 1 for kB, ...).
+    """
+    return _size_formatter(binary, gnu, format).parts(value)
+
+
+def naturalsize_into(
+    buffer, value, binary=False, gnu=False, format="%.1f", offset=None
+):
+    """Write `naturalsize` output into a buffer as ASCII bytes.
+
+    The output is produced directly as `bytes`, without an intermediate `str`.
+
+    Examples:
+        ```pycon
+        >>> buf = bytearray(b"size=")
+        >>> naturalsize_into(buf, 3000000)
+        6
+        >>> buf
+        bytearray(b'size=3.0 MB')
+        >>> view = memoryview(bytearray(4))
+        >>> naturalsize_into(view, 3000, gnu=True, offset=0)
+        4
+        >>> bytes(view)
+        b'2.9K'
+
+        ```
+    Args:
+        buffer (bytearray, memoryview): Destination.
+        value (int, float, str): Integer to convert.
+        binary (bool): If `True`, uses binary suffixes (KiB, MiB) with base
+            2<sup>10</sup> instead of 10<sup>3</sup>.
+        gnu (bool): If `True`, the binary argument is ignored and GNU-style
+            (`ls -sh` style) prefixes are used (K, M) with the 2**10 definition.
+        format (str): Custom formatter.
+        offset (int): Position to write at. If `None`, the output is appended to the
+            `bytearray`. Required for a `memoryview`.
+
+    Returns:
+        int: Number of bytes written.
+    """
+    return _size_formatter(binary, gnu, format).into(buffer, value, offset)
+
+
+def naturalsize_many_into(
+    buffer, values, sep=b"\n", binary=False, gnu=False, format="%.1f", offset=None
+):
+    r"""Write `naturalsize` of every value into a buffer, separated by `sep`.
+
+    Examples:
+        ```pycon
+        >>> buf = bytearray()
+        >>> naturalsize_many_into(buf, [300, 3000, 3000000], sep=b"\t")
+        23
+        >>> buf
+        bytearray(b'300 Bytes\t3.0 kB\t3.0 MB')
+
+        ```
+    Args:
+        buffer (bytearray, memoryview): Destination.
+        values (iterable): Integers to convert.
+        sep (bytes): Separator written between values.
+        binary (bool): If `True`, uses binary suffixes (KiB, MiB) with base
+            2<sup>10</sup> instead of 10<sup>3</sup>.
+        gnu (bool): If `True`, the binary argument is ignored and GNU-style
+            (`ls -sh` style) prefixes are used (K, M) with the 2**10 definition.
+        format (str): Custom formatter.
+        offset (int): Position to write at. If `None`, the output is appended to the
+            `bytearray`. Required for a `memoryview`.
+
+    Returns:
+        int: Number of bytes written.
+    """
+    into = _size_formatter(binary, gnu, format).into
+    return _write_many_into(
+        buffer, values, sep, offset, lambda value, at: into(buffer, value, at)
+    )
+
+
+def _size_multipliers():
+    multipliers = {"B": 1, "Byte": 1, "Bytes": 1}
+    for i, s in enumerate(suffixes["decimal"], 1):
+        multipliers[s] = 1000**i
+    for i, s in enumerate(suffixes["binary"], 1):
+        multipliers[s] = 1024**i
+    for i, s in enumerate(suffixes["gnu"], 1):
+        multipliers[s] = 1024**i
+    return multipliers
+
+
+_SIZE_MULTIPLIERS = _size_multipliers()
+
+
+@lru_cache()
+def _size_pattern(decimal):
+    return re.compile(
+        rf"\s*{_number_pattern(decimal)}\s*"
+        rf"(?P<suffix>{'|'.join(map(re.escape, _SIZE_MULTIPLIERS))})?\s*"
+    )
+
+
+def parse_size(value):
+    """Parse the output of `naturalsize` back into a number of bytes.
+
+    Decimal (kB, MB), binary (KiB, MiB) and GNU (K, M) suffixes are all recognised.
+    The decimal separator of the active locale is accepted as well as ".".
+
+    Examples:
+        ```pycon
+        >>> parse_size("3.0 MB")
+        3000000
+        >>> parse_size("2.9K")
+        2970
+        >>> parse_size("1.2 GiB")
+        1288490189
+        >>> parse_size("300 Bytes")
+        300
+
+        ```
+    Args:
+        value (str): Text to parse, e.g. "3.0 MB".
+
+    Returns:
+        int: Number of bytes, rounded to the nearest integer.
+
+    Raises:
+        ValueError: If `value` is not a number optionally followed by a suffix.
+    """
+    return next(parse_size_many([value]))
+
+
+def parse_size_many(values):
+    """Parse an iterable of `naturalsize` strings.
+
+    The values are parsed lazily, so this is suitable for streaming large inputs.
+
+    Examples:
+        ```pycon
+        >>> list(parse_size_many(["1 Byte", "3.0 kB", "300B", "1.0 KiB"]))
+        [1, 3000, 300, 1024]
+
+        ```
+    Args:
+        values (iterable of str): Texts to parse.
+
+    Yields:
+        int: Numbers of bytes, in order.
+
+    Raises:
+        ValueError: If a value cannot be parsed.
+    """
+    fullmatch = _size_pattern(decimal_separator()).fullmatch
+    multipliers = _SIZE_MULTIPLIERS
+    for value in values:
+        match = fullmatch(value)
+        if match is None:
+            raise ValueError(f"could not parse size string {value!r}")
+        suffix = match.group("suffix")
+        yield _scaled_int(match, multipliers[suffix] if suffix else 1)
+
+
+class RateMeter:
+    """Measure throughput over a sliding time window.
+
+    Byte counts are added to a ring buffer of time buckets, so `update` is O(1) and
+    cheap enough to call for every chunk of an I/O loop. The rate is only computed and
+    formatted when it is read.
+
+    Two rates are available: `rate` is the average over the last `window` seconds and
+    `ewma` is an exponentially weighted moving average of the completed buckets.
+
+    Examples:
+        ```pycon
+        >>> now = [0.0]
+        >>> meter = RateMeter(window=10, clock=lambda: now[0])
+        >>> for _ in range(20):
+        ...     meter.update(6_150_000)
+        ...     now[0] += 0.5
+        >>> meter.rate
+        12300000.0
+        >>> str(meter)
+        '12.3 MB/s'
+        >>> meter.format(bits=True)
+        '98.4 Mbit/s'
+
+        ```
+    Args:
+        window (float): Length of the sliding window, in seconds.
+        buckets (int): Number of buckets the window is split into.
+        binary (bool): If `True`, uses binary suffixes (KiB/s, MiB/s).
+        gnu (bool): If `True`, uses GNU-style prefixes (K/s, M/s).
+        format (str): Custom formatter.
+        alpha (float): Smoothing factor of the EWMA, applied once per bucket.
+        clock (callable): Returns the current time in seconds. Defaults to
+            `time.monotonic`.
+    """
+
+    def __init__(
+        self,
+        window=10.0,
+        buckets=10,
+        binary=False,
+        gnu=False,
+        format="%.1f",
+        alpha=0.3,
+        clock=time.monotonic,
+    ):
+        """Start an empty meter at the current time of `clock`."""
+        self.window = window
+        self.alpha = alpha
+        self._clock = clock
+        self._width = window / buckets
+        self._counts = [0] * buckets
+        self._start = clock()
+        self._current = int(self._start / self._width)
+        self._ewma = None
+        self._formatter = _size_formatter(binary, gnu, format)
+        self._bit_formatter = _size_formatter(binary, gnu, format, True)
+
+    def _advance(self, now):
+        index = int(now / self._width)
+        current = self._current
+        if index == current:
+            return
+        counts = self._counts
+        n = len(counts)
+        if self._ewma is None:
+            self._ewma = counts[current % n] / self._width
+        else:
+            self._ewma += self.alpha * (counts[current % n] / self._width - self._ewma)
+        # Buckets skipped without any update were idle
+        skipped = index - current - 1
+        if skipped:
+            self._ewma *= (1 - self.alpha) ** skipped
+        for i in range(current + 1, current + 1 + min(index - current, n)):
+            counts[i % n] = 0
+        self._current = index
+
+    def update(self, nbytes):
+        """Record that `nbytes` were transferred now.
+
+        Args:
+            nbytes (int): Number of bytes.
+        """
+        now = self._clock()
+        if int(now / self._width) != self._current:
+            self._advance(now)
+        self._counts[self._current % len(self._counts)] += nbytes
+
+    @property
+    def rate(self):
+        """float: Bytes per second over the sliding window."""
+        now = self._clock()
+        self._advance(now)
+        elapsed = min(
+            (len(self._counts) - 1 + now / self._width - self._current) * self._width,
+            now - self._start,
+        )
+        if elapsed <= 0:
+            return 0.0
+        return sum(self._counts) / elapsed
+
+    @property
+    def ewma(self):
+        """float: Exponentially weighted bytes per second of the completed buckets."""
+        self._advance(self._clock())
+        return self._ewma or 0.0
+
+    def format(self, bits=False, smoothed=False):
+        """Format the current rate.
+
+        Args:
+            bits (bool): If `True`, formats bits per second (Mbit/s).
+            smoothed (bool): If `True`, formats `ewma` instead of `rate`.
+
+        Returns:
+            str: Human readable rate, e.g. "12.3 MB/s".
+        """
+        rate = self.ewma if smoothed else self.rate
+        if bits:
+            return self._bit_formatter(rate * 8) + "/s"
+        return self._formatter(rate) + "/s"
+
+    def __str__(self):
+        """Return the current rate in bytes per second, formatted."""
+        return self.format()
+
+
+DirSize = namedtuple("DirSize", ["path", "size", "text"])
+
+
+def _tree_size(path, onerror):
+    """Return the total apparent size of the files below `path`.
+
+    Only the directories still to be visited are kept in memory.
+    """
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError as err:
+                        if onerror is not None:
+                            onerror(err)
+        except OSError as err:
+            if onerror is not None:
+                onerror(err)
+    return total
+
+
+def dirsizes(
+    path, binary=False, gnu=False, format="%.1f", max_workers=None, onerror=None
+):
+    r"""Summarize the size of a directory tree, like `du -sh path/*`.
+
+    Every subdirectory of `path` is walked in a thread pool with `os.scandir`. A row
+    is yielded for each of them as soon as its walk finishes, followed by a row for
+    `path` itself. Sizes are the sum of the apparent sizes of the files in the tree;
+    symlinks are not followed.
+
+    Only the top-level subdirectories are walked in parallel: each of them is walked
+    in full by a single thread, so a tree with one large subdirectory gains little
+    from more workers.
+
+    Examples:
+        ```python
+        for row in dirsizes("/var", gnu=True):
+            print(f"{row.text}\t{row.path}")
+        ```
+    Args:
+        path (str, os.PathLike): Directory to summarize.
+        binary (bool): If `True`, uses binary suffixes (KiB, MiB) with base
+            2<sup>10</sup> instead of 10<sup>3</sup>.
+        gnu (bool): If `True`, the binary argument is ignored and GNU-style
+            (`ls -sh` style) prefixes are used (K, M) with the 2**10 definition.
+        format (str): Custom formatter.
+        max_workers (int): Number of threads. Defaults to the `ThreadPoolExecutor`
+            default.
+        onerror (callable): Called with the `OSError` raised for an entry that cannot
+            be read. By default such entries are skipped silently. It is called from
+            the worker threads, possibly concurrently, so it must be thread-safe.
+
+    Yields:
+        DirSize: Named tuples of `(path, size, text)`, where `text` is the size
+        formatted with `naturalsize`.
+    """
+    formatter = _size_formatter(binary, gnu, format)
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+    # Bound the queued subtrees so huge flat directories are not listed up front
+    window = 2 * max_workers
+
+    total = 0
+    pending = {}
+
+    def finished(done):
+        nonlocal total
+        for future in done:
+            subtree = pending.pop(future)
+            size = future.result()
+            total += size
+            yield DirSize(subtree, size, formatter(size))
+
+    with ThreadPoolExecutor(max_workers) as executor:
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            future = executor.submit(_tree_size, entry.path, onerror)
+                            pending[future] = entry.path
+                        else:
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError as err:
+                        if onerror is not None:
+                            onerror(err)
+                    if len(pending) >= window:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        yield from finished(done)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                yield from finished(done)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    yield DirSize(os.fspath(path), total, formatter(total))
@@ -3,16 +3,21 @@ import gettext as gettext_module
 import os.path
 from threading import local
 
-__all__ = ["activate", "deactivate", "thousands_separator"]
+from ._locale_formats import NUMBER_FORMATS
+
+__all__ = ["activate", "deactivate", "decimal_separator", "thousands_separator"]
 
 _TRANSLATIONS = {None: gettext_module.NullTranslations()}
-_CURRENT = local()
 
 
-# Mapping of locale to thousands separator
-_THOUSANDS_SEPARATOR = {
-    "fr_FR": " ",
-}
+class _Current(local):
+    # Threads that never activated a locale read the class attribute
+    locale = None
+
+
+_CURRENT = _Current()
+
+_DEFAULT_NUMBER_FORMAT = (".", ",", (3, 3))
 
 
 def _get_default_locale_path():
@@ -27,7 +32,7 @@ def _get_default_locale_path():
 def get_translation():
     try:
         return _TRANSLATIONS[_CURRENT.locale]
-    except (AttributeError, KeyError):
+    except KeyError:
         return _TRANSLATIONS[None]
 
 
@@ -157,14 +162,29 @@ def _ngettext_noop(singular, plural):
     return (singular, plural)
 
 
+def number_format():
+    """Return the number format of the current locale.
+
+    Returns:
+        tuple: Decimal separator, thousands separator and grouping sizes (primary,
+        then secondary), e.g. `(".", ",", (3, 3))`.
+    """
+    return NUMBER_FORMATS.get(_CURRENT.locale, _DEFAULT_NUMBER_FORMAT)
+
+
 def thousands_separator() -> str:
     """Return the thousands separator for a locale, default to comma.
 
     Returns:
          str: Thousands separator.
     """
-    try:
-        sep = _THOUSANDS_SEPARATOR[_CURRENT.locale]
-    except (AttributeError, KeyError):
-        sep = ","
-    return sep
+    return number_format()[1]
+
+
+def decimal_separator() -> str:
+    """Return the decimal separator for a locale, default to dot.
+
+    Returns:
+         str: Decimal separator.
+    """
+    return number_format()[0]
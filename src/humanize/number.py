@@ -4,13 +4,38 @@
 
 import math
 import re
+import statistics
+import struct
+from bisect import bisect_right
+from collections import namedtuple
+from decimal import Decimal
 from fractions import Fraction
+from functools import lru_cache
 
 from .i18n import _gettext as _
-from .i18n import _ngettext
 from .i18n import _ngettext_noop as NS_
 from .i18n import _pgettext as P_
-from .i18n import thousands_separator
+from .i18n import decimal_separator, get_translation, number_format
+
+Parts = namedtuple("Parts", ["value", "mantissa", "unit", "index"])
+Parts.__doc__ = """A formatted number split into its scaled value, text and unit.
+
+Attributes:
+    value (int, float): The value scaled to `unit`.
+    mantissa (str): `value` formatted as text.
+    unit (str): The unit, or an empty string if none is used.
+    index (int): Index of the unit in the unit table of the function that returned
+        the record, or `None` if no unit is used.
+"""
+
+_NUMBER_PATTERN = r"(?P<sign>[-+]?)(?P<whole>\d*)(?:\.(?P<frac>\d*))?"
+
+
+def _number_pattern(decimal):
+    """Return `_NUMBER_PATTERN`, also accepting `decimal` as the decimal separator."""
+    if decimal == ".":
+        return _NUMBER_PATTERN
+    return _NUMBER_PATTERN.replace(r"\.", "[.%s]" % re.escape(decimal))
 
 
 def ordinal(value, gender="male"):
@@ -53,8 +78,20 @@ def ordinal(value, gender="male"):
         value = int(value)
     except (TypeError, ValueError):
         return value
-    if gender == "male":
-        t = (
+    t = _ordinal_suffixes(get_translation(), gender == "male")
+    if value % 100 in (11, 12, 13):  # special case
+        return f"{value}{t[0]}"
+    return f"{value}{t[value % 10]}"
+
+
+@lru_cache()
+def _ordinal_suffixes(translation, male):
+    """Return the suffixes of `ordinal` by last digit for the active translation.
+
+    `translation` is the cache key: tables are built once per locale on first use.
+    """
+    if male:
+        return (
             P_("0 (male)", "th"),
             P_("1 (male)", "st"),
             P_("2 (male)", "nd"),
@@ -66,22 +103,18 @@ def ordinal(value, gender="male"):
             P_("8 (male)", "th"),
             P_("9 (male)", "th"),
         )
-    else:
-        t = (
-            P_("0 (female)", "th"),
-            P_("1 (female)", "st"),
-            P_("2 (female)", "nd"),
-            P_("3 (female)", "rd"),
-            P_("4 (female)", "th"),
-            P_("5 (female)", "th"),
-            P_("6 (female)", "th"),
-            P_("7 (female)", "th"),
-            P_("8 (female)", "th"),
-            P_("9 (female)", "th"),
-        )
-    if value % 100 in (11, 12, 13):  # special case
-        return f"{value}{t[0]}"
-    return f"{value}{t[value % 10]}"
+    return (
+        P_("0 (female)", "th"),
+        P_("1 (female)", "st"),
+        P_("2 (female)", "nd"),
+        P_("3 (female)", "rd"),
+        P_("4 (female)", "th"),
+        P_("5 (female)", "th"),
+        P_("6 (female)", "th"),
+        P_("7 (female)", "th"),
+        P_("8 (female)", "th"),
+        P_("9 (female)", "th"),
+    )
 
 
 def intcomma(value, ndigits=None):
@@ -115,25 +148,291 @@ def intcomma(value, ndigits=None):
     Returns:
         str: string containing commas every three digits.
     """
-    sep = thousands_separator()
-    try:
-        if isinstance(value, str):
-            float(value.replace(sep, ""))
+    return _intcomma(value, ndigits, number_format())
+
+
+def _intcomma(value, ndigits, locale_format):
+    """`intcomma` with the number format of the locale already resolved."""
+    text = _intcomma_text(value, ndigits, locale_format)
+    return value if text is None else text
+
+
+def _intcomma_text(value, ndigits, locale_format):
+    """Return the text of `_intcomma`, or `None` if `value` is not a number."""
+    decimal, sep, grouping = locale_format
+    kind = type(value)
+    if grouping != (3, 3):
+        # Only the generic path knows other group sizes
+        text = None
+    elif kind is int and not ndigits:
+        try:
+            text = format(value, ",")
+        except ValueError:
+            # Too many digits for a direct conversion
+            text = _int_digits(value, ",")
+    elif ndigits and (kind is float or kind is Decimal and value.is_finite()):
+        text = "{0:,.{1}f}".format(value, ndigits)
+    elif kind is float:
+        text = _group_digits(str(value), ",")
+    else:
+        text = None
+
+    if text is None:
+        try:
+            if isinstance(value, str):
+                value = _read_number(value, locale_format)
+                float(value)
+            elif kind is not int:
+                float(value)
+        except (TypeError, ValueError):
+            return None
+
+        if ndigits:
+            text = "{0:.{1}f}".format(value, ndigits)
+        elif kind is int:
+            text = _int_digits(value)
         else:
-            float(value)
-    except (TypeError, ValueError):
-        return value
+            text = str(value)
+        text = _group_digits(text, ",", grouping)
+    return _localize(text, decimal, sep)
 
-    if ndigits:
-        orig = "{0:.{1}f}".format(value, ndigits)
-    else:
-        orig = str(value)
 
-    new = re.sub(r"^(-?\d+)(\d{3})", rf"\g<1>{sep}\g<2>", orig)
-    if orig == new:
-        return new
-    else:
-        return intcomma(new)
+def _read_number(text, locale_format):
+    """Return a number written in the format of the locale with a "." decimal point.
+
+    The group separators are only removed if they group the digits as the locale
+    does. Any other text is returned unchanged, to be read like `float` does, so
+    `str(1234.5)` keeps its value in every locale.
+    """
+    decimal, sep, _grouping = locale_format
+    if _locale_number_pattern(*locale_format).fullmatch(text) is None:
+        return text
+    return text.replace(sep, "").replace(decimal, ".")
+
+
+@lru_cache()
+def _locale_number_pattern(decimal, sep, grouping):
+    primary, secondary = grouping
+    sep, decimal = re.escape(sep), re.escape(decimal)
+    grouped = rf"\d{{1,{secondary}}}(?:{sep}\d{{{secondary}}})*{sep}\d{{{primary}}}"
+    return re.compile(rf"\s*[-+]?(?:{grouped}|\d+)(?:{decimal}\d*)?\s*")
+
+
+def _localize(text, decimal, sep):
+    """Swap the "." and "," of a formatted number for the locale separators."""
+    if decimal == "." and sep == ",":
+        return text
+    return text.translate(_separators(decimal, sep))
+
+
+@lru_cache()
+def _separators(decimal, sep):
+    return str.maketrans({".": decimal, ",": sep})
+
+
+def _group_digits(text, sep, grouping=(3, 3)):
+    """Insert `sep` between groups of digits in the leading run of digits of `text`.
+
+    The last group has `grouping[0]` digits and the others `grouping[1]`. The run may
+    be preceded by a minus sign; anything after it (a fraction, an exponent, other
+    text) is copied unchanged.
+    """
+    start = 1 if text[:1] == "-" else 0
+    end = start
+    length = len(text)
+    while end < length and text[end].isdecimal():
+        end += 1
+    primary, secondary = grouping
+    if end - start <= primary:
+        return text
+
+    stop = end - primary
+    groups = [text[stop:end]]
+    while stop - start > secondary:
+        begin = stop - secondary
+        groups.append(text[begin:stop])
+        stop = begin
+    groups.append(text[start:stop])
+    return text[:start] + sep.join(reversed(groups)) + text[end:]
+
+
+# Digits per leaf of the divide-and-conquer conversion. Small enough to stay under
+# the lowest allowed int max str digits limit.
+_LEAF_GROUPS = 128
+_LEAF = 1000**_LEAF_GROUPS
+
+
+def _int_digits(value, sep=""):
+    """Return the decimal digits of an `int`, with `sep` every three digits.
+
+    The value is split recursively by squares of `_LEAF` and only the
+    leaves are converted directly, so it works for ints of any size, regardless of
+    the int max str digits limit.
+    """
+    if -_LEAF < value < _LEAF:
+        if not sep:
+            return str(value)
+        text = format(value, ",")
+        return text if sep == "," else text.replace(",", sep)
+    if value < 0:
+        return "-" + _int_digits(-value, sep)
+
+    splits = [_LEAF]
+    while splits[-1] <= value:
+        splits.append(splits[-1] ** 2)
+    leaf_width = 4 * _LEAF_GROUPS - 1
+    pieces = []
+
+    def convert(value, level, pad):
+        if level < 0:
+            pieces.append(format(value, f"0{leaf_width}," if pad else ","))
+        else:
+            high, low = divmod(value, splits[level])
+            if high or pad:
+                convert(high, level - 1, pad)
+                convert(low, level - 1, True)
+            else:
+                convert(low, level - 1, False)
+
+    convert(value, len(splits) - 2, False)
+    text = ",".join(pieces)
+    if sep != ",":
+        text = text.replace(",", sep)
+    return text
+
+
+def intcomma_many(values, ndigits=None):
+    """Apply `intcomma` to an iterable of values.
+
+    The thousands separator is looked up once, and the values are converted lazily,
+    so this is suitable for streaming large inputs.
+
+    Examples:
+        ```pycon
+        >>> list(intcomma_many([100, 1000, 1_234_567.25, "1000000"]))
+        ['100', '1,000', '1,234,567.25', '1,000,000']
+        >>> list(intcomma_many([1234.5454545, 14308.40], 2))
+        ['1,234.55', '14,308.40']
+
+        ```
+    Args:
+        values (iterable): Integers or floats to convert.
+        ndigits (int, None): Digits of precision for rounding after the decimal point.
+
+    Yields:
+        str: Strings containing commas every three digits, in order.
+    """
+    locale_format = number_format()
+    for value in values:
+        yield _intcomma(value, ndigits, locale_format)
+
+
+def intcomma_into(buffer, value, ndigits=None, offset=None):
+    r"""Write `intcomma(value, ndigits)` into a buffer as UTF-8 bytes.
+
+    Ints and floats are formatted directly as `bytes`, without an intermediate `str`.
+
+    Examples:
+        ```pycon
+        >>> buf = bytearray()
+        >>> intcomma_into(buf, 1_000_000)
+        9
+        >>> buf
+        bytearray(b'1,000,000')
+        >>> view = memoryview(bytearray(8))
+        >>> intcomma_into(view, 1234.5, 1, offset=0)
+        7
+        >>> bytes(view)
+        b'1,234.5\x00'
+
+        ```
+    Args:
+        buffer (bytearray, memoryview): Destination.
+        value (int, float, str): Integer or float to convert.
+        ndigits (int, None): Digits of precision for rounding after the decimal point.
+        offset (int): Position to write at. If `None`, the output is appended to the
+            `bytearray`. Required for a `memoryview`.
+
+    Returns:
+        int: Number of bytes written.
+
+    Raises:
+        TypeError: If `value` cannot be converted to a number. Nothing is written.
+    """
+    locale_format = number_format()
+    kind = type(value)
+    if locale_format[2] == (3, 3) and (kind is int or kind is float):
+        if ndigits:
+            data = b"%.*f" % (ndigits, value)
+        elif kind is float:
+            data = b"%r" % value
+        else:
+            try:
+                data = b"%d" % value
+            except ValueError:
+                # Too many digits for a direct conversion
+                data = _int_digits(value).encode()
+        return _write_into(buffer, _localize_bytes(data, *locale_format[:2]), offset)
+
+    text = _intcomma_text(value, ndigits, locale_format)
+    if text is None:
+        raise TypeError(f"cannot format {value!r} as a number")
+    return _write_into(buffer, text.encode(), offset)
+
+
+def _localize_bytes(data, decimal, sep):
+    """Group the integer part of formatted ASCII number `data` by threes.
+
+    The bytes version of `_group_digits` and `_localize`. An integer part that is
+    not only digits, as in "1e+16" or "inf", is left ungrouped.
+    """
+    decimal, sep = _encoded_separators(decimal, sep)
+    whole, dot, fraction = data.partition(b".")
+    start = 1 if whole[:1] == b"-" else 0
+    digits = len(whole) - start
+    if digits > 3 and whole[start:].isdigit():
+        head = start + (digits % 3 or 3)
+        groups = [whole[:head]]
+        groups += [whole[i:][:3] for i in range(head, len(whole), 3)]
+        whole = sep.join(groups)
+    return whole + decimal + fraction if dot else whole
+
+
+@lru_cache()
+def _encoded_separators(decimal, sep):
+    return decimal.encode(), sep.encode()
+
+
+def intcomma_many_into(buffer, values, sep=b"\n", ndigits=None, offset=None):
+    """Write `intcomma` of every value into a buffer, separated by `sep`.
+
+    Examples:
+        ```pycon
+        >>> buf = bytearray()
+        >>> intcomma_many_into(buf, [100, 1000, 1_000_000], sep=b"|")
+        19
+        >>> buf
+        bytearray(b'100|1,000|1,000,000')
+
+        ```
+    Args:
+        buffer (bytearray, memoryview): Destination.
+        values (iterable): Integers or floats to convert.
+        sep (bytes): Separator written between values.
+        ndigits (int, None): Digits of precision for rounding after the decimal point.
+        offset (int): Position to write at. If `None`, the output is appended to the
+            `bytearray`. Required for a `memoryview`.
+
+    Returns:
+        int: Number of bytes written.
+    """
+    return _write_many_into(
+        buffer,
+        values,
+        sep,
+        offset,
+        lambda value, at: intcomma_into(buffer, value, ndigits, at),
+    )
 
 
 powers = [10**x for x in (3, 6, 9, 12, 15, 18, 21, 24, 27, 30, 33, 100)]
@@ -153,6 +452,45 @@ human_powers = (
 )
 
 
+def _float_bits(x):
+    return struct.unpack("<q", struct.pack("<d", x))[0]
+
+
+def _from_bits(n):
+    return struct.unpack("<d", struct.pack("<q", n))[0]
+
+
+@lru_cache()
+def _rollover_range(format):
+    """Return the range of floats that `format` renders as exactly 1000.
+
+    `intword` moves to the next power when the scaled value would be displayed as
+    "1000.0 thousand". Rendering is monotonic, so the bounds can be found once per
+    format with a bisection over the bit patterns of positive floats.
+
+    >>> from humanize.number import _rollover_range
+    >>> _rollover_range("%.1f")
+    (999.95, 1000.0500000000001)
+    >>> _rollover_range("%d")
+    (1000.0, 1001.0)
+    """
+
+    def smallest(predicate):
+        lo, hi = _float_bits(1.0), _float_bits(10.0**4)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if predicate(float(format % _from_bits(mid))):
+                hi = mid
+            else:
+                lo = mid + 1
+        return _from_bits(lo)
+
+    return (
+        smallest(lambda shown: shown >= 10**3),
+        smallest(lambda shown: shown > 10**3),
+    )
+
+
 def intword(value, format="%.1f"):
     """Converts a large integer to a friendly text representation.
 
@@ -187,28 +525,419 @@ def intword(value, format="%.1f"):
         str: Friendly text representation as a string, unless the value passed could not
         be coaxed into an `int`.
     """
-    try:
-        value = int(value)
-    except (TypeError, ValueError):
-        return value
+    return _intword_formatter(format)(value)
+
+
+def intword_parts(value, format="%.1f"):
+    """Like `intword`, but return the number and the word separately.
+
+    Useful to style the number and the word differently without parsing the output
+    of `intword`.
+
+    Examples:
+        ```pycon
+        >>> intword_parts(1_200_000_000)
+        Parts(value=1.2, mantissa='1.2', unit='billion', index=2)
+        >>> intword_parts("100")
+        Parts(value=100, mantissa='100', unit='', index=None)
+        >>> intword_parts("foo") is None
+        True
+
+        ```
+    Args:
+        value (int, float, str): Integer to convert.
+        format (str): To change the number of decimal or general format of the number
+            portion.
+
+    Returns:
+        Parts: The scaled value, its formatted text, the word and the index of the
+        word in `human_powers`, or `None` if `value` could not be coaxed into an
+        `int`. Values out of the range of `powers` have no word.
+    """
+    return _intword_formatter(format).parts(value)
+
+
+def intword_many(values, format="%.1f"):
+    """Apply `intword` to an iterable of values.
+
+    The formatter is looked up once and the values are converted lazily, so this is
+    suitable for streaming large inputs.
+
+    Examples:
+        ```pycon
+        >>> list(intword_many([100, "12400", 1_200_000_000, None]))
+        ['100', '12.4 thousand', '1.2 billion', None]
+
+        ```
+    Args:
+        values (iterable): Integers to convert.
+        format (str): To change the number of decimal or general format of the number
+            portion.
+
+    Yields:
+        str: Friendly text representations, in order. Values that could not be coaxed
+        into an `int` are yielded unchanged.
+    """
+    formatter = _intword_formatter(format)
+    for value in values:
+        yield formatter(value)
+
+
+class IntwordFormatter:
+    """Reusable formatter for `intword`.
+
+    The range of every power is computed once, including the values that `format`
+    would render as "1000.0" of a power and that are therefore shown with the next
+    one. Formatting a value is then a single bisect plus one string format.
+
+    Examples:
+        ```pycon
+        >>> fmt = IntwordFormatter()
+        >>> fmt(1_200_000_000)
+        '1.2 billion'
+        >>> fmt(999_960)
+        '1.0 million'
+        >>> IntwordFormatter("%.3f")(999_960)
+        '999.960 thousand'
+        >>> fmt.parts(12_400)
+        Parts(value=12.4, mantissa='12.4', unit='thousand', index=0)
+
+        ```
+    Args:
+        format (str): To change the number of decimal or general format of the number
+            portion.
+    """
+
+    def __init__(self, format="%.1f"):
+        """Find the first integer of every word, with the rollovers of `format`."""
+        self.format = format
+        self._template = format + " %s"
+        low, high = _rollover_range(format)
+
+        segments = []
+        for ordinal, power in enumerate(powers[:-1]):
+            end = powers[ordinal + 1]
+            rollover = _first_int(lambda v: v / power >= low, power, end)
+            back = _first_int(lambda v: v / power >= high, rollover, end)
+            segments += [(power, ordinal), (rollover, ordinal + 1), (back, ordinal)]
+        segments.append((powers[-1], None))
+
+        bounds, ordinals = [], []
+        uppers = [lower for lower, _ordinal in segments[1:]] + [None]
+        for (lower, ordinal), upper in zip(segments, uppers):
+            if lower == upper or (ordinals and ordinals[-1] == ordinal):
+                continue
+            bounds.append(lower)
+            ordinals.append(ordinal)
+        self._bounds = tuple(bounds)
+        self._ordinals = tuple(ordinals)
+
+    def __call__(self, value):
+        """Format an integer.
+
+        Args:
+            value (int, float, str): Integer to convert.
+
+        Returns:
+            str: Friendly text representation as a string, unless the value passed
+            could not be coaxed into an `int`.
+        """
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            return value
+        chop = self._chop(number)
+        if chop is None:
+            return _int_digits(number)
+        chopped, ordinal = chop
+        word = _intword_word(get_translation(), ordinal, math.ceil(chopped))
+        decimal = decimal_separator()
+        if decimal == ".":
+            return self._template % (chopped, word)
+        return (self.format % chopped).replace(".", decimal) + " " + word
+
+    def parts(self, value):
+        """Like calling the formatter, but return the number and the word separately.
+
+        Args:
+            value (int, float, str): Integer to convert.
+
+        Returns:
+            Parts: The scaled value, its formatted text, the word and the index of the
+            word in `human_powers`, or `None` if `value` could not be coaxed into an
+            `int`. Values out of the range of `powers` have no word.
+        """
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            return None
+        chop = self._chop(value)
+        if chop is None:
+            return Parts(value, _int_digits(value), "", None)
+        chopped, ordinal = chop
+        word = _intword_word(get_translation(), ordinal, math.ceil(chopped))
+        mantissa = (self.format % chopped).replace(".", decimal_separator())
+        return Parts(chopped, mantissa, word, ordinal)
+
+    def into(self, buffer, value, offset=None):
+        """Write the formatted integer into a buffer as UTF-8 bytes.
+
+        Args:
+            buffer (bytearray, memoryview): Destination.
+            value (int, float, str): Integer to convert.
+            offset (int): Position to write at. If `None`, the output is appended to
+                the `bytearray`. Required for a `memoryview`.
+
+        Returns:
+            int: Number of bytes written.
+
+        Raises:
+            TypeError: If `value` cannot be coaxed into an `int`. Nothing is written.
+        """
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            raise TypeError(f"cannot format {value!r} as an integer") from None
+        chop = self._chop(number)
+        if chop is None:
+            return _write_into(buffer, _int_digits(number).encode(), offset)
+        chopped, ordinal = chop
+        word = _intword_word(get_translation(), ordinal, math.ceil(chopped))
+        decimal = decimal_separator()
+        if decimal == ".":
+            data = _encoded_template(self.format, word) % chopped
+        else:
+            mantissa = (self.format % chopped).replace(".", decimal)
+            data = (mantissa + " " + word).encode()
+        return _write_into(buffer, data, offset)
+
+    def _chop(self, value):
+        """Return the scaled value and the index of its power for an `int`.
+
+        Return `None` if `value` is out of the range of `powers`.
+        """
+        row = bisect_right(self._bounds, value) - 1
+        if row < 0:
+            return None
+        ordinal = self._ordinals[row]
+        if ordinal is None:
+            return None
+        # Exact int / int division, correctly rounded
+        return value / powers[ordinal], ordinal
+
+
+def _first_int(predicate, low, high):
+    """Return the smallest int in `[low, high)` satisfying a monotonic `predicate`.
+
+    Return `high` if there is none.
+    """
+    while low < high:
+        middle = (low + high) // 2
+        if predicate(middle):
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+@lru_cache()
+def _intword_formatter(format):
+    return IntwordFormatter(format)
+
+
+@lru_cache(maxsize=4096)
+def _intword_word(translation, ordinal, count):
+    """Return the word of `human_powers[ordinal]` for `count` in a translation."""
+    singular, plural = human_powers[ordinal]
+    return translation.ngettext(singular, plural, count)
+
+
+@lru_cache()
+def _encoded_template(format, word):
+    return (format + " " + word).encode()
+
+
+def _write_into(buffer, data, offset):
+    """Write `data` into `buffer` and return the number of bytes written.
+
+    If `offset` is `None`, `data` is appended to the `bytearray`; otherwise it
+    overwrites the bytes starting at `offset`.
+    """
+    if offset is None:
+        try:
+            buffer.extend(data)
+        except AttributeError:
+            raise TypeError("an offset is required to write into a memoryview")
+        return len(data)
+    end = offset + len(data)
+    if end > len(buffer):
+        raise ValueError(f"buffer too small: need {end} bytes, have {len(buffer)}")
+    buffer[offset:end] = data
+    return len(data)
+
+
+def _write_many_into(buffer, values, sep, offset, write_one):
+    written = 0
+    for i, value in enumerate(values):
+        if i:
+            written += _write_into(
+                buffer, sep, None if offset is None else offset + written
+            )
+        written += write_one(value, None if offset is None else offset + written)
+    return written
+
+
+def intword_into(buffer, value, format="%.1f", offset=None):
+    """Write `intword(value, format)` into a buffer as UTF-8 bytes.
+
+    The output is produced directly as `bytes`, without an intermediate `str`.
+
+    Examples:
+        ```pycon
+        >>> buf = bytearray(b"total: ")
+        >>> intword_into(buf, 1_200_000_000)
+        11
+        >>> buf
+        bytearray(b'total: 1.2 billion')
+
+        ```
+    Args:
+        buffer (bytearray, memoryview): Destination.
+        value (int, float, str): Integer to convert.
+        format (str): To change the number of decimal or general format of the number
+            portion.
+        offset (int): Position to write at. If `None`, the output is appended to the
+            `bytearray`. Required for a `memoryview`.
+
+    Returns:
+        int: Number of bytes written.
+
+    Raises:
+        TypeError: If `value` cannot be coaxed into an `int`. Nothing is written.
+    """
+    return _intword_formatter(format).into(buffer, value, offset)
+
+
+def intword_many_into(buffer, values, sep=b"\n", format="%.1f", offset=None):
+    """Write `intword` of every value into a buffer, separated by `sep`.
+
+    Examples:
+        ```pycon
+        >>> buf = bytearray()
+        >>> intword_many_into(buf, [100, 12_400, 1_000_000], sep=b",")
+        29
+        >>> buf
+        bytearray(b'100,12.4 thousand,1.0 million')
+
+        ```
+    Args:
+        buffer (bytearray, memoryview): Destination.
+        values (iterable): Integers to convert.
+        sep (bytes): Separator written between values.
+        format (str): To change the number of decimal or general format of the number
+            portion.
+        offset (int): Position to write at. If `None`, the output is appended to the
+            `bytearray`. Required for a `memoryview`.
+
+    Returns:
+        int: Number of bytes written.
+    """
+    return _write_many_into(
+        buffer,
+        values,
+        sep,
+        offset,
+        lambda value, at: intword_into(buffer, value, format, at),
+    )
+
+
+def _scaled_int(match, multiplier):
+    """Return the number captured by `_NUMBER_PATTERN` times `multiplier`.
+
+    Only integer arithmetic is used, so the result is exact before rounding to the
+    nearest integer.
+    """
+    whole = match.group("whole")
+    frac = match.group("frac") or ""
+    if not whole and not frac:
+        raise ValueError(f"could not parse number from {match.string!r}")
+    scale = 10 ** len(frac)
+    value = (2 * int(whole + frac or "0") * multiplier + scale) // (2 * scale)
+    return -value if match.group("sign") == "-" else value
+
+
+@lru_cache()
+def _intword_matcher(translation, decimal):
+    multipliers = {}
+    for power, (singular, plural) in zip(powers, human_powers):
+        for n in (1, 2, 3, 5, 11, 21, 100):
+            multipliers[translation.ngettext(singular, plural, n)] = power
+    words = "|".join(map(re.escape, multipliers))
+    number = _number_pattern(decimal)
+    pattern = re.compile(rf"\s*{number}\s*(?P<word>{words})?\s*")
+    return pattern, multipliers
+
+
+def parse_intword(value):
+    """Parse the output of `intword` back into an integer.
+
+    The words and the decimal separator are the ones used by `intword` in the active
+    locale.
+
+    Examples:
+        ```pycon
+        >>> parse_intword("1.2 billion")
+        1200000000
+        >>> parse_intword("12.4 thousand")
+        12400
+        >>> parse_intword("100")
+        100
+        >>> parse_intword("1.0 googol") == 10**100
+        True
+
+        ```
+    Args:
+        value (str): Text to parse, e.g. "1.2 billion".
+
+    Returns:
+        int: The number, rounded to the nearest integer.
+
+    Raises:
+        ValueError: If `value` is not a number optionally followed by an `intword`
+            word.
+    """
+    return next(parse_intword_many([value]))
 
-    if value < powers[0]:
-        return str(value)
-    for ordinal, power in enumerate(powers[1:], 1):
-        if value < power:
-            chopped = value / float(powers[ordinal - 1])
-            if float(format % chopped) == float(10**3):
-                chopped = value / float(powers[ordinal])
-                singular, plural = human_powers[ordinal]
-                return (
-                    " ".join([format, _ngettext(singular, plural, math.ceil(chopped))])
-                ) % chopped
-            else:
-                singular, plural = human_powers[ordinal - 1]
-                return (
-                    " ".join([format, _ngettext(singular, plural, math.ceil(chopped))])
-                ) % chopped
-    return str(value)
+
+def parse_intword_many(values):
+    """Parse an iterable of `intword` strings.
+
+    The matcher is built once and the values are parsed lazily, so this is suitable
+    for streaming large inputs.
+
+    Examples:
+        ```pycon
+        >>> list(parse_intword_many(["1.0 million", "3.5 sextillion", "999"]))
+        [1000000, 3500000000000000000000, 999]
+
+        ```
+    Args:
+        values (iterable of str): Texts to parse.
+
+    Yields:
+        int: The parsed numbers, in order.
+
+    Raises:
+        ValueError: If a value cannot be parsed.
+    """
+    pattern, multipliers = _intword_matcher(get_translation(), decimal_separator())
+    fullmatch = pattern.fullmatch
+    for value in values:
+        match = fullmatch(value)
+        if match is None:
+            raise ValueError(f"could not parse intword string {value!r}")
+        word = match.group("word")
+        yield _scaled_int(match, multipliers[word] if word else 1)
 
 
 def apnumber(value):
@@ -243,6 +972,15 @@ def apnumber(value):
         return value
     if not 0 <= value < 10:
         return str(value)
+    return _apnumbers(get_translation())[value]
+
+
+@lru_cache()
+def _apnumbers(translation):
+    """Return the words of `apnumber` for the active translation.
+
+    `translation` is the cache key: tables are built once per locale on first use.
+    """
     return (
         _("zero"),
         _("one"),
@@ -254,10 +992,10 @@ def apnumber(value):
         _("seven"),
         _("eight"),
         _("nine"),
-    )[value]
+    )
 
 
-def fractional(value):
+def fractional(value, max_denominator=1000):
     """Convert to fractional number.
 
     There will be some cases where one might not want to show ugly decimal places for
@@ -282,6 +1020,8 @@ def fractional(value):
         '1/3'
         >>> fractional(1)
         '1'
+        >>> fractional(3.14159, 10)
+        '3 1/7'
         >>> fractional("ten")
         'ten'
         >>> fractional(None) is None
@@ -290,18 +1030,52 @@ def fractional(value):
         ```
     Args:
         value (int, float, str): Integer to convert.
+        max_denominator (int): Largest denominator of the fractional part.
 
     Returns:
         str: Fractional number as a string.
     """
+    if max_denominator < 1:
+        raise ValueError("max_denominator should be at least 1")
     try:
         number = float(value)
     except (TypeError, ValueError):
         return value
+    return _fractional(number, max_denominator)
+
+
+def fractional_many(values, max_denominator=1000):
+    """Apply `fractional` to an iterable of values.
+
+    The values are converted lazily, so this is suitable for streaming large inputs.
+
+    Examples:
+        ```pycon
+        >>> list(fractional_many([0.3, 1.3, 2, "ten"]))
+        ['3/10', '1 3/10', '2', 'ten']
+
+        ```
+    Args:
+        values (iterable): Numbers to convert.
+        max_denominator (int): Largest denominator of the fractional part.
+
+    Yields:
+        str: Fractional numbers as strings, in order.
+    """
+    if max_denominator < 1:
+        raise ValueError("max_denominator should be at least 1")
+    for value in values:
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            yield value
+        else:
+            yield _fractional(number, max_denominator)
+
+
+def _fractional(number, max_denominator):
     whole_number = int(number)
-    frac = Fraction(number - whole_number).limit_denominator(1000)
-    numerator = frac._numerator
-    denominator = frac._denominator
+    numerator, denominator = _closest_fraction(number - whole_number, max_denominator)
     if whole_number and not numerator and denominator == 1:
         # this means that an integer was passed in
         # (or variants of that integer like 1.0000)
@@ -312,6 +1086,40 @@ def fractional(value):
         return f"{whole_number:.0f} {numerator:.0f}/{denominator:.0f}"
 
 
+def _closest_fraction(value, max_denominator):
+    """Return `Fraction(value).limit_denominator(...)` as (numerator, denominator).
+
+    `value` is a float in the open interval (-1, 1). Its exact ratio is descended
+    along its continued fraction, as in the Stern-Brocot tree, until the next
+    convergent has a denominator above `max_denominator`. The closest fraction is
+    then the last convergent or the largest semiconvergent below the bound, so this
+    takes O(log max_denominator) steps.
+    """
+    if value < 0:
+        numerator, denominator = _closest_fraction(-value, max_denominator)
+        return -numerator, denominator
+
+    p, q = value.as_integer_ratio()
+    if q <= max_denominator:
+        return p, q
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    n, d = p, q
+    while True:
+        a = n // d
+        q2 = q0 + a * q1
+        if q2 > max_denominator:
+            break
+        p0, q0, p1, q1 = p1, q1, p0 + a * p1, q2
+        n, d = d, n - a * d
+    k = (max_denominator - q0) // q1
+    p2, q2 = p0 + k * p1, q0 + k * q1
+    # Compare the distances to value exactly; a tie goes to the convergent, like
+    # Fraction does
+    if abs(p1 * q - p * q1) * q2 <= abs(p2 * q - p * q2) * q1:
+        return p1, q1
+    return p2, q2
+
+
 def scientific(value, precision=2):
     """Return number in string scientific notation z.wq x 10ⁿ.
 
@@ -337,26 +1145,17 @@ def scientific(value, precision=2):
         ```
 
     Args:
-        value (int, float, str): Input number.
+        value (int, float, str, Decimal): Input number.
         precision (int): Number of decimal for first part of the number.
 
     Returns:
         str: Number in scientific notation z.wq x 10ⁿ.
     """
-    exponents = {
-        "0": "⁰",
-        "1": "¹",
-        "2": "²",
-        "3": "³",
-        "4": "⁴",
-        "5": "⁵",
-        "6": "⁶",
-        "7": "⁷",
-        "8": "⁸",
-        "9": "⁹",
-        "+": "⁺",
-        "-": "⁻",
-    }
+    if type(precision) is int and precision >= 0:
+        magnitude = _scientific_magnitude(value)
+        if magnitude is not None:
+            return _scientific(*magnitude, precision)
+
     negative = False
     try:
         if "-" in str(value):
@@ -366,29 +1165,215 @@ def scientific(value, precision=2):
         if isinstance(value, str):
             value = float(value)
 
-        fmt = "{:.%se}" % str(int(precision))
-        n = fmt.format(value)
+        n = _scientific_format(int(precision)).format(value)
 
     except (ValueError, TypeError):
         return value
 
     part1, part2 = n.split("e")
-    if "-0" in part2:
-        part2 = part2.replace("-0", "-")
+    part2 = part2.replace("-0", "-").replace("+0", "")
+    if negative:
+        part2 = "-" + part2
+    part1 = part1.replace(".", decimal_separator())
+    return part1 + " x 10" + part2.translate(_SUPERSCRIPTS)
 
-    if "+0" in part2:
-        part2 = part2.replace("+0", "")
 
-    new_part2 = []
+def scientific_many(values, precision=2, engineering=False):
+    """Apply `scientific` or `engineering` to an iterable of values.
+
+    The values are converted lazily, so this is suitable for streaming large inputs.
+
+    Examples:
+        ```pycon
+        >>> list(scientific_many([0.3, 500, "99"]))
+        ['3.00 x 10⁻¹', '5.00 x 10²', '9.90 x 10¹']
+        >>> list(scientific_many([0.3, 12_345], 1, engineering=True))
+        ['300.0 x 10⁻³', '12.3 x 10³']
+
+        ```
+    Args:
+        values (iterable): Input numbers.
+        precision (int): Number of decimal for first part of the numbers.
+        engineering (bool): If `True`, use engineering notation.
+
+    Yields:
+        str: Numbers in scientific or engineering notation, in order.
+    """
+    convert = _engineering if engineering else scientific
+    for value in values:
+        yield convert(value, precision)
+
+
+def engineering(value, precision=2):
+    """Return number in engineering notation, where the exponent is a multiple of 3.
+
+    Unlike `scientific`, the sign of a negative number is kept on the first part.
+
+    Examples:
+        ```pycon
+        >>> engineering(12_345_678)
+        '12.35 x 10⁶'
+        >>> engineering(0.00042)
+        '420.00 x 10⁻⁶'
+        >>> engineering(-1_500_000, 1)
+        '-1.5 x 10⁶'
+        >>> engineering(999.999)
+        '1.00 x 10³'
+        >>> engineering("foo")
+        'foo'
+
+        ```
+    Args:
+        value (int, float, str): Input number.
+        precision (int): Number of decimal for first part of the number.
+
+    Returns:
+        str: Number in engineering notation z.wq x 10ⁿ.
+    """
+    return _engineering(value, precision)
+
+
+def _engineering(value, precision):
+    try:
+        precision = int(precision)
+        # Ints are kept exact
+        number = value if type(value) is int else float(value)
+    except (TypeError, ValueError):
+        return value
+    if precision < 0:
+        return value
+    if type(number) is float and not math.isfinite(number):
+        return str(number)
+
+    digits, exponent = _scientific_digits(abs(number), precision, 3)
+    template, scale = _notation_template(
+        precision, str(exponent).translate(_SUPERSCRIPTS), decimal_separator()
+    )
+    text = template % divmod(digits, scale)
+    if number < 0:
+        return "-" + text
+    return text
+
+
+_SUPERSCRIPTS = str.maketrans("0123456789+-", "⁰¹²³⁴⁵⁶⁷⁸⁹⁺⁻")
+
+
+@lru_cache()
+def _scientific_format(precision):
+    return "{:.%de}" % precision
+
+
+def _notation_template(precision, exponent, decimal="."):
+    """Return the template of `divmod(digits, scale)` with `exponent`, and the scale."""
+    if precision:
+        return "%%d%s%%0%dd x 10%s" % (decimal, precision, exponent), 10**precision
+    # "%.0s" swallows the always zero decimals
+    return "%%d%%.0s x 10%s" % exponent, 1
+
+
+def _scientific_magnitude(value):
+    """Return the magnitude that `scientific` formats and whether it is negative.
+
+    For compatibility, `scientific` drops every "-" from the text of the value and
+    prefixes the exponent with a minus sign instead. For floats written with a
+    negative exponent, such as `1e-05`, this also flips the sign of the exponent.
+
+    Return `None` if `value` needs the generic path.
+    """
+    kind = type(value)
+    if kind is int:
+        try:
+            return float(abs(value)), value < 0
+        except OverflowError:
+            return abs(value), value < 0
+    if kind is str:
+        stripped = value.replace("-", "")
+        try:
+            number = float(stripped)
+        except ValueError:
+            return None
+        if not math.isfinite(number):
+            return None
+        return number, stripped != value
+    if kind is Decimal:
+        # Kept exact, so the exponent is that of the decimal value
+        return (abs(value), value.is_signed()) if value.is_finite() else None
+    if kind is not float or not math.isfinite(value):
+        return None
+    negative = math.copysign(1, value) < 0
+    magnitude = abs(value)
+    if 0 < magnitude < 1e-4:
+        # repr() uses an exponent here
+        magnitude = float(repr(magnitude).replace("e-", "e"))
+        return (magnitude, True) if math.isfinite(magnitude) else None
+    return magnitude, negative
+
+
+def _scientific(magnitude, negative, precision):
+    digits, exponent = _scientific_digits(magnitude, precision, 1)
+    template, scale = _scientific_template(
+        precision, exponent, negative, decimal_separator()
+    )
+    return template % divmod(digits, scale)
+
+
+@lru_cache(maxsize=1024)
+def _scientific_template(precision, exponent, negative, decimal):
+    if exponent < 10:
+        text = str(exponent)
+    else:
+        # The "+" of two digit exponents was always kept
+        text = "+" + str(exponent)
     if negative:
-        new_part2.append(exponents["-"])
+        text = "-" + text
+    return _notation_template(precision, text.translate(_SUPERSCRIPTS), decimal)
 
-    for char in part2:
-        new_part2.append(exponents[char])
 
-    final_str = part1 + " x 10" + "".join(new_part2)
+def _scientific_digits(magnitude, precision, step):
+    """Return `magnitude` as a rounded integer of significant digits and an exponent.
 
-    return final_str
+    `magnitude` is about `digits * 10**(exponent - precision)`, with `exponent` a
+    multiple of `step` and `digits` correctly rounded (half to even) like `"%e"`.
+    The exponent is estimated with `math.log10` and corrected with exact integer
+    arithmetic.
+    """
+    if not magnitude:
+        return 0, 0
+    if type(magnitude) is int:
+        numerator, denominator = magnitude, 1
+    else:
+        numerator, denominator = magnitude.as_integer_ratio()
+
+    if type(magnitude) is Decimal:
+        # Decimals can be out of the range of floats
+        exponent = magnitude.adjusted()
+    else:
+        exponent = math.floor(math.log10(magnitude))
+    exponent -= exponent % step
+    low = 10**precision
+    while True:
+        shift = precision - exponent
+        if shift >= 0:
+            divisor = denominator
+            digits, remainder = divmod(numerator * 10**shift, divisor)
+        else:
+            divisor = denominator * 10**-shift
+            digits, remainder = divmod(numerator, divisor)
+        # The estimate can be off by one near powers of ten
+        if digits < low:
+            exponent -= step
+        elif digits >= low * 10**step:
+            exponent += step
+        else:
+            break
+
+    remainder *= 2
+    if remainder > divisor or (remainder == divisor and digits & 1):
+        digits += 1
+        if digits == low * 10**step:
+            # Rounded up to the next power
+            return low, exponent + step
+    return digits, exponent
 
 
 def clamp(value, format="{:}", floor=None, ceil=None, floor_token="<", ceil_token=">"):
@@ -452,3 +1437,343 @@ def clamp(value, format="{:}", floor=None, ceil=None, floor_token="<", ceil_toke
             "Invalid format. Must be either a valid formatting string, or a function "
             "that accepts value and returns a string."
         )
+
+
+prefixes = {
+    "si": (
+        10,
+        (
+            (-24, "y"),
+            (-21, "z"),
+            (-18, "a"),
+            (-15, "f"),
+            (-12, "p"),
+            (-9, "n"),
+            (-6, "µ"),
+            (-3, "m"),
+            (0, ""),
+            (3, "k"),
+            (6, "M"),
+            (9, "G"),
+            (12, "T"),
+            (15, "P"),
+            (18, "E"),
+            (21, "Z"),
+            (24, "Y"),
+        ),
+    ),
+    "iec": (
+        2,
+        (
+            (0, ""),
+            (10, "Ki"),
+            (20, "Mi"),
+            (30, "Gi"),
+            (40, "Ti"),
+            (50, "Pi"),
+            (60, "Ei"),
+            (70, "Zi"),
+            (80, "Yi"),
+        ),
+    ),
+}
+
+
+class QuantityFormatter:
+    """Reusable, table-driven formatter for quantities with prefixed units.
+
+    For every prefix, the lower bound of its range, the factors to scale a value to it
+    and the output template are computed once. Formatting a value is then a single
+    bisect over the lower bounds plus one string format.
+
+    Values beyond the largest prefix keep using it; non-zero values below the smallest
+    prefix use the smallest one.
+
+    Examples:
+        ```pycon
+        >>> hz = QuantityFormatter("Hz")
+        >>> hz(1500)
+        '1.5 kHz'
+        >>> QuantityFormatter("s")(0.00042)
+        '420.0 µs'
+        >>> QuantityFormatter("B", system="iec")(2048)
+        '2.0 KiB'
+
+        ```
+    Args:
+        unit (str): Symbol of the unit, e.g. "Hz" or "W".
+        system (str): Prefix system, "si" (powers of 10<sup>3</sup>, including
+            sub-units) or "iec" (powers of 2<sup>10</sup>).
+        format (str): Custom formatter.
+        separator (str): Text between the number and the prefixed unit.
+    """
+
+    def __init__(self, unit="", system="si", format="%.1f", separator=" "):
+        """Build the rows of every prefix of `system` for `unit`."""
+        base, table = prefixes[system]
+        self.unit = unit
+        self.system = system
+        self.format = format
+
+        rows = []
+        for exponent, prefix in table:
+            if exponent >= 0:
+                lower, scale = base**exponent, (1, base**exponent)
+            else:
+                lower, scale = Fraction(1, base**-exponent), (base**-exponent, 1)
+            rows.append((lower, scale, format, prefix + unit, exponent))
+        self._set_table(rows, separator)
+        self._zero = [exponent for exponent, _ in table].index(0)
+
+    def _set_table(self, rows, separator):
+        """Compile the rows of `(lower, (multiplier, divisor), format, unit, index)`.
+
+        A value `x` in `[lower, next lower)` is rendered as `x * multiplier / divisor`
+        with `format`, followed by `separator` and `unit`. Rows with a `lower` of
+        `None` must come last; they are only used by subclasses overriding `_resolve`.
+        """
+        self._lower = tuple(
+            lower if isinstance(lower, int) else _float_ceil(lower)
+            for lower, *_ in rows
+            if lower is not None
+        )
+        self._scales = tuple(scale for _, scale, *_ in rows)
+        self._formats = tuple(fmt for _, _, fmt, *_ in rows)
+        self._units = tuple(unit for *_, unit, _ in rows)
+        self._indices = tuple(index for *_, index in rows)
+        self._templates = tuple(
+            fmt + separator + unit for fmt, unit in zip(self._formats, self._units)
+        )
+        self._encoded_templates = tuple(t.encode() for t in self._templates)
+        self._separator = separator
+        self._zero = 0
+        self._width = None
+
+    @property
+    def width(self):
+        """int: Width of the longest output of `fixed`.
+
+        It is computed once, from the templates, for the widest negative value of every
+        prefix and for the markers of values beyond the largest prefix.
+        """
+        if self._width is None:
+            lower = self._lower
+            last = len(lower) - 1
+            # The largest prefix holds values up to one step of the base
+            limit = lower[last] * lower[last] // lower[last - 1]
+            multiplier, divisor = self._scales[last]
+            limit = limit * multiplier // divisor - 1
+            unit = self._separator + self._units[last]
+            self._overflow = (f">{limit}{unit}", f"<-{limit}{unit}")
+            widths = [len(marker) for marker in self._overflow]
+            for row, template in enumerate(self._templates):
+                if row + 1 < len(lower):
+                    upper = lower[row + 1]
+                elif row < len(lower):
+                    # The last prefix is unbounded, count one step of the base
+                    upper = lower[row] * lower[row] / lower[row - 1]
+                else:
+                    widths.append(len(template % -1))
+                    continue
+                # The widest value of the row is the one just below the next prefix
+                upper = _from_bits(_float_bits(float(upper)) - 1)
+                multiplier, divisor = self._scales[row]
+                widths.append(len(template % (-upper * multiplier / divisor)))
+            self._width = max(widths)
+        return self._width
+
+    def fixed(self, value):
+        """Format a quantity, right-aligned to exactly `width` characters.
+
+        Outputs of the same formatter can then be redrawn in place. Values beyond the
+        largest prefix that do not fit are replaced by a marker of the largest value
+        that does, e.g. ">999 YHz".
+
+        Examples:
+            ```pycon
+            >>> fmt = QuantityFormatter("Hz")
+            >>> fmt.width
+            11
+            >>> fmt.fixed(1500)
+            '    1.5 kHz'
+            >>> fmt.fixed(1e40)
+            '   >999 YHz'
+
+            ```
+        Args:
+            value (int, float, str): Number to convert.
+
+        Returns:
+            str: Human readable representation of the quantity, padded with spaces.
+        """
+        text = self(value)
+        width = self.width
+        if len(text) > width:
+            text = self._overflow[text.startswith("-")]
+        return text.rjust(width)
+
+    def _row(self, magnitude):
+        """Return the row of the prefix for a non-negative `magnitude`."""
+        i = bisect_right(self._lower, magnitude) - 1
+        if i < 0:
+            i = self._zero if magnitude == 0 else 0
+        return i
+
+    def _resolve(self, value):
+        """Return the value scaled to its unit and the row of the unit."""
+        value = float(value)
+        i = self._row(abs(value))
+        multiplier, divisor = self._scales[i]
+        return value * multiplier / divisor, i
+
+    def _row_template(self, row, scaled):
+        """Return the template index used for `scaled` in `row`."""
+        return row
+
+    def _render(self, i, scaled, decimal):
+        """Return `scaled` formatted with template `i` and the `decimal` separator."""
+        if decimal == ".":
+            return self._templates[i] % scaled
+        mantissa = (self._formats[i] % scaled).replace(".", decimal)
+        return mantissa + self._separator + self._units[i]
+
+    def column(self, values, policy="max"):
+        """Format a sequence of quantities, all with the same prefix.
+
+        The prefix is chosen once for the whole sequence, so the output aligns and
+        compares visually, and every value is scaled with the same factors.
+
+        Examples:
+            ```pycon
+            >>> QuantityFormatter("Hz").column([1500, 400_000, 2_000_000])
+            ['0.0 MHz', '0.4 MHz', '2.0 MHz']
+            >>> QuantityFormatter("Hz").column([1500, 400_000, 2_000_000], "median")
+            ['1.5 kHz', '400.0 kHz', '2000.0 kHz']
+
+            ```
+        Args:
+            values (iterable): Numbers to convert.
+            policy (str or callable): How to pick the prefix: "max" uses the prefix of
+                the largest magnitude, "median" the prefix of the median magnitude.
+                A callable receives the list of magnitudes and returns the value whose
+                prefix is used.
+
+        Returns:
+            list: Human readable representations of the quantities.
+        """
+        values = [float(value) for value in values]
+        if not values:
+            return []
+        magnitudes = [abs(value) for value in values]
+        if policy == "max":
+            representative = max(magnitudes)
+        elif policy == "median":
+            representative = statistics.median_low(magnitudes)
+        elif callable(policy):
+            representative = policy(magnitudes)
+        else:
+            raise ValueError(
+                "Invalid policy. Must be either 'max', 'median', or a function "
+                "that accepts the magnitudes and returns one value."
+            )
+        row = self._row(representative)
+        multiplier, divisor = self._scales[row]
+        decimal = decimal_separator()
+        out = []
+        for value in values:
+            scaled = value * multiplier / divisor
+            out.append(self._render(self._row_template(row, scaled), scaled, decimal))
+        return out
+
+    def __call__(self, value):
+        """Format a quantity.
+
+        Args:
+            value (int, float, str): Number to convert.
+
+        Returns:
+            str: Human readable representation of the quantity.
+        """
+        scaled, i = self._resolve(value)
+        return self._render(i, scaled, decimal_separator())
+
+    def parts(self, value):
+        """Format a quantity, keeping the number and the unit apart.
+
+        Args:
+            value (int, float, str): Number to convert.
+
+        Returns:
+            Parts: The scaled value, its formatted text, the prefixed unit and the
+            exponent of the prefix.
+        """
+        scaled, i = self._resolve(value)
+        mantissa = (self._formats[i] % scaled).replace(".", decimal_separator())
+        return Parts(scaled, mantissa, self._units[i], self._indices[i])
+
+    def into(self, buffer, value, offset=None):
+        """Write a formatted quantity into a buffer as UTF-8 bytes.
+
+        Args:
+            buffer (bytearray, memoryview): Destination.
+            value (int, float, str): Number to convert.
+            offset (int): Position to write at. If `None`, the output is appended to
+                the `bytearray`. Required for a `memoryview`.
+
+        Returns:
+            int: Number of bytes written.
+        """
+        scaled, i = self._resolve(value)
+        decimal = decimal_separator()
+        if decimal == ".":
+            data = self._encoded_templates[i] % scaled
+        else:
+            data = self._render(i, scaled, decimal).encode()
+        return _write_into(buffer, data, offset)
+
+
+def _float_ceil(value):
+    """Return the smallest float that is greater than or equal to `value`.
+
+    Comparing a float against it is exact, even if `value` is not representable.
+    """
+    f = float(value)
+    if f < value:
+        # Positive floats are ordered like their bit patterns
+        f = _from_bits(_float_bits(f) + 1)
+    return f
+
+
+@lru_cache()
+def _quantity_formatter(unit, system, format):
+    return QuantityFormatter(unit, system, format)
+
+
+def naturalquantity(value, unit="", system="si", format="%.1f"):
+    """Format a quantity with the best-fitting prefix (e.g. 1.5 kHz, 420.0 µs).
+
+    Examples:
+        ```pycon
+        >>> naturalquantity(1500, "Hz")
+        '1.5 kHz'
+        >>> naturalquantity(2_400_000, "req/s")
+        '2.4 Mreq/s'
+        >>> naturalquantity(0.00042, "s")
+        '420.0 µs'
+        >>> naturalquantity(5, "W")
+        '5.0 W'
+        >>> naturalquantity(3000, "B", system="iec")
+        '2.9 KiB'
+
+        ```
+    Args:
+        value (int, float, str): Number to convert.
+        unit (str): Symbol of the unit, e.g. "Hz" or "W".
+        system (str): Prefix system, "si" (powers of 10<sup>3</sup>, including
+            sub-units) or "iec" (powers of 2<sup>10</sup>).
+        format (str): Custom formatter.
+
+    Returns:
+        str: Human readable representation of the quantity.
+    """
+    return _quantity_formatter(unit, system, format)(value)
@@ -0,0 +1,511 @@
+#!/usr/bin/env python
+
+"""Vectorized humanizing functions for NumPy arrays.
+
+This module is optional and requires NumPy. The magnitude buckets, scaled mantissas
+and unit indices are computed with array operations; only the final string assembly
+happens per element. Every function returns an object array of strings with the same
+shape as its input, matching the output of the scalar function element for element.
+
+Inputs are read with `numpy.asarray`, so NumPy arrays, buffer-protocol objects such as
+`array.array` or `memoryview`, and objects implementing `__array__` are used without
+copying. Inputs that are not integer or floating point arrays (strings, Python objects)
+fall back to the scalar functions.
+"""
+
+import itertools
+
+import numpy as np
+
+from . import filesize, number, time
+from .i18n import decimal_separator, get_translation, number_format
+
+__all__ = [
+    "intcomma",
+    "intword",
+    "naturaldelta",
+    "naturalquantity",
+    "naturalsize",
+    "precisedelta",
+    "scientific",
+]
+
+
+def _is_numeric(arr):
+    return arr.dtype.kind in "iuf"
+
+
+def _fallback(func, arr, *args):
+    out = np.empty(arr.shape, dtype=object)
+    out.flat[:] = [func(v, *args) for v in arr.ravel().tolist()]
+    return out
+
+
+def _assemble(shape, strings):
+    out = np.empty(shape, dtype=object)
+    out.flat[:] = strings
+    return out
+
+
+def naturalsize(values, binary=False, gnu=False, format="%.1f"):
+    """Vectorized version of `humanize.naturalsize`.
+
+    Examples:
+        ```pycon
+        >>> import numpy as np
+        >>> from humanize import numpy as hnp
+        >>> hnp.naturalsize(np.array([1, 300, 3000, 3000000])).tolist()
+        ['1 Byte', '300 Bytes', '3.0 kB', '3.0 MB']
+        >>> hnp.naturalsize(np.array([300, 3000]), gnu=True).tolist()
+        ['300B', '2.9K']
+
+        ```
+    Args:
+        values (array_like): Numbers of bytes.
+        binary (bool): If `True`, uses binary suffixes (KiB, MiB).
+        gnu (bool): If `True`, GNU-style (`ls -sh` style) prefixes are used.
+        format (str): Custom formatter.
+
+    Returns:
+        numpy.ndarray: Object array of human readable filesizes.
+    """
+    arr = np.asarray(values)
+    if not _is_numeric(arr):
+        return _fallback(filesize.naturalsize, arr, binary, gnu, format)
+
+    return _quantity(filesize._size_formatter(binary, gnu, format), arr)
+
+
+def naturalquantity(values, unit="", system="si", format="%.1f"):
+    """Vectorized version of `humanize.naturalquantity`.
+
+    Examples:
+        ```pycon
+        >>> import numpy as np
+        >>> from humanize import numpy as hnp
+        >>> hnp.naturalquantity(np.array([0, 0.00042, 1500]), "Hz").tolist()
+        ['0.0 Hz', '420.0 µHz', '1.5 kHz']
+
+        ```
+    Args:
+        values (array_like): Numbers to convert.
+        unit (str): Symbol of the unit, e.g. "Hz" or "W".
+        system (str): Prefix system, "si" or "iec".
+        format (str): Custom formatter.
+
+    Returns:
+        numpy.ndarray: Object array of human readable quantities.
+    """
+    arr = np.asarray(values)
+    if not _is_numeric(arr):
+        return _fallback(number.naturalquantity, arr, unit, system, format)
+    return _quantity(number._quantity_formatter(unit, system, format), arr)
+
+
+def _quantity(fmt, arr):
+    """Vectorized `QuantityFormatter.__call__`."""
+    data = arr.astype(np.float64, copy=False).ravel()
+    absolute = np.abs(data)
+
+    lower = np.array([number._float_ceil(x) for x in fmt._lower])
+    row = np.searchsorted(lower, absolute, side="right") - 1
+    row = np.where(row < 0, np.where(data == 0, fmt._zero, 0), row)
+    multipliers = np.array([float(m) for m, _ in fmt._scales])
+    divisors = np.array([float(d) for _, d in fmt._scales])
+    # Like the scalar version, the largest floats overflow to infinity
+    with np.errstate(over="ignore"):
+        mantissa = data * multipliers[row] / divisors[row]
+    if isinstance(fmt, filesize.SizeFormatter):
+        row = np.where((row == 0) & (np.abs(mantissa) == 1), fmt._singular, row)
+
+    decimal = decimal_separator()
+    render = fmt._render
+    return _assemble(
+        arr.shape,
+        [render(i, m, decimal) for i, m in zip(row.tolist(), mantissa.tolist())],
+    )
+
+
+# Largest magnitude below which every integer is exact as a float
+_EXACT_INT = 2**53
+
+
+def intword(values, format="%.1f"):
+    """Vectorized version of `humanize.intword`.
+
+    Examples:
+        ```pycon
+        >>> import numpy as np
+        >>> from humanize import numpy as hnp
+        >>> hnp.intword(np.array([100, 12400, 999_999_999, 1_200_000_000])).tolist()
+        ['100', '12.4 thousand', '1.0 billion', '1.2 billion']
+
+        ```
+    Args:
+        values (array_like): Integers to convert.
+        format (str): To change the number of decimal or general format of the number
+            portion.
+
+    Returns:
+        numpy.ndarray: Object array of friendly text representations.
+    """
+    arr = np.asarray(values)
+    if not _is_numeric(arr):
+        return _fallback(number.intword, arr, format)
+
+    flat = arr.ravel()
+    # The scalar version divides exact integers; so do floats below 2**53
+    with np.errstate(invalid="ignore"):
+        exact = (flat > -_EXACT_INT) & (flat < _EXACT_INT)
+    if not exact.all():
+        out = np.empty(flat.shape, dtype=object)
+        out[~exact] = _fallback(number.intword, flat[~exact], format)
+        out[exact] = intword(flat[exact], format)
+        return out.reshape(arr.shape)
+
+    if arr.dtype.kind == "f":
+        flat = np.trunc(flat)
+        # Exact comparison of a float against an int power of ten
+        thresholds = np.array([number._float_ceil(p) for p in number.powers])
+    else:
+        # No 64-bit integer reaches 10**21, so the first six powers are enough
+        flat = flat.astype(np.uint64 if arr.dtype.kind == "u" else np.int64)
+        thresholds = np.array(number.powers[:6], dtype=flat.dtype)
+    bucket = np.searchsorted(thresholds, flat, side="right")
+
+    divisors = np.array([float(p) for p in number.powers], dtype=np.float64)
+    as_float = flat.astype(np.float64)
+    lower = np.clip(bucket - 1, 0, len(divisors) - 1)
+    chopped = as_float / divisors[lower]
+    low, high = number._rollover_range(format)
+    rolled = (chopped >= low) & (chopped < high)
+    upper = np.clip(bucket, 0, len(divisors) - 1)
+    chopped = np.where(rolled, as_float / divisors[upper], chopped)
+    word = np.where(rolled, upper, lower)
+    plural_n = np.ceil(chopped)
+
+    template = format + " %s"
+    translation = get_translation()
+    decimal = decimal_separator()
+    strings = []
+    for b, w, c, n, v in zip(
+        bucket.tolist(),
+        word.tolist(),
+        chopped.tolist(),
+        plural_n.tolist(),
+        flat.tolist(),
+    ):
+        if b == 0 or b == len(number.powers):
+            strings.append(str(int(v)))
+        else:
+            word = number._intword_word(translation, w, int(n))
+            if decimal == ".":
+                strings.append(template % (c, word))
+            else:
+                strings.append((format % c).replace(".", decimal) + " " + word)
+    return _assemble(arr.shape, strings)
+
+
+def intcomma(values, ndigits=None):
+    """Vectorized version of `humanize.intcomma`.
+
+    Examples:
+        ```pycon
+        >>> import numpy as np
+        >>> from humanize import numpy as hnp
+        >>> hnp.intcomma(np.array([100, 1000, -1_000_000])).tolist()
+        ['100', '1,000', '-1,000,000']
+
+        ```
+    Args:
+        values (array_like): Integers or floats to convert.
+        ndigits (int, None): Digits of precision for rounding after the decimal point.
+
+    Returns:
+        numpy.ndarray: Object array of strings containing commas every three digits.
+    """
+    arr = np.asarray(values)
+    decimal, sep, grouping = number_format()
+    if arr.dtype.kind not in "iu" or grouping != (3, 3):
+        return _fallback(number.intcomma, arr, ndigits)
+
+    flat = arr.ravel()
+    if ndigits:
+        template = "{:,.%df}" % ndigits
+        strings = [template.format(v) for v in flat.tolist()]
+    else:
+        strings = [format(v, ",") for v in flat.tolist()]
+    if (decimal, sep) != (".", ","):
+        strings = [number._localize(s, decimal, sep) for s in strings]
+    return _assemble(arr.shape, strings)
+
+
+def scientific(values, precision=2):
+    """Vectorized version of `humanize.scientific`.
+
+    Examples:
+        ```pycon
+        >>> import numpy as np
+        >>> from humanize import numpy as hnp
+        >>> hnp.scientific(np.array([500, -1000, 0.3])).tolist()
+        ['5.00 x 10²', '1.00 x 10⁻³', '3.00 x 10⁻¹']
+
+        ```
+    Args:
+        values (array_like): Input numbers.
+        precision (int): Number of decimal for first part of the number.
+
+    Returns:
+        numpy.ndarray: Object array of numbers in scientific notation.
+    """
+    arr = np.asarray(values)
+    if not _is_numeric(arr) or type(precision) is not int:
+        return _fallback(number.scientific, arr, precision)
+    if not 0 <= precision <= _MAX_PRECISION:
+        return _fallback(number.scientific, arr, precision)
+
+    flat = arr.ravel()
+    data = flat.astype(np.float64)
+    magnitude = np.abs(data)
+    # The scalar version strips every "-" from the text of the value, which also
+    # flips the exponent of values printed as e.g. "1e-05"; leave those to it.
+    with np.errstate(invalid="ignore"):
+        simple = np.isfinite(data) & ((magnitude >= 1e-4) | (data == 0))
+    digits, exponent, exact = _scientific_digits(magnitude, precision, simple)
+
+    whole, fraction = np.divmod(digits, 10**precision)
+    template = number._scientific_template
+    decimal = decimal_separator()
+    strings = [
+        template(precision, e, n, decimal)[0] % (w, f)
+        for e, n, w, f in zip(
+            exponent.tolist(),
+            np.signbit(data).tolist(),
+            whole.tolist(),
+            fraction.tolist(),
+        )
+    ]
+    out = _assemble(flat.shape, strings)
+    inexact = ~exact
+    if inexact.any():
+        out[inexact] = _fallback(number.scientific, flat[inexact], precision)
+    return out.reshape(arr.shape)
+
+
+# Above this precision, float64 cannot tell the rounding of the digits apart
+_MAX_PRECISION = 12
+
+
+def _scientific_digits(magnitude, precision, valid):
+    """Vectorized `number._scientific_digits`, for a step of one.
+
+    Return the rounded digits and the exponents, and the mask of the magnitudes
+    in `valid` that are not too close to a rounding tie or to a power of ten to be
+    rounded from a float64 product; those are left to the exact scalar version.
+    """
+    low = 10.0**precision
+    zero = magnitude == 0
+    safe = np.where(valid & ~zero, magnitude, 1.0)
+    exponent = np.floor(np.log10(safe)).astype(np.int64)
+    scaled = safe * 10.0 ** (precision - exponent)
+    # The estimate can be off by one near powers of ten
+    exponent += (scaled >= 10 * low).astype(np.int64) - (scaled < low)
+    scaled = safe * 10.0 ** (precision - exponent)
+
+    # The product is within a few ulps of the exact value
+    tolerance = scaled * 2.0**-48
+    exact = (
+        valid
+        & (np.abs(scaled - np.floor(scaled) - 0.5) > tolerance)
+        & (np.abs(scaled - low) > tolerance)
+        & (np.abs(scaled - 10 * low) > tolerance)
+    )
+    digits = np.rint(scaled)
+    rolled = digits == 10 * low
+    digits = np.where(rolled, low, digits)
+    exponent += rolled
+    digits = np.where(zero, 0, digits).astype(np.int64)
+    exponent = np.where(zero, 0, exponent)
+    return digits, exponent, exact | (valid & zero)
+
+
+def naturaldelta(values, months=True, minimum_unit="seconds"):
+    """Vectorized version of `humanize.naturaldelta`.
+
+    Numbers are seconds, as for the scalar function. `timedelta64` arrays are read
+    as integer nanoseconds, as by `humanize.naturaldelta_ns`; a buffer of raw
+    nanoseconds can be viewed as one with `np.frombuffer(buffer, dtype="m8[ns]")`.
+
+    Examples:
+        ```pycon
+        >>> import numpy as np
+        >>> from humanize import numpy as hnp
+        >>> hnp.naturaldelta(np.array([0.5, 90, 7200, 86400 * 500])).tolist()
+        ['a moment', 'a minute', '2 hours', '1 year, 4 months']
+        >>> latencies = np.array([4, 1500, 120_000], dtype="m8[ms]")
+        >>> hnp.naturaldelta(latencies, minimum_unit="milliseconds").tolist()
+        ['4 milliseconds', 'a second', '2 minutes']
+
+        ```
+    Args:
+        values (array_like): Numbers of seconds or `timedelta64` values.
+        months (bool): If `True`, then a number of months (based on 30.5 days) will be
+            used for fuzziness between years.
+        minimum_unit (str): The lowest unit that can be used.
+
+    Returns:
+        numpy.ndarray: Object array of natural representations of the amounts of
+            time. `NaT` and values that cannot be converted are left unchanged.
+    """
+    fmt = time._delta_formatter(bool(months), minimum_unit)
+    arr = np.asarray(values)
+    if arr.dtype.kind == "m":
+        flat, valid = _timedeltas(arr)
+        us = np.abs(_nanoseconds(flat[valid])) // 1000
+    elif _is_numeric(arr):
+        flat, valid = _seconds(arr)
+        # Like the scalar version, count the days of negative values as positive
+        days, seconds = np.divmod(flat[valid].astype(np.int64), 86400)
+        us = np.abs(days) * time._DAY + seconds * time._SECOND
+    else:
+        return _fallback(fmt, arr)
+
+    out = _partial(fmt.format_ns if arr.dtype.kind == "m" else fmt, flat, valid)
+    row = np.searchsorted(np.array(fmt._bounds), us, side="right") - 1
+    texts = np.empty(us.shape, dtype=object)
+    for i in np.unique(row).tolist():
+        in_row = row == i
+        count = fmt._rows[i][1]
+        if callable(count):
+            texts[in_row] = [fmt._text(i, c) for c in count(us[in_row]).tolist()]
+        else:
+            texts[in_row] = fmt._text(i, count)
+    out[valid] = texts
+    return out.reshape(arr.shape)
+
+
+def precisedelta(values, minimum_unit="seconds", suppress=(), format="%0.2f"):
+    """Vectorized version of `humanize.precisedelta`.
+
+    Numbers are seconds, as for the scalar function. `timedelta64` arrays are read
+    as integer nanoseconds, as by `humanize.precisedelta_ns`. The years, months,
+    days, hours, minutes and seconds are split with array operations.
+
+    Examples:
+        ```pycon
+        >>> import numpy as np
+        >>> from humanize import numpy as hnp
+        >>> hnp.precisedelta(np.array([1, 3723, -86400 * 400])).tolist()
+        ['1 second', '1 hour, 2 minutes and 3 seconds', '1 year, 1 month and 4 days']
+        >>> latencies = np.array([1_500_000, 2 * 10**9], dtype="m8[ns]")
+        >>> hnp.precisedelta(latencies, minimum_unit="milliseconds").tolist()
+        ['1.50 milliseconds', '2 seconds']
+
+        ```
+    Args:
+        values (array_like): Numbers of seconds or `timedelta64` values.
+        minimum_unit (str): The lowest unit that can be used.
+        suppress (iterable of str): Units that are not used, see `precisedelta`.
+        format (str): Format of the minimum unit, if it has a fractional part.
+
+    Returns:
+        numpy.ndarray: Object array of precise representations of the amounts of
+            time. `NaT` and values that cannot be converted are left unchanged.
+    """
+    fmt = time._precisedelta_formatter(minimum_unit, tuple(suppress), format)
+    arr = np.asarray(values)
+    if arr.dtype.kind == "m":
+        flat, valid = _timedeltas(arr)
+        nanoseconds = np.abs(_nanoseconds(flat[valid]))
+        seconds, nanoseconds = np.divmod(nanoseconds, 1_000_000_000)
+        microseconds, nanoseconds = np.divmod(nanoseconds, 1000)
+        fraction = nanoseconds / 1000
+    elif _is_numeric(arr):
+        flat, valid = _seconds(arr)
+        seconds = np.abs(flat[valid].astype(np.int64))
+        microseconds = fraction = np.zeros_like(seconds)
+    else:
+        return _fallback(fmt, arr)
+    days, seconds = np.divmod(seconds, 86400)
+
+    out = _partial(fmt.format_ns if arr.dtype.kind == "m" else fmt, flat, valid)
+    counts = fmt._counts(days, seconds, microseconds, fraction)
+    columns = [itertools.repeat(None) if c is None else c.tolist() for c in counts]
+    out[valid] = [fmt._text(row) for row in zip(*columns)]
+    return out.reshape(arr.shape)
+
+
+# Larger numbers of seconds overflow int64 microseconds, and go to the scalar version
+_MAX_SECONDS = 10**12
+
+
+# Nanoseconds in the linear units of timedelta64
+_NS_PER_UNIT = {
+    "W": 7 * 86_400 * 10**9,
+    "D": 86_400 * 10**9,
+    "h": 3_600 * 10**9,
+    "m": 60 * 10**9,
+    "s": 10**9,
+    "ms": 10**6,
+    "us": 1000,
+    "ns": 1,
+}
+
+
+def _timedeltas(arr):
+    """Return `arr` flat, and the mask of its values that fit int64 nanoseconds.
+
+    That leaves out NaT, and the values of a coarse unit beyond the ~292 years of
+    int64 nanoseconds.
+    """
+    flat = arr.ravel()
+    valid = ~np.isnat(flat)
+    factor = _ns_per_unit(flat.dtype)
+    if factor > 1:
+        limit = np.iinfo(np.int64).max // factor
+        raw = flat.view(np.int64)
+        valid &= (raw >= -limit) & (raw <= limit)
+    return flat, valid
+
+
+def _ns_per_unit(dtype):
+    unit, count = np.datetime_data(dtype)
+    return _NS_PER_UNIT.get(unit, 0) * count
+
+
+def _nanoseconds(flat):
+    """Return timedelta64 values as int64 nanoseconds."""
+    return flat.astype("m8[ns]", copy=False).view(np.int64)
+
+
+def _seconds(arr):
+    """Return `arr` as flat whole seconds, and the mask of values in the int64 range."""
+    flat = arr.ravel()
+    if arr.dtype.kind == "f":
+        flat = np.trunc(flat)
+        with np.errstate(invalid="ignore"):
+            return flat, np.abs(flat) < _MAX_SECONDS
+    return flat, np.abs(flat.astype(np.float64)) < _MAX_SECONDS
+
+
+def _partial(func, flat, valid):
+    """Return a flat object array with the values outside of `valid` filled in.
+
+    Numbers are passed to the scalar `func`. `NaT` is kept unchanged, and other
+    timedeltas are passed to `func` as exact `int` nanoseconds.
+    """
+    out = np.empty(flat.shape, dtype=object)
+    invalid = ~valid
+    if not invalid.any():
+        return out
+    if flat.dtype.kind != "m":
+        out[invalid] = _fallback(func, flat[invalid])
+        return out
+
+    nat = np.isnat(flat)
+    out[nat] = list(flat[nat])
+    overflow = invalid & ~nat
+    factor = _ns_per_unit(flat.dtype)
+    raw = flat[overflow].view(np.int64).tolist()
+    out[overflow] = [func(v * factor) for v in raw]
+    return out
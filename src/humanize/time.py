@@ -6,20 +6,45 @@ These are largely borrowed from Django's `contrib.humanize`.
 """
 
 import datetime as dt
+import heapq
+import itertools
+import locale
 import math
+from bisect import bisect_right
+from collections import namedtuple
+from contextlib import contextmanager
 from enum import Enum
-from functools import total_ordering
+from functools import lru_cache, total_ordering
+from threading import local
+from time import monotonic_ns, time_ns
 
-from .i18n import _gettext as _
-from .i18n import _ngettext
+from .i18n import _gettext_noop as N_
+from .i18n import _ngettext_noop as NS_
+from .i18n import get_translation
 from .number import intcomma
 
 __all__ = [
+    "CoarseClock",
+    "DeltaFormatter",
+    "FrozenClock",
+    "naturaldate",
+    "naturaldate_many",
+    "naturalday",
+    "naturalday_many",
     "naturaldelta",
+    "naturaldelta_ns",
+    "naturaldelta_ns_many",
     "naturaltime",
-    "naturalday",
-    "naturaldate",
+    "naturaltime_many",
+    "naturaltime_ns",
+    "naturaltime_transition",
+    "NaturalTimeScheduler",
     "precisedelta",
+    "precisedelta_ns",
+    "precisedelta_ns_many",
+    "PreciseDeltaFormatter",
+    "set_clock",
+    "use_clock",
 ]
 
 
@@ -40,52 +65,144 @@ class Unit(Enum):
         return NotImplemented
 
 
+class _Clock(local):
+    # Threads that never installed a clock read the system clock
+    clock = None
+
+
+_CLOCK = _Clock()
+
+
 def _now():
-    return dt.datetime.now()
+    clock = _CLOCK.clock
+    if clock is None:
+        return dt.datetime.now()
+    return clock()
 
 
-def _abs_timedelta(delta):
-    """Return an "absolute" value for a timedelta, always representing a time distance.
+def _now_ns():
+    """Return the current time of the clock in nanoseconds since the epoch."""
+    if _CLOCK.clock is None:
+        return time_ns()
+    return round(_now().timestamp() * 1_000_000) * 1000
 
+
+def set_clock(clock=None):
+    """Set the clock that "now" is read from, in the current thread.
+
+    `naturaltime`, `naturalday`, `naturaldate`, `precisedelta` and the other
+    functions that compare against the current time read it from this clock.
+
+    Examples:
+        ```pycon
+        >>> import datetime as dt
+        >>> previous = set_clock(FrozenClock(dt.datetime(2020, 2, 2, 12)))
+        >>> naturaltime(dt.datetime(2020, 2, 2, 11, 57))
+        '3 minutes ago'
+        >>> naturalday(dt.date(2020, 2, 3))
+        'tomorrow'
+        >>> _ = set_clock(previous)
+
+        ```
     Args:
-        delta (datetime.timedelta): Input timedelta.
+        clock (callable): Returns the current local time as a naive `datetime`, like
+            `datetime.datetime.now`. `None` restores the system clock.
 
     Returns:
-        datetime.timedelta: Absolute timedelta.
+        callable: The previous clock, or `None` for the system clock.
     """
-    if delta.days < 0:
-        now = _now()
-        return now - (now + delta)
-    return delta
+    previous = _CLOCK.clock
+    _CLOCK.clock = clock
+    return previous
+
 
+@contextmanager
+def use_clock(clock):
+    """Read "now" from `clock` inside a `with` block, in the current thread.
 
-def _date_and_delta(value, *, now=None):
-    """Turn a value into a date and a timedelta which represents how long ago it was.
+    Examples:
+        ```pycon
+        >>> import datetime as dt
+        >>> with use_clock(FrozenClock(dt.datetime(2020, 2, 2, 12))):
+        ...     naturaltime(dt.datetime(2020, 2, 2, 11))
+        'an hour ago'
 
-    If that's not possible, return `(None, value)`.
+        ```
+    Args:
+        clock (callable): Returns the current local time as a naive `datetime`.
+            `None` uses the system clock.
     """
-    if not now:
-        now = _now()
-    if isinstance(value, dt.datetime):
-        date = value
-        delta = now - value
-    elif isinstance(value, dt.timedelta):
-        date = now - value
-        delta = value
-    else:
-        try:
-            value = int(value)
-            delta = dt.timedelta(seconds=value)
-            date = now - delta
-        except (ValueError, TypeError):
-            return None, value
-    return date, _abs_timedelta(delta)
+    previous = set_clock(clock)
+    try:
+        yield clock
+    finally:
+        set_clock(previous)
+
+
+class FrozenClock:
+    """Clock that always returns the same time, until it is moved.
+
+    Installed for a request, it makes all its labels agree on "now"; in tests, it
+    replaces patching `datetime`.
+
+    Examples:
+        ```pycon
+        >>> import datetime as dt
+        >>> clock = FrozenClock(dt.datetime(2020, 2, 2, 12))
+        >>> clock.advance(dt.timedelta(minutes=5))
+        >>> clock()
+        datetime.datetime(2020, 2, 2, 12, 5)
+
+        ```
+    Args:
+        now (datetime.datetime): The time to return. Defaults to the current time
+            when the clock is created.
+    """
+
+    def __init__(self, now=None):
+        """Freeze the clock at `now`."""
+        self.now = dt.datetime.now() if now is None else now
+
+    def __call__(self):
+        """Return the frozen time."""
+        return self.now
+
+    def advance(self, delta):
+        """Move the clock forward by a `datetime.timedelta`."""
+        self.now += delta
+
+
+class CoarseClock:
+    """Clock that reads the system time at most once per `resolution`.
+
+    In between, the last time read is returned again, without allocating a new
+    `datetime`. Whether it is stale is checked with the cheaper monotonic clock.
+
+    Args:
+        resolution (float): Seconds for which a time read is reused.
+    """
+
+    def __init__(self, resolution=0.001):
+        """Create a clock that has not read the time yet."""
+        self.resolution = resolution
+        self._period = round(resolution * 1_000_000_000)
+        self._expires = None
+        self._now = None
+
+    def __call__(self):
+        """Return the current time, as last read at most `resolution` ago."""
+        ticks = monotonic_ns()
+        if self._expires is None or ticks >= self._expires:
+            self._now = dt.datetime.now()
+            self._expires = ticks + self._period
+        return self._now
 
 
 def naturaldelta(
     value,
     months=True,
     minimum_unit="seconds",
+    fixed_width=False,
 ) -> str:
     """Return a natural representation of a timedelta or number of seconds.
 
@@ -96,6 +213,9 @@ def naturaldelta(
         months (bool): If `True`, then a number of months (based on 30.5 days) will be
             used for fuzziness between years.
         minimum_unit (str): The lowest unit that can be used.
+        fixed_width (bool): If `True`, the output is left-aligned to the width of the
+            longest output for these options in the active locale, so it can be
+            redrawn in place.
         when (datetime.datetime): Removed in version 4.0; If you need to
             construct a timedelta, do it inline as the first argument.
 
@@ -119,87 +239,326 @@ def naturaldelta(
 
         assert naturaldelta(later - now) == "30 minutes"
     """
-    tmp = Unit[minimum_unit.upper()]
-    if tmp not in (Unit.SECONDS, Unit.MILLISECONDS, Unit.MICROSECONDS):
-        raise ValueError(f"Minimum unit '{minimum_unit}' not supported")
-    minimum_unit = tmp
+    formatter = _delta_formatter(bool(months), minimum_unit)
+    if fixed_width:
+        return formatter.fixed(value)
+    return formatter(value)
 
-    if isinstance(value, dt.timedelta):
-        delta = value
-    else:
+
+def naturaldelta_ns(value, months=True, minimum_unit="seconds") -> str:
+    """Return a natural representation of an integer number of nanoseconds.
+
+    Suitable for `time.perf_counter_ns()` differences: the value is bucketed with
+    integer arithmetic only, without building a timedelta.
+
+    Examples:
+        ```pycon
+        >>> naturaldelta_ns(90 * 10**9)
+        'a minute'
+        >>> naturaldelta_ns(4_200_000, minimum_unit="milliseconds")
+        '4 milliseconds'
+
+        ```
+    Args:
+        value (int): Number of nanoseconds, of either sign.
+        months (bool): If `True`, then a number of months (based on 30.5 days) will be
+            used for fuzziness between years.
+        minimum_unit (str): The lowest unit that can be used.
+
+    Returns:
+        str: A natural representation of the amount of time.
+    """
+    return _delta_formatter(bool(months), minimum_unit).format_ns(value)
+
+
+def naturaldelta_ns_many(values, months=True, minimum_unit="seconds"):
+    """Apply `naturaldelta_ns` to an iterable of integer numbers of nanoseconds.
+
+    Any iterable of integers works, including an `array.array` or a `memoryview`
+    of 64-bit integers, which are read in place without NumPy. For NumPy arrays,
+    see `humanize.numpy.naturaldelta`.
+
+    Examples:
+        ```pycon
+        >>> from array import array
+        >>> latencies = array("q", [1_500_000, 2 * 10**9, 90 * 10**9])
+        >>> list(naturaldelta_ns_many(memoryview(latencies)))
+        ['a moment', '2 seconds', 'a minute']
+
+        ```
+    Args:
+        values (iterable of int): Numbers of nanoseconds, of either sign.
+        months (bool): If `True`, then a number of months (based on 30.5 days) will be
+            used for fuzziness between years.
+        minimum_unit (str): The lowest unit that can be used.
+
+    Yields:
+        str: Natural representations of the values, in order.
+    """
+    formatter = _delta_formatter(bool(months), minimum_unit)
+    for value in values:
+        yield formatter._format(abs(value) // 1000)
+
+
+_SECOND = 1_000_000
+_MINUTE = 60 * _SECOND
+_HOUR = 60 * _MINUTE
+_DAY = 24 * _HOUR
+_YEAR = 365 * _DAY
+
+_A_MOMENT = N_("a moment")
+_NOW = N_("now")
+_FROM_NOW = N_("%s from now")
+_AGO = N_("%s ago")
+
+
+class DeltaFormatter:
+    """Reusable formatter for `naturaldelta`.
+
+    The output of `naturaldelta` only depends on the bucket ("a minute", "N minutes",
+    "1 year, N months", ...) that a delta falls into. The lower bound of every bucket
+    is computed once, in microseconds, so formatting a delta is a bisect followed by
+    filling in the template of the bucket in the active locale.
+
+    Examples:
+        ```pycon
+        >>> import datetime as dt
+        >>> fmt = DeltaFormatter()
+        >>> fmt(dt.timedelta(seconds=90))
+        'a minute'
+        >>> fmt(dt.timedelta(days=500))
+        '1 year, 4 months'
+        >>> DeltaFormatter(months=False)(dt.timedelta(days=500))
+        '1 year, 135 days'
+        >>> fmt(0.5)
+        'a moment'
+        >>> DeltaFormatter(minimum_unit="milliseconds")(dt.timedelta(milliseconds=4))
+        '4 milliseconds'
+
+        ```
+    Args:
+        months (bool): If `True`, then a number of months (based on 30.5 days) will be
+            used for fuzziness between years.
+        minimum_unit (str): The lowest unit that can be used: "seconds",
+            "milliseconds" or "microseconds".
+
+    Raises:
+        ValueError: If `minimum_unit` is not supported.
+    """
+
+    def __init__(self, months=True, minimum_unit="seconds"):
+        """Compute the lower bound of every bucket down to `minimum_unit`."""
+        unit = Unit[minimum_unit.upper()]
+        if unit not in (Unit.SECONDS, Unit.MILLISECONDS, Unit.MICROSECONDS):
+            raise ValueError(f"Minimum unit '{minimum_unit}' not supported")
+        self.months = months
+        self.minimum_unit = minimum_unit
+
+        # Rows of (lower bound in microseconds, message, count, step, grouped). The
+        # message is a text, or a (singular, plural) pair filled in with the count: a
+        # constant, or a function of the microseconds that changes every `step`.
+        if unit == Unit.MICROSECONDS:
+            rows = [
+                (0, NS_("%d microsecond", "%d microseconds"), lambda us: us, 1, False),
+                (1000, _MILLISECONDS, lambda us: us / 1000, 1, False),
+            ]
+        elif unit == Unit.MILLISECONDS:
+            # The plural form is chosen from the fractional milliseconds
+            rows = [(0, _MILLISECONDS, lambda us: us / 1000, 1, False)]
+        else:
+            rows = [(0, _A_MOMENT, None, None, False)]
+        rows += [
+            (_SECOND, N_("a second"), None, None, False),
+            (2 * _SECOND, _SECONDS, lambda us: us // _SECOND, _SECOND, False),
+            (_MINUTE, N_("a minute"), None, None, False),
+            (2 * _MINUTE, _MINUTES, lambda us: us // _MINUTE, _MINUTE, False),
+            (_HOUR, N_("an hour"), None, None, False),
+            (2 * _HOUR, _HOURS, lambda us: us // _HOUR, _HOUR, False),
+            (_DAY, N_("a day"), None, None, False),
+            (2 * _DAY, _DAYS, lambda us: us // _DAY, _DAY, False),
+        ]
+        if months:
+            rows += _month_rows(0, N_("a month"), NS_("%d month", "%d months"))
+        rows += [
+            (_YEAR, N_("a year"), None, None, False),
+            (_YEAR + _DAY, _YEAR_DAYS, lambda us: us // _DAY - 365, _DAY, False),
+        ]
+        if months:
+            rows += _month_rows(
+                _YEAR,
+                N_("1 year, 1 month"),
+                NS_("1 year, %d month", "1 year, %d months"),
+            )
+        rows.append(
+            (2 * _YEAR, _YEARS, lambda us: us // _YEAR, _YEAR, True),
+        )
+
+        self._bounds = tuple(row[0] for row in rows)
+        self._rows = tuple(
+            (message, count, grouped) for _lower, message, count, _step, grouped in rows
+        )
+        self._steps = tuple(row[3] for row in rows)
+        self._widths = {}
+
+    def __call__(self, value):
+        """Format a delta.
+
+        Args:
+            value (datetime.timedelta or int): A timedelta or a number of seconds.
+
+        Returns:
+            str (str or `value`): A natural representation of the amount of time, or
+                `value` unchanged if it cannot be converted to a timedelta.
+        """
+        us = _delta_microseconds(value)
+        if us is None:
+            return value
+        return self._format(us)
+
+    def format_ns(self, value):
+        """Format a delta given as an integer number of nanoseconds.
+
+        The delta is bucketed with integer arithmetic only, without building a
+        timedelta, so it suits `time.perf_counter_ns()` or `time.time_ns()`
+        differences and is not limited to the range of a timedelta.
+
+        Examples:
+            ```pycon
+            >>> DeltaFormatter(minimum_unit="microseconds").format_ns(-12_345)
+            '12 microseconds'
+            >>> DeltaFormatter().format_ns(10**30)
+            '31,709,791,983,764 years'
+
+            ```
+        Args:
+            value (int): Number of nanoseconds, of either sign.
+
+        Returns:
+            str: A natural representation of the amount of time.
+        """
+        return self._format(abs(value) // 1000)
+
+    def _format(self, us):
+        i = bisect_right(self._bounds, us) - 1
+        count = self._rows[i][1]
+        if callable(count):
+            count = count(us)
+        return self._text(i, count)
+
+    def _text(self, i, count):
+        """Return the output of the bucket `i` for its `count`."""
+        message, _count, grouped = self._rows[i]
+        if count is None:
+            return _delta_text(get_translation(), message, None)
+        template = _delta_text(get_translation(), message, count)
+        return template % (intcomma(count) if grouped else count)
+
+    def _span(self, us):
+        """Return the range `[lower, upper)` of microseconds with the output of `us`.
+
+        `upper` is `None` if the output does not change for larger values.
+        """
+        i = bisect_right(self._bounds, us) - 1
+        lower = self._bounds[i]
+        upper = self._bounds[i + 1] if i + 1 < len(self._bounds) else None
+        step = self._steps[i]
+        if step is not None:
+            # Counts change at multiples of the step, which the bounds are too
+            lower = us - us % step
+            if upper is None or lower + step < upper:
+                upper = lower + step
+        return lower, upper
+
+    @property
+    def width(self):
+        """int: Width of the longest output in the active locale."""
+        translation = get_translation()
         try:
-            value = int(value)
-            delta = dt.timedelta(seconds=value)
-        except (ValueError, TypeError):
+            return self._widths[translation]
+        except KeyError:
+            pass
+        width = max(map(len, map(self, _naturaldelta_samples(self.minimum_unit))))
+        self._widths[translation] = width
+        return width
+
+    def fixed(self, value):
+        """Format a delta, left-aligned to exactly `width` characters.
+
+        Args:
+            value (datetime.timedelta or int): A timedelta or a number of seconds.
+
+        Returns:
+            str (str or `value`): The padded representation, or `value` unchanged if
+                it cannot be converted to a timedelta.
+        """
+        text = self(value)
+        if text is value:
             return value
+        return text.ljust(self.width)
 
-    use_months = months
-
-    seconds = abs(delta.seconds)
-    days = abs(delta.days)
-    years = days // 365
-    days = days % 365
-    months = int(days // 30.5)
-
-    if not years and days < 1:
-        if seconds == 0:
-            if minimum_unit == Unit.MICROSECONDS and delta.microseconds < 1000:
-                return (
-                    _ngettext("%d microsecond", "%d microseconds", delta.microseconds)
-                    % delta.microseconds
-                )
-            elif minimum_unit == Unit.MILLISECONDS or (
-                minimum_unit == Unit.MICROSECONDS
-                and 1000 <= delta.microseconds < 1_000_000
-            ):
-                milliseconds = delta.microseconds / 1000
-                return (
-                    _ngettext("%d millisecond", "%d milliseconds", milliseconds)
-                    % milliseconds
-                )
-            return _("a moment")
-        elif seconds == 1:
-            return _("a second")
-        elif seconds < 60:
-            return _ngettext("%d second", "%d seconds", seconds) % seconds
-        elif 60 <= seconds < 120:
-            return _("a minute")
-        elif 120 <= seconds < 3600:
-            minutes = seconds // 60
-            return _ngettext("%d minute", "%d minutes", minutes) % minutes
-        elif 3600 <= seconds < 3600 * 2:
-            return _("an hour")
-        elif 3600 < seconds:
-            hours = seconds // 3600
-            return _ngettext("%d hour", "%d hours", hours) % hours
-    elif years == 0:
-        if days == 1:
-            return _("a day")
-        if not use_months:
-            return _ngettext("%d day", "%d days", days) % days
-        else:
-            if not months:
-                return _ngettext("%d day", "%d days", days) % days
-            elif months == 1:
-                return _("a month")
-            else:
-                return _ngettext("%d month", "%d months", months) % months
-    elif years == 1:
-        if not months and not days:
-            return _("a year")
-        elif not months:
-            return _ngettext("1 year, %d day", "1 year, %d days", days) % days
-        elif use_months:
-            if months == 1:
-                return _("1 year, 1 month")
-            else:
-                return (
-                    _ngettext("1 year, %d month", "1 year, %d months", months) % months
-                )
-        else:
-            return _ngettext("1 year, %d day", "1 year, %d days", days) % days
-    else:
-        return _ngettext("%s year", "%s years", years) % intcomma(years)
+
+_MILLISECONDS = NS_("%d millisecond", "%d milliseconds")
+_SECONDS = NS_("%d second", "%d seconds")
+_MINUTES = NS_("%d minute", "%d minutes")
+_HOURS = NS_("%d hour", "%d hours")
+_DAYS = NS_("%d day", "%d days")
+_YEAR_DAYS = NS_("1 year, %d day", "1 year, %d days")
+_YEARS = NS_("%s year", "%s years")
+
+
+def _month_rows(offset, one, many):
+    """Return the rows of 1 to 11 months (of 30.5 days) after `offset`."""
+    rows = [(offset + 31 * _DAY, one, None, None, False)]
+    for months in range(2, 12):
+        days = math.ceil(30.5 * months)
+        rows.append((offset + days * _DAY, many, months, None, False))
+    return rows
+
+
+def _delta_microseconds(value):
+    """Return the microseconds that `naturaldelta` buckets `value` by.
+
+    For compatibility, the days of a negative timedelta count as positive while its
+    seconds and microseconds do not.
+
+    Return `None` if `value` is not a timedelta and cannot be converted to `int`.
+    """
+    if not isinstance(value, dt.timedelta):
+        try:
+            value = dt.timedelta(seconds=int(value))
+        except (ValueError, TypeError):
+            return None
+    return abs(value.days) * _DAY + value.seconds * _SECOND + value.microseconds
+
+
+@lru_cache(maxsize=4096)
+def _delta_text(translation, message, count):
+    """Return `message` translated, for `count` if it has a plural form."""
+    if count is None:
+        return translation.gettext(message)
+    return translation.ngettext(*message, count)
+
+
+@lru_cache()
+def _delta_formatter(months, minimum_unit):
+    return DeltaFormatter(months, minimum_unit)
+
+
+def _naturaldelta_samples(minimum_unit):
+    """Yield timedeltas that produce every distinct `naturaldelta` output shape."""
+    td = dt.timedelta
+    if minimum_unit.lower() != "seconds":
+        yield from (td(microseconds=us) for us in range(1000))
+        yield from (td(milliseconds=ms) for ms in range(1000))
+    yield from (td(seconds=s) for s in range(60))
+    yield from (td(minutes=m) for m in range(1, 60))
+    yield from (td(hours=h) for h in range(1, 24))
+    yield from (td(days=d) for d in range(1, 365))
+    yield from (td(days=365 + d) for d in range(365))
+    # Plural rules depend on the last digits, so cover them at the largest length
+    max_years = td.max.days // 365
+    for years in (*range(2, 1000), *range(max_years - 99, max_years + 1)):
+        yield td(days=365 * years)
 
 
 def naturaltime(
@@ -227,21 +586,319 @@ def naturaltime(
     Returns:
         str: A natural representation of the input in a resolution that makes sense.
     """
+    formatter = _delta_formatter(bool(months), minimum_unit)
+    return _naturaltime(value, future, formatter, when or _now(), get_translation())
+
+
+def naturaltime_many(
+    values,
+    future=False,
+    months=True,
+    minimum_unit="seconds",
+    when=None,
+):
+    """Apply `naturaltime` to an iterable of values, against a single "now".
+
+    The clock is read once, when iteration starts, so every value is described
+    relative to the same instant and rows of a feed cannot disagree about it. The
+    values are processed lazily, so this is suitable for streaming large inputs.
+
+    Examples:
+        ```pycon
+        >>> import datetime as dt
+        >>> when = dt.datetime(2020, 2, 2, 12)
+        >>> values = [when - dt.timedelta(minutes=3), when, 30, "NaN"]
+        >>> list(naturaltime_many(values, when=when))
+        ['3 minutes ago', 'now', '30 seconds ago', 'NaN']
+
+        ```
+    Args:
+        values (iterable): `datetime`s, timedeltas or numbers of seconds.
+        future (bool): Tense of the numbers of seconds, see `naturaltime`.
+        months (bool): If `True`, then a number of months (based on 30.5 days) will be
+            used for fuzziness between years.
+        minimum_unit (str): The lowest unit that can be used.
+        when (datetime.datetime): Point in time relative to which the values are
+            interpreted. Defaults to the current time in the local timezone.
+
+    Yields:
+        str: Natural representations of the values, in order. Values that cannot be
+        converted are yielded unchanged.
+    """
+    formatter = _delta_formatter(bool(months), minimum_unit)
     now = when or _now()
-    date, delta = _date_and_delta(value, now=now)
-    if date is None:
-        return value
-    # determine tense by value only if datetime/timedelta were passed
-    if isinstance(value, (dt.datetime, dt.timedelta)):
-        future = date > now
+    translation = get_translation()
+    for value in values:
+        yield _naturaltime(value, future, formatter, now, translation)
+
+
+def _naturaltime(value, future, formatter, now, translation):
+    """Return `value` relative to `now` with a `DeltaFormatter`.
+
+    The tense of a `datetime` or a timedelta comes from its own sign; `future` is only
+    used for numbers of seconds.
+    """
+    if isinstance(value, dt.datetime):
+        delta = now - value
+        future = value > now
+    elif isinstance(value, dt.timedelta):
+        # The value is a time `now - value`, in the future if `value` is negative
+        delta = value
+        future = value.days < 0
+    else:
+        try:
+            delta = dt.timedelta(seconds=int(value))
+        except (ValueError, TypeError):
+            return value
+    if delta.days < 0:
+        delta = -delta
+
+    return _tense(formatter(delta), future, translation)
+
+
+def _tense(text, future, translation):
+    """Return the `naturaldelta` output `text` in the past or future tense."""
+    if text == translation.gettext(_A_MOMENT):
+        return translation.gettext(_NOW)
+    return translation.gettext(_FROM_NOW if future else _AGO) % text
+
+
+def naturaltime_ns(value, months=True, minimum_unit="seconds", when=None) -> str:
+    """Return a natural representation of a `time.time_ns()` timestamp.
+
+    The delta to `when` is computed and bucketed with integer arithmetic only,
+    without building any `datetime`.
+
+    Examples:
+        ```pycon
+        >>> when = 1_600_000_000 * 10**9
+        >>> naturaltime_ns(when - 150 * 10**9, when=when)
+        '2 minutes ago'
+        >>> naturaltime_ns(when + 10**6, minimum_unit="milliseconds", when=when)
+        '1 millisecond from now'
+
+        ```
+    Args:
+        value (int): Nanoseconds since the epoch.
+        months (bool): If `True`, then a number of months (based on 30.5 days) will be
+            used for fuzziness between years.
+        minimum_unit (str): The lowest unit that can be used.
+        when (int): Nanoseconds since the epoch relative to which _value_ is
+            interpreted. Defaults to the current time of the clock.
+
+    Returns:
+        str: A natural representation of the input in a resolution that makes sense.
+    """
+    formatter = _delta_formatter(bool(months), minimum_unit)
+    delta = (_now_ns() if when is None else when) - value
+    return _tense(formatter.format_ns(delta), delta < 0, get_translation())
 
-    ago = _("%s from now") if future else _("%s ago")
-    delta = naturaldelta(delta, months, minimum_unit)
 
-    if delta == _("a moment"):
-        return _("now")
+Transition = namedtuple("Transition", ["text", "at"])
+Transition.__doc__ = """A `naturaltime` label and the instant it next changes.
 
-    return ago % delta
+Attributes:
+    text (str): The label.
+    at (datetime.datetime): The first instant at which the label is different, or
+        `None` if it never changes.
+"""
+
+
+def naturaltime_transition(
+    value,
+    future=False,
+    months=True,
+    minimum_unit="seconds",
+    when=None,
+):
+    """Return the `naturaltime` of a value and the instant at which it changes.
+
+    A live label like "3 minutes ago" only needs to be redrawn at `at`, instead of on
+    every refresh.
+
+    Examples:
+        ```pycon
+        >>> import datetime as dt
+        >>> when = dt.datetime(2020, 2, 2, 12)
+        >>> naturaltime_transition(when - dt.timedelta(seconds=150), when=when)
+        Transition(text='2 minutes ago', at=datetime.datetime(2020, 2, 2, 12, 0, 30))
+        >>> text, at = naturaltime_transition(when + dt.timedelta(hours=5), when=when)
+        >>> text, at - when
+        ('5 hours from now', datetime.timedelta(microseconds=1))
+        >>> naturaltime_transition(30, when=when)
+        Transition(text='30 seconds ago', at=None)
+
+        ```
+    Args:
+        value (datetime.datetime, int): A `datetime` or a number of seconds.
+        future (bool): Tense of the numbers of seconds, see `naturaltime`.
+        months (bool): If `True`, then a number of months (based on 30.5 days) will be
+            used for fuzziness between years.
+        minimum_unit (str): The lowest unit that can be used.
+        when (datetime.datetime): Point in time relative to which _value_ is
+            interpreted. Defaults to the current time in the local timezone.
+
+    Returns:
+        Transition: The label and the instant it changes. Only the labels of
+        `datetime`s change over time; for other values, `at` is `None`.
+    """
+    formatter = _delta_formatter(bool(months), minimum_unit)
+    now = when or _now()
+    return _transition(value, future, formatter, now, get_translation())
+
+
+def _transition(value, future, formatter, now, translation):
+    text = _naturaltime(value, future, formatter, now, translation)
+    if not isinstance(value, dt.datetime):
+        return Transition(text, None)
+    at = now
+    # The output of the next bucket can be the same, e.g. "now" on both sides of
+    # `value`, so move on until it is not.
+    while True:
+        at = _next_bucket(value, formatter, at)
+        if at is None:
+            return Transition(text, None)
+        if _naturaltime(value, future, formatter, at, translation) != text:
+            return Transition(text, at)
+
+
+def _next_bucket(value, formatter, now):
+    """Return the first instant after `now` at which `value` is in another bucket."""
+    try:
+        if value > now:
+            # The delta shrinks, the bucket ends when it drops below its lower bound
+            lower, _upper = formatter._span(_delta_microseconds(value - now))
+            return value - dt.timedelta(microseconds=lower - 1) if lower else value
+        _lower, upper = formatter._span(_delta_microseconds(now - value))
+        if upper is None:
+            return None
+        return value + dt.timedelta(microseconds=upper)
+    except OverflowError:
+        return None
+
+
+class NaturalTimeScheduler:
+    """Keep the `naturaltime` labels of many items up to date.
+
+    The items are kept in a heap ordered by the instant their label next changes, so
+    `update` only renders the items whose label has changed since the last call,
+    whatever the number of items.
+
+    Examples:
+        ```pycon
+        >>> import datetime as dt
+        >>> when = dt.datetime(2020, 2, 2, 12)
+        >>> scheduler = NaturalTimeScheduler()
+        >>> scheduler.add("build", when - dt.timedelta(seconds=50), when=when)
+        '50 seconds ago'
+        >>> scheduler.add("deploy", when - dt.timedelta(hours=3), when=when)
+        '3 hours ago'
+        >>> scheduler.next_change
+        datetime.datetime(2020, 2, 2, 12, 0, 1)
+        >>> scheduler.update(when + dt.timedelta(seconds=15))
+        {'build': 'a minute ago'}
+        >>> scheduler["deploy"]
+        '3 hours ago'
+
+        ```
+    Args:
+        future (bool): Tense of the numbers of seconds, see `naturaltime`.
+        months (bool): If `True`, then a number of months (based on 30.5 days) will be
+            used for fuzziness between years.
+        minimum_unit (str): The lowest unit that can be used.
+    """
+
+    def __init__(self, future=False, months=True, minimum_unit="seconds"):
+        """Create an empty scheduler."""
+        self.future = future
+        self._formatter = _delta_formatter(bool(months), minimum_unit)
+        # key: (value, Transition), and a heap of (at, sequence, key)
+        self._items = {}
+        self._heap = []
+        self._sequence = itertools.count()
+
+    def __len__(self):
+        """Return the number of scheduled values."""
+        return len(self._items)
+
+    def __contains__(self, key):
+        """Return whether a value is scheduled under `key`."""
+        return key in self._items
+
+    def __getitem__(self, key):
+        """Return the current label of `key`."""
+        return self._items[key][1].text
+
+    def add(self, key, value, when=None):
+        """Add or replace an item.
+
+        Args:
+            key (hashable): Identifier of the item.
+            value (datetime.datetime, int): A `datetime` or a number of seconds.
+            when (datetime.datetime): The current time. Defaults to the current time in
+                the local timezone.
+
+        Returns:
+            str: The label of the item.
+        """
+        now = when or _now()
+        self._schedule(key, value, now, get_translation())
+        return self._items[key][1].text
+
+    def remove(self, key):
+        """Remove an item.
+
+        Raises:
+            KeyError: If there is no item `key`.
+        """
+        # Its heap entry is skipped when it comes up
+        del self._items[key]
+
+    @property
+    def next_change(self):
+        """datetime.datetime: When the next label changes, or `None` if none will."""
+        heap = self._heap
+        while heap and not self._is_current(heap[0]):
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def update(self, when=None):
+        """Render again the items whose label has changed.
+
+        Args:
+            when (datetime.datetime): The current time. Defaults to the current time in
+                the local timezone.
+
+        Returns:
+            dict: The new labels of the items that changed, by key.
+        """
+        now = when or _now()
+        translation = get_translation()
+        heap = self._heap
+        changed = {}
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            if not self._is_current(entry):
+                continue
+            key = entry[2]
+            old = self._items[key][1].text
+            text = self._schedule(key, self._items[key][0], now, translation)
+            if text != old:
+                changed[key] = text
+        return changed
+
+    def _schedule(self, key, value, now, translation):
+        transition = _transition(value, self.future, self._formatter, now, translation)
+        self._items[key] = (value, transition)
+        if transition.at is not None:
+            heapq.heappush(self._heap, (transition.at, next(self._sequence), key))
+        return transition.text
+
+    def _is_current(self, entry):
+        """Return whether a heap entry belongs to an item that was not replaced."""
+        at, _sequence, key = entry
+        item = self._items.get(key)
+        return item is not None and item[1].at == at
 
 
 def naturalday(value, format="%b %d") -> str:
@@ -251,103 +908,138 @@ def naturalday(value, format="%b %d") -> str:
     present day return representing string. Otherwise, return a string
     formatted according to `format`.
 
+    Yesterday, today and tomorrow are cached by date and translation, for the current
+    day. Other dates are formatted on each call, so they follow changes of the
+    `LC_TIME` locale without it being looked up every time. `naturalday_many` also
+    caches those, for the locale when iteration starts.
     """
-    try:
-        value = dt.date(value.year, value.month, value.day)
-    except AttributeError:
-        # Passed value wasn't date-ish
-        return value
-    except (OverflowError, ValueError):
-        # Date arguments out of range
-        return value
-    delta = value - dt.date.today()
-    if delta.days == 0:
-        return _("today")
-    elif delta.days == 1:
-        return _("tomorrow")
-    elif delta.days == -1:
-        return _("yesterday")
-    return value.strftime(format)
+    return _naturalday(value, format, _now().date(), (get_translation(), None))
 
 
 def naturaldate(value) -> str:
     """Like `naturalday`, but append a year for dates more than ~five months away."""
-    try:
-        value = dt.date(value.year, value.month, value.day)
-    except AttributeError:
-        # Passed value wasn't date-ish
-        return value
-    except (OverflowError, ValueError):
-        # Date arguments out of range
-        return value
-    delta = _abs_timedelta(value - dt.date.today())
-    if delta.days >= 5 * 365 / 12:
-        return naturalday(value, "%b %d %Y")
-    return naturalday(value)
+    return _naturaldate(value, _now().date(), (get_translation(), None))
 
 
-def _quotient_and_remainder(value, divisor, unit, minimum_unit, suppress):
-    """Divide `value` by `divisor` returning the quotient and remainder.
+def naturalday_many(values, format="%b %d"):
+    """Apply `naturalday` to an iterable of values.
 
-    If `unit` is `minimum_unit`, makes the quotient a float number and the remainder
-    will be zero. The rational is that if `unit` is the unit of the quotient, we cannot
-    represent the remainder because it would require a unit smaller than the
-    `minimum_unit`.
+    Today and the locale are looked up once, when iteration starts, and every output
+    is cached by date, format and locale for the current day.
 
-    >>> from humanize.time import _quotient_and_remainder, Unit
-    >>> _quotient_and_remainder(36, 24, Unit.DAYS, Unit.DAYS, [])
-    (1.5, 0)
+    Examples:
+        ```pycon
+        >>> import datetime as dt
+        >>> with use_clock(FrozenClock(dt.datetime(2020, 2, 2, 12))):
+        ...     list(naturalday_many([dt.date(2020, 2, 1), dt.date(2020, 3, 1), "x"]))
+        ['yesterday', 'Mar 01', 'x']
 
-    If unit is in `suppress`, the quotient will be zero and the remainder will be the
-    initial value. The idea is that if we cannot use `unit`, we are forced to use a
-    lower unit so we cannot do the division.
+        ```
+    Args:
+        values (iterable): Dates or datetimes.
+        format (str): `strftime` format of the dates other than yesterday, today and
+            tomorrow.
+
+    Yields:
+        str: Natural days, in order. Values that are not dates are yielded unchanged.
+    """
+    today = _now().date()
+    locale_key = _day_locale()
+    for value in values:
+        yield _naturalday(value, format, today, locale_key)
 
-    >>> _quotient_and_remainder(36, 24, Unit.DAYS, Unit.HOURS, [Unit.DAYS])
-    (0, 36)
 
-    In other case return quotient and remainder as `divmod` would do it.
+def naturaldate_many(values):
+    """Apply `naturaldate` to an iterable of values.
 
-    >>> _quotient_and_remainder(36, 24, Unit.DAYS, Unit.HOURS, [])
-    (1, 12)
+    Today and the locale are looked up once, when iteration starts, and every output
+    is cached by date and locale for the current day.
 
+    Examples:
+        ```pycon
+        >>> import datetime as dt
+        >>> with use_clock(FrozenClock(dt.datetime(2020, 2, 2, 12))):
+        ...     list(naturaldate_many([dt.date(2020, 2, 3), dt.date(2019, 1, 1)]))
+        ['tomorrow', 'Jan 01 2019']
+
+        ```
+    Args:
+        values (iterable): Dates or datetimes.
+
+    Yields:
+        str: Natural dates, in order. Values that are not dates are yielded
+        unchanged.
     """
-    if unit == minimum_unit:
-        return (value / divisor, 0)
-    elif unit in suppress:
-        return (0, value)
-    else:
-        return divmod(value, divisor)
+    today = _now().date()
+    locale_key = _day_locale()
+    for value in values:
+        yield _naturaldate(value, today, locale_key)
 
 
-def _carry(value1, value2, ratio, unit, min_unit, suppress):
-    """Return a tuple with two values.
+def _day_locale():
+    """Return what the text of a natural day depends on besides the date.
+
+    That is the translation of "today" and its neighbours and the `LC_TIME` locale
+    of `strftime` month and day names. Scalar calls pass `None` for the latter, and
+    do not cache the other dates.
+    """
+    return get_translation(), locale.setlocale(locale.LC_TIME)
 
-    If the unit is in `suppress`, multiply `value1` by `ratio` and add it to `value2`
-    (carry to right). The idea is that if we cannot represent `value1` we need to
-    represent it in a lower unit.
 
-    >>> from humanize.time import _carry, Unit
-    >>> _carry(2, 6, 24, Unit.DAYS, Unit.SECONDS, [Unit.DAYS])
-    (0, 54)
+def _as_date(value):
+    """Return `value` as a `date`, or `None` if it is not date-ish."""
+    if type(value) is dt.date:
+        return value
+    try:
+        return dt.date(value.year, value.month, value.day)
+    except AttributeError:
+        # Passed value wasn't date-ish
+        return None
+    except (OverflowError, ValueError):
+        # Date arguments out of range
+        return None
 
-    If the unit is the minimum unit, `value2` is divided by `ratio` and added to
-    `value1` (carry to left). We assume that `value2` has a lower unit so we need to
-    carry it to `value1`.
 
-    >>> _carry(2, 6, 24, Unit.DAYS, Unit.DAYS, [])
-    (2.25, 0)
+def _naturalday(value, format, today, locale_key):
+    date = _as_date(value)
+    if date is None:
+        return value
+    if locale_key[1] is None and abs((date - today).days) > 1:
+        # Not cached, to follow changes of the LC_TIME locale
+        return date.strftime(format)
+    return _naturalday_text(date, format, today, locale_key)
 
-    Otherwise, just return the same input:
 
-    >>> _carry(2, 6, 24, Unit.DAYS, Unit.SECONDS, [])
-    (2, 6)
+def _naturaldate(value, today, locale_key):
+    date = _as_date(value)
+    if date is None:
+        return value
+    if abs(date - today).days >= 5 * 365 / 12:
+        return _naturalday(date, "%b %d %Y", today, locale_key)
+    return _naturalday(date, "%b %d", today, locale_key)
+
+
+@lru_cache(maxsize=1024)
+def _naturalday_text(date, format, today, locale_key):
+    """Return the natural day of `date`.
+
+    `today` is part of the key, so the entries of a day are not used once the date
+    has rolled over, and age out of the cache.
     """
-    if unit == min_unit:
-        return (value1 + value2 / ratio, 0)
-    elif unit in suppress:
-        return (0, value2 + value1 * ratio)
-    else:
-        return (value1, value2)
+    translation = locale_key[0]
+    days = (date - today).days
+    if days == 0:
+        return translation.gettext(_TODAY)
+    elif days == 1:
+        return translation.gettext(_TOMORROW)
+    elif days == -1:
+        return translation.gettext(_YESTERDAY)
+    return date.strftime(format)
+
+
+_TODAY = N_("today")
+_TOMORROW = N_("tomorrow")
+_YESTERDAY = N_("yesterday")
 
 
 def _suitable_minimum_unit(min_unit, suppress):
@@ -463,97 +1155,250 @@ def precisedelta(value, minimum_unit="seconds", suppress=(), format="%0.2f") ->
 
     ```
     """
-    date, delta = _date_and_delta(value)
-    if date is None:
-        return value
+    return _precisedelta_formatter(minimum_unit, tuple(suppress), format)(value)
+
+
+def precisedelta_ns(value, minimum_unit="seconds", suppress=(), format="%0.2f") -> str:
+    """Return a precise representation of an integer number of nanoseconds.
+
+    The value is split with integer arithmetic only, without building a timedelta,
+    and with a resolution below a microsecond:
+
+    ```pycon
+    >>> precisedelta_ns(3_723_000_000_500, minimum_unit="microseconds")
+    '1 hour, 2 minutes, 3 seconds and 0.50 microseconds'
+    >>> precisedelta_ns(2_500, minimum_unit="microseconds", format="%0.1f")
+    '2.5 microseconds'
+
+    ```
+    Args:
+        value (int): Number of nanoseconds, of either sign.
+        minimum_unit (str): The lowest unit that can be used.
+        suppress (iterable of str): Units that are not used, see `precisedelta`.
+        format (str): Format of the minimum unit, if it has a fractional part.
+
+    Returns:
+        str: A precise representation of the amount of time.
+    """
+    formatter = _precisedelta_formatter(minimum_unit, tuple(suppress), format)
+    return formatter.format_ns(value)
+
+
+def precisedelta_ns_many(values, minimum_unit="seconds", suppress=(), format="%0.2f"):
+    """Apply `precisedelta_ns` to an iterable of integer numbers of nanoseconds.
+
+    Like `naturaldelta_ns_many`, this reads an `array.array` or a `memoryview` of
+    64-bit integers in place. For NumPy arrays, see `humanize.numpy.precisedelta`.
 
-    suppress = [Unit[s.upper()] for s in suppress]
-
-    # Find a suitable minimum unit (it can be greater the one that the
-    # user gave us if it is suppressed).
-    min_unit = Unit[minimum_unit.upper()]
-    min_unit = _suitable_minimum_unit(min_unit, suppress)
-    del minimum_unit
-
-    # Expand the suppressed units list/set to include all the units
-    # that are below the minimum unit
-    suppress = _suppress_lower_units(min_unit, suppress)
-
-    # handy aliases
-    days = delta.days
-    secs = delta.seconds
-    usecs = delta.microseconds
-
-    MICROSECONDS, MILLISECONDS, SECONDS, MINUTES, HOURS, DAYS, MONTHS, YEARS = list(
-        Unit
-    )
-
-    # Given DAYS compute YEARS and the remainder of DAYS as follows:
-    #   if YEARS is the minimum unit, we cannot use DAYS so
-    #   we will use a float for YEARS and 0 for DAYS:
-    #       years, days = years/days, 0
-    #
-    #   if YEARS is suppressed, use DAYS:
-    #       years, days = 0, days
-    #
-    #   otherwise:
-    #       years, days = divmod(years, days)
-    #
-    # The same applies for months, hours, minutes and milliseconds below
-    years, days = _quotient_and_remainder(days, 365, YEARS, min_unit, suppress)
-    months, days = _quotient_and_remainder(days, 30.5, MONTHS, min_unit, suppress)
-
-    # If DAYS is not in suppress, we can represent the days but
-    # if it is a suppressed unit, we need to carry it to a lower unit,
-    # seconds in this case.
-    #
-    # The same applies for secs and usecs below
-    days, secs = _carry(days, secs, 24 * 3600, DAYS, min_unit, suppress)
-
-    hours, secs = _quotient_and_remainder(secs, 3600, HOURS, min_unit, suppress)
-    minutes, secs = _quotient_and_remainder(secs, 60, MINUTES, min_unit, suppress)
-
-    secs, usecs = _carry(secs, usecs, 1e6, SECONDS, min_unit, suppress)
-
-    msecs, usecs = _quotient_and_remainder(
-        usecs, 1000, MILLISECONDS, min_unit, suppress
-    )
-
-    # if _unused != 0 we had lost some precision
-    usecs, _unused = _carry(usecs, 0, 1, MICROSECONDS, min_unit, suppress)
-
-    fmts = [
-        ("%d year", "%d years", years),
-        ("%d month", "%d months", months),
-        ("%d day", "%d days", days),
-        ("%d hour", "%d hours", hours),
-        ("%d minute", "%d minutes", minutes),
-        ("%d second", "%d seconds", secs),
-        ("%d millisecond", "%d milliseconds", msecs),
-        ("%d microsecond", "%d microseconds", usecs),
-    ]
-
-    texts = []
-    for unit, fmt in zip(reversed(Unit), fmts):
-        singular_txt, plural_txt, value = fmt
-        if value > 0 or (not texts and unit == min_unit):
-            fmt_txt = _ngettext(singular_txt, plural_txt, value)
-            if unit == min_unit and math.modf(value)[0] > 0:
-                fmt_txt = fmt_txt.replace("%d", format)
-            elif unit == YEARS:
-                fmt_txt = fmt_txt.replace("%d", "%s")
-                texts.append(fmt_txt % intcomma(value))
+    Examples:
+        ```pycon
+        >>> from array import array
+        >>> latencies = array("q", [1_500_000, 3_723 * 10**9])
+        >>> list(precisedelta_ns_many(latencies, minimum_unit="milliseconds"))
+        ['1.50 milliseconds', '1 hour, 2 minutes and 3 seconds']
+
+        ```
+    Args:
+        values (iterable of int): Numbers of nanoseconds, of either sign.
+        minimum_unit (str): The lowest unit that can be used.
+        suppress (iterable of str): Units that are not used, see `precisedelta`.
+        format (str): Format of the minimum unit, if it has a fractional part.
+
+    Yields:
+        str: Precise representations of the values, in order.
+    """
+    formatter = _precisedelta_formatter(minimum_unit, tuple(suppress), format)
+    for value in values:
+        yield formatter.format_ns(value)
+
+
+# Actions of the steps of a `PreciseDeltaFormatter` plan
+_DIVIDE, _CARRY, _SUPPRESSED_CARRY, _LAST_DIVIDE, _LAST_CARRY = range(5)
+
+# Steps splitting the days, seconds and microseconds of a timedelta, largest unit
+# first: (unit, message, divisor, carried component). A unit without a carried
+# component is divided out of the running remainder. A unit with one passes on the
+# next component of the timedelta, e.g. days continue with the seconds.
+_PRECISE_STEPS = (
+    (Unit.YEARS, NS_("%d year", "%d years"), 365, None),
+    (Unit.MONTHS, NS_("%d month", "%d months"), 30.5, None),
+    (Unit.DAYS, NS_("%d day", "%d days"), 24 * 3600, 0),
+    (Unit.HOURS, NS_("%d hour", "%d hours"), 3600, None),
+    (Unit.MINUTES, NS_("%d minute", "%d minutes"), 60, None),
+    (Unit.SECONDS, NS_("%d second", "%d seconds"), 1e6, 1),
+    (Unit.MILLISECONDS, NS_("%d millisecond", "%d milliseconds"), 1000, None),
+    (Unit.MICROSECONDS, NS_("%d microsecond", "%d microseconds"), 1, 2),
+)
+
+
+class PreciseDeltaFormatter:
+    """Reusable formatter for `precisedelta`.
+
+    The minimum unit and the suppressed units are resolved once, into a fixed plan of
+    divisions and carries down to the minimum unit. Formatting a delta then only runs
+    that plan and fills in the templates of the units in the active locale.
+
+    Examples:
+        ```pycon
+        >>> import datetime as dt
+        >>> fmt = PreciseDeltaFormatter(suppress=["days"])
+        >>> fmt(dt.timedelta(days=2, seconds=3633, microseconds=123000))
+        '49 hours and 33.12 seconds'
+        >>> PreciseDeltaFormatter("minutes")(dt.timedelta(seconds=90))
+        '1.50 minutes'
+
+        ```
+    Args:
+        minimum_unit (str): The lowest unit that can be used. If it is suppressed,
+            the next larger unit that is not suppressed is used.
+        suppress (iterable of str): Units that are not used; their time is carried
+            to the lower units.
+        format (str): Format of the minimum unit, if it has a fractional part.
+
+    Raises:
+        ValueError: If the minimum unit and every larger unit are suppressed.
+    """
+
+    def __init__(self, minimum_unit="seconds", suppress=(), format="%0.2f"):
+        """Resolve the units into the plan of divisions and carries."""
+        self.minimum_unit = minimum_unit
+        self.suppress = tuple(suppress)
+        self.format = format
+
+        suppressed = [Unit[s.upper()] for s in self.suppress]
+        min_unit = _suitable_minimum_unit(Unit[minimum_unit.upper()], suppressed)
+        suppressed = _suppress_lower_units(min_unit, suppressed)
+
+        # With `x` the running remainder, a unit that is not suppressed takes
+        # `divmod(x, divisor)`, or `x` itself before moving on to a carried
+        # component `c`. The minimum unit takes `x / divisor`, or `x + c / divisor`,
+        # and ends the plan. A suppressed unit divides nothing, and carries `x` to
+        # the lower unit as `c + x * divisor`.
+        plan = []
+        for unit, message, divisor, carried in _PRECISE_STEPS:
+            if unit == min_unit:
+                action = _LAST_DIVIDE if carried is None else _LAST_CARRY
+            elif unit not in suppressed:
+                action = _DIVIDE if carried is None else _CARRY
+            elif carried is not None:
+                action = _SUPPRESSED_CARRY
+            else:
+                continue
+            plan.append((action, divisor, carried, message, unit == Unit.YEARS))
+            if unit == min_unit:
+                break
+        self._plan = tuple(plan)
+
+    def __call__(self, value):
+        """Format a delta.
+
+        Args:
+            value (datetime.timedelta, datetime.datetime or int): A timedelta, a
+                datetime relative to now, or a number of seconds.
+
+        Returns:
+            str (str or `value`): A precise representation of the amount of time, or
+                `value` unchanged if it cannot be converted to a timedelta.
+        """
+        delta = _precise_timedelta(value)
+        if delta is None:
+            return value
+        return self._format(delta.days, delta.seconds, delta.microseconds, 0)
+
+    def format_ns(self, value):
+        """Format a delta given as an integer number of nanoseconds.
+
+        The delta is split with integer arithmetic only, without building a
+        timedelta. The nanoseconds below a microsecond are kept as a fraction of the
+        microseconds, if they are the minimum unit.
+
+        Examples:
+            ```pycon
+            >>> PreciseDeltaFormatter("microseconds").format_ns(1_001_500)
+            '1 millisecond and 1.50 microseconds'
+            >>> PreciseDeltaFormatter().format_ns(-90 * 10**9)
+            '1 minute and 30 seconds'
+
+            ```
+        Args:
+            value (int): Number of nanoseconds, of either sign.
+
+        Returns:
+            str: A precise representation of the amount of time.
+        """
+        seconds, nanoseconds = divmod(abs(value), 1_000_000_000)
+        days, seconds = divmod(seconds, 86400)
+        microseconds, nanoseconds = divmod(nanoseconds, 1000)
+        return self._format(days, seconds, microseconds, nanoseconds / 1000)
+
+    def _format(self, days, seconds, microseconds, fraction):
+        """Run the plan on the components of a delta, with `fraction` microseconds."""
+        return self._text(self._counts(days, seconds, microseconds, fraction))
+
+    def _counts(self, days, seconds, microseconds, fraction):
+        """Return the count of every step of the plan, `None` for suppressed units.
+
+        Only arithmetic operators are used, so the components may also be arrays.
+        """
+        components = (seconds, microseconds, fraction)
+        rest = days
+        counts = []
+        for action, divisor, carried, _message, _grouped in self._plan:
+            if action == _DIVIDE:
+                count, rest = divmod(rest, divisor)
+            elif action == _CARRY:
+                count, rest = rest, components[carried]
+            elif action == _SUPPRESSED_CARRY:
+                count, rest = None, components[carried] + rest * divisor
+            elif action == _LAST_DIVIDE:
+                count = rest / divisor
+            else:
+                count = rest + components[carried] / divisor
+            counts.append(count)
+        return counts
+
+    def _text(self, counts):
+        """Return the text of the counts of the steps of the plan."""
+        translation = get_translation()
+        texts = []
+        for step, count in zip(self._plan, counts):
+            if count is None:
                 continue
+            action, _divisor, _carried, message, grouped = step
+            if action >= _LAST_DIVIDE and math.modf(count)[0] > 0:
+                template = translation.ngettext(*message, count)
+                texts.append(template.replace("%d", self.format) % count)
+                break
+            if count > 0 or (action >= _LAST_DIVIDE and not texts):
+                template = _delta_text(translation, message, count)
+                if grouped:
+                    template = template.replace("%d", "%s")
+                    count = intcomma(count)
+                texts.append(template % count)
 
-            texts.append(fmt_txt % value)
+        if len(texts) == 1:
+            return texts[0]
+        head = ", ".join(texts[:-1])
+        return _delta_text(translation, _AND, None) % (head, texts[-1])
 
-        if unit == min_unit:
-            break
 
-    if len(texts) == 1:
-        return texts[0]
+_AND = N_("%s and %s")
+
+
+def _precise_timedelta(value):
+    """Return the absolute timedelta of `value` for `precisedelta`, or `None`."""
+    if isinstance(value, dt.datetime):
+        delta = _now() - value
+    elif isinstance(value, dt.timedelta):
+        delta = value
+    else:
+        try:
+            delta = dt.timedelta(seconds=int(value))
+        except (ValueError, TypeError):
+            return None
+    return -delta if delta.days < 0 else delta
 
-    head = ", ".join(texts[:-1])
-    tail = texts[-1]
 
-    return _("%s and %s") % (head, tail)
+@lru_cache()
+def _precisedelta_formatter(minimum_unit, suppress, format):
+    return PreciseDeltaFormatter(minimum_unit, suppress, format)
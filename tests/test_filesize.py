@@ -2,6 +2,8 @@
 
 """Tests for filesize humanizing."""
 
+import os
+
 import pytest
 
 import humanize
@@ -38,3 +40,270 @@ def test_naturalsize(test_args, expected):
     args_with_negative = test_args
     args_with_negative[0] *= -1
     assert humanize.naturalsize(*args_with_negative) == "-" + expected
+
+
+@pytest.mark.parametrize(
+    "kwargs, value, expected",
+    [
+        ({}, 1, "1 Byte"),
+        ({}, 999, "999 Bytes"),
+        ({}, 1000, "1.0 kB"),
+        ({}, 10**6 - 1, "1000.0 kB"),
+        ({}, 10**6, "1.0 MB"),
+        ({"binary": True}, 1024**2, "1.0 MiB"),
+        ({"gnu": True}, 1023, "1023B"),
+        ({"gnu": True, "format": "%.2f"}, 1024**3, "1.00G"),
+        ({}, 10**30, "1000000.0 YB"),
+        ({}, float("inf"), "inf YB"),
+    ],
+)
+def test_size_formatter(kwargs, value, expected):
+    fmt = humanize.SizeFormatter(**kwargs)
+    assert fmt(value) == expected
+    assert humanize.naturalsize(value, **kwargs) == expected
+
+
+@pytest.mark.parametrize(
+    "test_input, expected",
+    [
+        ("1 Byte", 1),
+        ("300 Bytes", 300),
+        ("300B", 300),
+        ("3.0 kB", 3000),
+        ("3.0 MB", 3_000_000),
+        ("2.9 KiB", 2970),
+        ("2.9K", 2970),
+        ("1.0 GiB", 1024**3),
+        ("-3.14 MB", -3_140_000),
+        ("  42  ", 42),
+        (".5 kB", 500),
+    ],
+)
+def test_parse_size(test_input, expected):
+    assert humanize.parse_size(test_input) == expected
+
+
+@pytest.mark.parametrize("test_input", ["", "MB", "3.0 XB", "3.0 mb", "3 MB MB"])
+def test_parse_size_invalid(test_input):
+    with pytest.raises(ValueError):
+        humanize.parse_size(test_input)
+
+
+def test_parse_size_many():
+    values = iter(["3.0 MB", "2.9K", "1.2 GiB"])
+    assert list(humanize.parse_size_many(values)) == [3_000_000, 2970, 1288490189]
+
+
+def test_dirsizes(tmp_path):
+    (tmp_path / "logs" / "old").mkdir(parents=True)
+    (tmp_path / "logs" / "app.log").write_bytes(b"x" * 3000)
+    (tmp_path / "logs" / "old" / "app.log.1").write_bytes(b"x" * 1000)
+    (tmp_path / "empty").mkdir()
+    (tmp_path / "README").write_bytes(b"x" * 24)
+
+    rows = list(humanize.dirsizes(tmp_path, gnu=True, max_workers=2))
+
+    assert sorted(rows[:-1]) == [
+        (str(tmp_path / "empty"), 0, "0B"),
+        (str(tmp_path / "logs"), 4000, "3.9K"),
+    ]
+    assert rows[-1] == (str(tmp_path), 4024, "3.9K")
+    assert rows[-1].text == humanize.naturalsize(4024, gnu=True)
+
+
+def test_dirsizes_errors(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        list(humanize.dirsizes(tmp_path / "missing"))
+
+
+def test_dirsizes_onerror(tmp_path, monkeypatch):
+    (tmp_path / "locked").mkdir()
+    (tmp_path / "locked" / "secret").write_bytes(b"x" * 1000)
+    (tmp_path / "open").mkdir()
+    (tmp_path / "open" / "data").write_bytes(b"x" * 500)
+
+    scandir = os.scandir
+
+    def unreadable(path):
+        if os.fspath(path) == str(tmp_path / "locked"):
+            raise PermissionError(13, "Permission denied", os.fspath(path))
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", unreadable)
+
+    rows = sorted(humanize.dirsizes(tmp_path))
+    assert [row.size for row in rows] == [500, 0, 500]
+
+    errors = []
+    rows = sorted(humanize.dirsizes(tmp_path, onerror=errors.append))
+    assert rows[1] == (str(tmp_path / "locked"), 0, "0 Bytes")
+    assert [type(err) for err in errors] == [PermissionError]
+    assert errors[0].filename == str(tmp_path / "locked")
+
+
+@pytest.mark.parametrize(
+    "kwargs, value, expected",
+    [
+        ({}, 1, "1 bit"),
+        ({}, 300, "300 bits"),
+        ({}, 96_000_000, "96.0 Mbit"),
+        ({"binary": True}, 2048, "2.0 Kibit"),
+        ({"gnu": True}, 300, "300b"),
+        ({"gnu": True}, 2048, "2.0Kb"),
+    ],
+)
+def test_size_formatter_bits(kwargs, value, expected):
+    assert humanize.SizeFormatter(bits=True, **kwargs)(value) == expected
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_rate_meter():
+    clock = FakeClock()
+    meter = humanize.RateMeter(window=10, buckets=10, clock=clock)
+    assert meter.rate == 0.0
+    assert str(meter) == "0 Bytes/s"
+
+    for _ in range(80):
+        meter.update(125_000)
+        clock.now += 0.125
+    assert meter.rate == pytest.approx(1_000_000)
+    assert meter.ewma == pytest.approx(1_000_000)
+    assert meter.format() == "1.0 MB/s"
+    assert meter.format(bits=True) == "8.0 Mbit/s"
+    assert meter.format(bits=True, smoothed=True) == "8.0 Mbit/s"
+
+    # Only four of the last nine complete seconds had traffic
+    clock.now += 5
+    assert meter.rate == pytest.approx(4_000_000 / 9)
+    assert meter.ewma < 1_000_000 * 0.7**4
+
+    # After a full idle window nothing is left
+    clock.now += 60
+    assert meter.rate == 0.0
+    assert humanize.RateMeter(gnu=True, clock=clock).format() == "0B/s"
+
+
+@pytest.mark.parametrize(
+    "test_args",
+    [
+        [1],
+        [300],
+        [3000],
+        [3000, True],
+        [3000, False, True],
+        [-3141592, False, False, "%.2f"],
+    ],
+)
+def test_naturalsize_into(test_args):
+    buf = bytearray(b">")
+    written = humanize.naturalsize_into(buf, *test_args)
+    expected = humanize.naturalsize(*test_args).encode()
+    assert buf == b">" + expected
+    assert written == len(expected)
+
+
+def test_naturalsize_into_memoryview():
+    view = memoryview(bytearray(b"." * 12))
+    assert humanize.naturalsize_into(view, 3000, offset=2) == 6
+    assert bytes(view) == b"..3.0 kB...."
+
+    with pytest.raises(TypeError):
+        humanize.naturalsize_into(view, 3000)
+    with pytest.raises(ValueError):
+        humanize.naturalsize_into(view, 3000, offset=8)
+
+
+def test_naturalsize_many_into():
+    values = [1, 300, 3000, 3_000_000]
+    buf = bytearray()
+    written = humanize.naturalsize_many_into(buf, values, sep=b", ", gnu=True)
+    assert buf == b"1B, 300B, 2.9K, 2.9M"
+    assert written == len(buf)
+
+    view = memoryview(bytearray(len(buf) + 2))
+    humanize.naturalsize_many_into(view, values, sep=b", ", gnu=True, offset=2)
+    assert bytes(view[2:]) == bytes(buf)
+
+
+@pytest.mark.parametrize(
+    "test_args, expected",
+    [
+        ([1], (1.0, "1", "Byte", 0)),
+        ([-300], (-300.0, "-300", "Bytes", 0)),
+        ([3000], (3.0, "3.0", "kB", 1)),
+        ([3000, True], (2.9296875, "2.9", "KiB", 1)),
+        ([300, False, True], (300.0, "300", "B", 0)),
+        ([3000000000, False, True, "%.0f"], (2.7939677238464355, "3", "G", 3)),
+        ([2**90, True], (1024.0, "1024.0", "YiB", 8)),
+    ],
+)
+def test_naturalsize_parts(test_args, expected):
+    parts = humanize.naturalsize_parts(*test_args)
+    assert parts == expected
+    separator = "" if test_args[2:3] == [True] else " "
+    assert parts.mantissa + separator + parts.unit == humanize.naturalsize(*test_args)
+
+
+@pytest.mark.parametrize(
+    "values, kwargs, expected",
+    [
+        ([], {}, []),
+        ([1, 300], {}, ["1 Byte", "300 Bytes"]),
+        ([0, 2048, -(10**6)], {"binary": True}, ["0.0 KiB", "2.0 KiB", "-976.6 KiB"]),
+        ([300, 3000, 3_000_000], {"gnu": True}, ["0.0M", "0.0M", "2.9M"]),
+        (
+            [300, 3000, 3_000_000],
+            {"policy": "median"},
+            ["0.3 kB", "3.0 kB", "3000.0 kB"],
+        ),
+        (
+            [300, 3000, 3_000_000],
+            {"policy": min},
+            ["300 Bytes", "3000 Bytes", "3000000 Bytes"],
+        ),
+    ],
+)
+def test_naturalsize_column(values, kwargs, expected):
+    assert humanize.naturalsize_column(values, **kwargs) == expected
+
+
+def test_naturalsize_column_invalid_policy():
+    with pytest.raises(ValueError):
+        humanize.naturalsize_column([1], policy="mean")
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{}, {"binary": True}, {"gnu": True}, {"format": "%.3f"}]
+)
+def test_naturalsize_fixed_width(kwargs):
+    values = [0, 1, -999, 1000, 1023, -999_999, 2**40, 10**26]
+    texts = [humanize.naturalsize(v, fixed_width=True, **kwargs) for v in values]
+    assert len({len(text) for text in texts}) == 1
+    for value, text in zip(values, texts):
+        assert text.lstrip() == humanize.naturalsize(value, **kwargs)
+
+    width = humanize.SizeFormatter(**kwargs).width
+    assert all(len(text) == width for text in texts)
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({}, ("   >999 YB", "  <-999 YB")),
+        ({"binary": True}, ("  >1023 YiB", " <-1023 YiB")),
+        ({"gnu": True}, ("  >1023Y", " <-1023Y")),
+    ],
+)
+def test_naturalsize_fixed_width_overflow(kwargs, expected):
+    texts = tuple(
+        humanize.naturalsize(v, fixed_width=True, **kwargs) for v in (1e30, -1e30)
+    )
+    assert texts == expected
+    assert len(texts[0]) == humanize.SizeFormatter(**kwargs).width
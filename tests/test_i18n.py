@@ -1,6 +1,7 @@
 """Internationalisation tests."""
 import datetime as dt
 import importlib
+import locale
 
 import pytest
 
@@ -39,6 +40,11 @@ def test_intcomma():
     try:
         humanize.i18n.activate("fr_FR")
         assert humanize.intcomma(number) == "10 000 000"
+        assert humanize.intcomma(number + 0.5, 1) == "10 000 000,5"
+        assert list(humanize.intcomma_many([number, "1000"])) == ["10 000 000", "1 000"]
+        buf = bytearray()
+        humanize.intcomma_into(buf, number + 0.5, 1)
+        assert buf.decode() == "10 000 000,5"
 
     except FileNotFoundError:
         pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
@@ -51,12 +57,12 @@ def test_intcomma():
 @pytest.mark.parametrize(
     ("locale", "number", "expected_result"),
     (
-        ("es_ES", 1000000, "1.0 millón"),
-        ("es_ES", 3500000, "3.5 millones"),
-        ("es_ES", 1000000000, "1.0 billón"),
-        ("es_ES", 1200000000, "1.2 billones"),
-        ("es_ES", 1000000000000, "1.0 trillón"),
-        ("es_ES", 6700000000000, "6.7 trillones"),
+        ("es_ES", 1000000, "1,0 millón"),
+        ("es_ES", 3500000, "3,5 millones"),
+        ("es_ES", 1000000000, "1,0 billón"),
+        ("es_ES", 1200000000, "1,2 billones"),
+        ("es_ES", 1000000000000, "1,0 trillón"),
+        ("es_ES", 6700000000000, "6,7 trillones"),
     ),
 )
 def test_intword_plurals(locale, number, expected_result):
@@ -70,6 +76,20 @@ def test_intword_plurals(locale, number, expected_result):
         humanize.i18n.deactivate()
 
 
+def test_parse_intword_locale():
+    try:
+        humanize.i18n.activate("es_ES")
+    except FileNotFoundError:
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+    else:
+        assert humanize.parse_intword("3.5 millones") == 3_500_000
+        assert humanize.parse_intword("3,5 millones") == 3_500_000
+        assert humanize.parse_intword("1.0 millón") == 1_000_000
+    finally:
+        humanize.i18n.deactivate()
+        assert humanize.parse_intword("3.5 million") == 3_500_000
+
+
 @pytest.mark.parametrize(
     ("locale", "number", "gender", "expected_result"),
     (
@@ -93,6 +113,129 @@ def test_ordinal_genders(locale, number, gender, expected_result):
         humanize.i18n.deactivate()
 
 
+@pytest.mark.parametrize(
+    ("locale", "func", "args", "expected_result"),
+    (
+        ("de_DE", humanize.intcomma, (-1_234_567.891,), "-1.234.567,891"),
+        ("de_DE", humanize.intcomma, ("1.000.000",), "1.000.000"),
+        ("de_DE", humanize.intcomma, ("-1234567,5",), "-1.234.567,5"),
+        ("fr_FR", humanize.intcomma, ("1 000 000,5",), "1 000 000,5"),
+        ("de_DE", humanize.intcomma, (str(1234.5),), "1.234,5"),
+        ("de_DE", humanize.intcomma, ("1234,5",), "1.234,5"),
+        ("bn_BD", humanize.intcomma, (str(1234.5),), "1,234.5"),
+        ("bn_BD", humanize.intcomma, ("1,00,00,000",), "1,00,00,000"),
+        ("de_DE", humanize.naturalsize, (3_000_000,), "3,0 MB"),
+        ("de_DE", humanize.intword, (1_000_000,), "1,0 Million"),
+        ("de_DE", humanize.scientific, (500,), "5,00 x 10²"),
+        ("de_DE", humanize.engineering, (12_345,), "12,34 x 10³"),
+        ("bn_BD", humanize.intcomma, (10_000_000,), "1,00,00,000"),
+        ("bn_BD", humanize.intcomma, (1234.5,), "1,234.5"),
+    ),
+)
+def test_number_formats(locale, func, args, expected_result):
+    try:
+        humanize.i18n.activate(locale)
+    except FileNotFoundError:
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+    else:
+        assert func(*args) == expected_result
+    finally:
+        humanize.i18n.deactivate()
+
+
+def test_parse_locale_decimal():
+    try:
+        humanize.i18n.activate("de_DE")
+    except FileNotFoundError:
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+    else:
+        assert humanize.decimal_separator() == ","
+        assert humanize.parse_size(humanize.naturalsize(3_000_000)) == 3_000_000
+        assert humanize.parse_size("1.5 kB") == 1500
+    finally:
+        humanize.i18n.deactivate()
+
+    assert humanize.decimal_separator() == "."
+    with pytest.raises(ValueError):
+        humanize.parse_size("1,5 kB")
+
+
+def test_delta_formatter_width_follows_locale():
+    fmt = humanize.DeltaFormatter()
+    english = fmt.width
+    try:
+        humanize.i18n.activate("de_DE")
+        assert fmt.fixed(dt.timedelta(seconds=45)).rstrip() == "45 Sekunden"
+        assert len(fmt.fixed(dt.timedelta(seconds=45))) == fmt.width
+        german = fmt.width
+    except FileNotFoundError:
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+    finally:
+        humanize.i18n.deactivate()
+
+    assert german != english
+    assert fmt.width == english
+
+
+def test_naturalday_follows_locale():
+    today = dt.date.today()
+    assert humanize.naturalday(today) == "today"
+    try:
+        humanize.i18n.activate("fr_FR")
+        assert humanize.naturalday(today) == "aujourd'hui"
+        assert list(humanize.naturalday_many([today])) == ["aujourd'hui"]
+    except FileNotFoundError:
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+    finally:
+        humanize.i18n.deactivate()
+    assert humanize.naturalday(today) == "today"
+
+
+def test_naturalday_follows_lc_time():
+    date = dt.date.today() - dt.timedelta(days=40)
+    previous = locale.setlocale(locale.LC_TIME)
+    try:
+        english = humanize.naturalday(date, "%B")
+        locale.setlocale(locale.LC_TIME, "fr_FR.UTF-8")
+    except locale.Error:
+        locale.setlocale(locale.LC_TIME, previous)
+        pytest.skip("The fr_FR.UTF-8 locale is not available")
+    try:
+        assert humanize.naturalday(date, "%B") == date.strftime("%B") != english
+        assert list(humanize.naturalday_many([date], "%B")) == [date.strftime("%B")]
+    finally:
+        locale.setlocale(locale.LC_TIME, previous)
+    assert humanize.naturalday(date, "%B") == english
+
+
+def test_cached_tables_follow_locale():
+    def render():
+        return (
+            humanize.ordinal(1),
+            humanize.ordinal(1, gender="female"),
+            humanize.apnumber(1),
+            humanize.intword(3_500_000),
+        )
+
+    english = ("1st", "1st", "one", "3.5 million")
+    assert render() == english
+    try:
+        humanize.i18n.activate("fr_FR")
+        french = render()
+        humanize.i18n.activate("de_DE")
+        german = render()
+        humanize.i18n.activate("fr_FR")
+        assert render() == french
+    except FileNotFoundError:
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+    finally:
+        humanize.i18n.deactivate()
+
+    assert french[:3] == ("1er", "1ère", "un")
+    assert german[2] == "eins"
+    assert render() == english
+
+
 def test_default_locale_path_defined__file__():
     i18n = importlib.import_module("humanize.i18n")
     assert i18n._get_default_locale_path() is not None
@@ -1,5 +1,9 @@
 """Number tests."""
 
+import math
+from decimal import Decimal
+from fractions import Fraction
+
 import pytest
 
 import humanize
@@ -55,12 +59,75 @@ def test_ordinal(test_input, expected):
         ([1234.5454545, 2], "1,234.55"),
         ([1234.5454545, 3], "1,234.545"),
         ([1234.5454545, 10], "1,234.5454545000"),
+        ([-1234567], "-1,234,567"),
+        ([-1234567.5], "-1,234,567.5"),
+        ([-1234567.5, 2], "-1,234,567.50"),
+        ([1e16], "1e+16"),
+        ([Decimal("1234567.891")], "1,234,567.891"),
+        ([Decimal("-1234567.891"), 2], "-1,234,567.89"),
+        ([Decimal("NaN"), 2], "NaN"),
+        ([10**40], "10" + ",000" * 13),
+        (["-1000000"], "-1,000,000"),
+        (["1,000"], "1,000"),
+        (["abc"], "abc"),
     ],
 )
 def test_intcomma(test_args, expected):
     assert humanize.intcomma(*test_args) == expected
 
 
+@pytest.mark.parametrize(
+    "test_args",
+    [
+        [100],
+        [1_000_000],
+        [-1234567],
+        [1234.5454545, 2],
+        [-1234567.5],
+        [1e16],
+        [10**40],
+        [Decimal("1234567.891")],
+        ["1000"],
+    ],
+)
+def test_intcomma_into(test_args):
+    buf = bytearray()
+    assert humanize.intcomma_into(buf, *test_args) == len(buf)
+    assert buf.decode() == humanize.intcomma(*test_args)
+
+
+@pytest.mark.parametrize("value", [None, "abc", object()])
+def test_intcomma_into_invalid(value):
+    buf = bytearray(b"x")
+    with pytest.raises(TypeError):
+        humanize.intcomma_into(buf, value)
+    with pytest.raises(TypeError):
+        humanize.intword_into(buf, value)
+    assert buf == b"x"
+
+
+def test_intcomma_huge():
+    # Beyond the default int max str digits limit
+    value = 10**5000 + 123_456
+    assert humanize.intcomma(value) == "100" + ",000" * 1664 + ",123,456"
+    assert humanize.intcomma(-value) == "-" + humanize.intcomma(value)
+
+
+def test_intcomma_many():
+    values = [100, -1_000_000, 1234.5454545, Decimal("10000.5"), 2.5e20, None]
+    for ndigits in (None, 2):
+        expected = [humanize.intcomma(value, ndigits) for value in values]
+        assert list(humanize.intcomma_many(values, ndigits)) == expected
+        assert list(humanize.intcomma_many(iter(values), ndigits)) == expected
+    assert list(humanize.intcomma_many(["1000", "abc"])) == ["1,000", "abc"]
+
+
+def test_intcomma_many_into():
+    view = memoryview(bytearray(16))
+    assert humanize.intcomma_many_into(view, [1000, 2_000_000], b" ", offset=0) == 15
+    assert bytes(view) == b"1,000 2,000,000\x00"
+
+
 def test_intword_powers():
     # make sure that powers & human_powers have the same number of items
     assert len(number.powers) == len(number.human_powers)
@@ -90,12 +157,114 @@ def test_intword_powers():
         ([None], None),
         (["1230000", "%0.2f"], "1.23 million"),
         ([10**101], "1" + "0" * 101),
+        ([727_957_110_789_249_893_915_346_607, "%.10f"], "727.9571107892 septillion"),
+        ([10**33 - 1], "1.0 decillion"),
+        ([-(10**5000)], "-1" + "0" * 5000),
     ],
 )
 def test_intword(test_args, expected):
     assert humanize.intword(*test_args) == expected
 
 
+@pytest.mark.parametrize(
+    "test_args",
+    [["100"], ["12400"], [1_200_000_000], ["1234000", "%0.3f"], [10**101]],
+)
+def test_intword_into(test_args):
+    buf = bytearray()
+    assert humanize.intword_into(buf, *test_args) == len(buf)
+    assert buf.decode() == humanize.intword(*test_args)
+
+
+@pytest.mark.parametrize("format", ["%.1f", "%d", "%.3f", "%.0f", "%.2e"])
+def test_intword_formatter(format):
+    fmt = humanize.IntwordFormatter(format)
+    values = [None, "foo", -5, 999, 12_400, 999_950, 999_999_999, 10**33 - 1]
+    values += [10**36, 10**100, 10**101]
+    for value in values:
+        assert fmt(value) == humanize.intword(value, format)
+        assert fmt.parts(value) == humanize.intword_parts(value, format)
+        buf = bytearray()
+        if value in (None, "foo"):
+            with pytest.raises(TypeError):
+                fmt.into(buf, value)
+            continue
+        assert fmt.into(buf, value) == len(buf)
+        assert buf.decode() == humanize.intword(value, format)
+
+
+@pytest.mark.parametrize(
+    "format, value, expected",
+    [
+        ("%.1f", 999_949, "999.9 thousand"),
+        ("%.1f", 999_950, "1.0 million"),
+        ("%.2f", 999_994, "999.99 thousand"),
+        ("%.2f", 999_995, "1.00 million"),
+        ("%d", 999_999, "999 thousand"),
+        ("%.1f", 999_940_000_000_000_000_000, "999.9 quintillion"),
+        ("%.1f", 999_950_000_000_000_000_000, "1.0 sextillion"),
+    ],
+)
+def test_intword_formatter_rollover(format, value, expected):
+    assert humanize.IntwordFormatter(format)(value) == expected
+
+
+def test_intword_many():
+    values = [100, "12400", 1_200_000_000, None, 10**101]
+    for format in ("%.1f", "%.3f"):
+        expected = [humanize.intword(value, format) for value in values]
+        assert list(humanize.intword_many(values, format)) == expected
+        assert list(humanize.intword_many(iter(values), format)) == expected
+
+
+def test_intword_many_into():
+    buf = bytearray()
+    humanize.intword_many_into(buf, [100, 12_400, 1_000_000])
+    assert buf == b"100\n12.4 thousand\n1.0 million"
+
+
+@pytest.mark.parametrize(
+    "test_input, expected",
+    [
+        ("100", 100),
+        ("12.4 thousand", 12_400),
+        ("1.0 million", 1_000_000),
+        ("1.23 million", 1_230_000),
+        ("-2.5 billion", -2_500_000_000),
+        ("8.1 decillion", 81 * 10**32),
+        ("1.0 googol", 10**100),
+    ],
+)
+def test_parse_intword(test_input, expected):
+    assert humanize.parse_intword(test_input) == expected
+
+
+@pytest.mark.parametrize("test_input", ["", "thousand", "1.2 bazillion", "1 2"])
+def test_parse_intword_invalid(test_input):
+    with pytest.raises(ValueError):
+        humanize.parse_intword(test_input)
+
+
+def test_parse_intword_many():
+    values = (humanize.intword(v) for v in (100, 12_400, 1_200_000_000))
+    assert list(humanize.parse_intword_many(values)) == [100, 12_400, 1_200_000_000]
+
+
+@pytest.mark.parametrize(
+    "test_args, expected",
+    [
+        (["100"], (100, "100", "", None)),
+        (["12400"], (12.4, "12.4", "thousand", 0)),
+        (["999999999"], (0.999999999, "1.0", "billion", 2)),
+        (["1234000", "%0.3f"], (1.234, "1.234", "million", 1)),
+        ([10**101], (10**101, "1" + "0" * 101, "", None)),
+        (["foo"], None),
+    ],
+)
+def test_intword_parts(test_args, expected):
+    assert humanize.intword_parts(*test_args) == expected
+
+
 @pytest.mark.parametrize(
     "test_input, expected",
     [
@@ -135,6 +304,50 @@ def test_fractional(test_input, expected):
     assert humanize.fractional(test_input) == expected
 
 
+@pytest.mark.parametrize(
+    "test_args, expected",
+    [
+        ([3.14159, 10], "3 1/7"),
+        ([3.14159, 100], "3 14/99"),
+        ([3.14159, 1000], "3 16/113"),
+        ([0.333, 10], "1/3"),
+        ([0.96, 10], "1/1"),
+        ([-0.3, 10], "-3/10"),
+        ([0.5000001, 1], "1/1"),
+        ([0.0001, 1024], "0/1"),
+        ([3.14159, 10**6], "3 14159/100000"),
+        ([math.pi, 10**12], "3 56667685227/400216280932"),
+    ],
+)
+def test_fractional_max_denominator(test_args, expected):
+    assert humanize.fractional(*test_args) == expected
+
+
+def test_fractional_max_denominator_invalid():
+    with pytest.raises(ValueError):
+        humanize.fractional(0.5, 0)
+    with pytest.raises(ValueError):
+        list(humanize.fractional_many([0.5], 0))
+
+
+@pytest.mark.parametrize("max_denominator", [1, 7, 1000, 1024, 10**6, 10**15])
+def test_fractional_matches_limit_denominator(max_denominator):
+    values = [i / 997 - 3 for i in range(6 * 997)] + [0.5, 2**-11, 1 - 2**-11]
+    for value in values:
+        frac = Fraction(value - int(value)).limit_denominator(max_denominator)
+        text = humanize.fractional(value, max_denominator)
+        assert text.endswith(f"{frac.numerator}/{frac.denominator}") or (
+            frac.numerator == 0 and int(value) and text == str(int(value))
+        )
+
+
+def test_fractional_many():
+    values = [1, 4.0 / 3.0, "8.9", "ten", None, -2.25]
+    expected = [humanize.fractional(value) for value in values]
+    assert list(humanize.fractional_many(values)) == expected
+    assert list(humanize.fractional_many([3.14159], 10)) == ["3 1/7"]
+
+
 @pytest.mark.parametrize(
     "test_args, expected",
     [
@@ -151,12 +364,59 @@ def test_fractional(test_input, expected):
         ([float(0.3), 1], "3.0 x 10⁻¹"),
         ([1000, 0], "1 x 10³"),
         ([float(0.3), 0], "3 x 10⁻¹"),
+        ([0], "0.00 x 10⁰"),
+        ([9.999], "1.00 x 10¹"),
+        ([0.00012], "1.20 x 10⁻⁴"),
+        ([1.5e-7], "1.50 x 10⁻⁷"),
+        ([1e16], "1.00 x 10⁺¹⁶"),
+        ([12_345_678_901], "1.23 x 10⁺¹⁰"),
+        ([10**400], "1.00 x 10⁺⁴⁰⁰"),
+        ([Decimal("1.5")], "1.50 x 10⁰"),
+        ([Decimal("-1.5")], "1.50 x 10⁻⁰"),
+        ([Decimal("0")], "0.00 x 10⁰"),
+        ([Decimal("1E-7")], "1.00 x 10⁻⁷"),
+        ([Decimal("1.235E+400")], "1.24 x 10⁺⁴⁰⁰"),
     ],
 )
 def test_scientific(test_args, expected):
     assert humanize.scientific(*test_args) == expected
 
 
+@pytest.mark.parametrize(
+    "test_args, expected",
+    [
+        ([0], "0.00 x 10⁰"),
+        ([1], "1.00 x 10⁰"),
+        ([999], "999.00 x 10⁰"),
+        ([1000], "1.00 x 10³"),
+        ([-12_346], "-12.35 x 10³"),
+        ([12_345], "12.34 x 10³"),
+        ([12_345, 0], "12 x 10³"),
+        ([0.3], "300.00 x 10⁻³"),
+        ([0.00042, 1], "420.0 x 10⁻⁶"),
+        ([999_999.9, 1], "1.0 x 10⁶"),
+        (["1e-10"], "100.00 x 10⁻¹²"),
+        ([10**400 + 1, 3], "10.000 x 10³⁹⁹"),
+        ([float("inf")], "inf"),
+        (["foo"], "foo"),
+        ([None], None),
+    ],
+)
+def test_engineering(test_args, expected):
+    assert humanize.engineering(*test_args) == expected
+
+
+def test_scientific_many():
+    values = [1000, -1000, 0.3, "99", "foo", None, 1e-5]
+    for precision in (0, 2):
+        expected = [humanize.scientific(value, precision) for value in values]
+        assert list(humanize.scientific_many(values, precision)) == expected
+    assert list(humanize.scientific_many([12_346, 0.3], engineering=True)) == [
+        "12.35 x 10³",
+        "300.00 x 10⁻³",
+    ]
+
+
 @pytest.mark.parametrize(
     "test_args, expected",
     [
@@ -172,3 +432,33 @@ def test_scientific(test_args, expected):
 )
 def test_clamp(test_args, expected):
     assert humanize.clamp(*test_args) == expected
+
+
+@pytest.mark.parametrize(
+    "test_args, expected",
+    [
+        ([0, "Hz"], "0.0 Hz"),
+        ([1, "Hz"], "1.0 Hz"),
+        ([1500, "Hz"], "1.5 kHz"),
+        ([-2_400_000, "W"], "-2.4 MW"),
+        ([0.5, "W"], "500.0 mW"),
+        ([0.00042, "s"], "420.0 µs"),
+        ([3e-9, "s", "si", "%.0f"], "3 ns"),
+        ([1e-30, "m"], "0.0 ym"),
+        ([3e27, "B"], "3000.0 YB"),
+        ([3000, "B", "iec"], "2.9 KiB"),
+        ([0.5, "B", "iec"], "0.5 B"),
+        (["1500", "req/s"], "1.5 kreq/s"),
+    ],
+)
+def test_naturalquantity(test_args, expected):
+    assert humanize.naturalquantity(*test_args) == expected
+
+
+def test_quantity_formatter_parts():
+    fmt = humanize.QuantityFormatter("Hz")
+    assert fmt.parts(1500) == (1.5, "1.5", "kHz", 3)
+    assert fmt.parts(0.002) == (2.0, "2.0", "mHz", -3)
+    buf = bytearray()
+    fmt.into(buf, 0.00042)
+    assert buf.decode() == "420.0 µHz"
@@ -0,0 +1,146 @@
+"""Tests for the vectorized NumPy functions."""
+
+import datetime as dt
+from array import array
+
+import pytest
+
+import humanize
+
+np = pytest.importorskip("numpy")
+hnp = pytest.importorskip("humanize.numpy")
+
+VALUES = [
+    0,
+    1,
+    -1,
+    300,
+    999,
+    1000,
+    1024,
+    12_400,
+    999_949,
+    999_950,
+    -3_000_000,
+    999_999_999,
+    1_234_567_890,
+    10**18,
+    2**63 - 1,
+]
+
+
+@pytest.mark.parametrize(
+    "name, args",
+    [
+        ("naturalsize", ()),
+        ("naturalsize", (True,)),
+        ("naturalsize", (False, True, "%.3f")),
+        ("intword", ()),
+        ("intword", ("%.0f",)),
+        ("intcomma", ()),
+        ("intcomma", (2,)),
+        ("scientific", ()),
+        ("scientific", (0,)),
+        ("scientific", (5,)),
+        ("scientific", (13,)),
+    ],
+)
+@pytest.mark.parametrize(
+    "values",
+    [
+        VALUES,
+        VALUES + [2**53 + 1, -(2**62) - 7],
+        [float(v) for v in VALUES] + [-0.0, 0.3, 1e-5, -1e-5, 1e24, 999.99e33, 1e101],
+        [2.0**53 + 2, 9.2e18, 1e50, -1.2345e40, 7.77e66],
+        [9.995, 99.5, 1.125, -2.5, 999.5, 0.00015, 1.7976931348623157e308],
+    ],
+)
+def test_matches_scalar(name, args, values):
+    result = getattr(hnp, name)(np.array(values), *args)
+    expected = [getattr(humanize, name)(v, *args) for v in values]
+    assert result.tolist() == expected
+
+
+def test_shape_preserved():
+    result = hnp.naturalsize(np.arange(6).reshape(2, 3) * 1000)
+    assert result.shape == (2, 3)
+    assert result.tolist() == [
+        ["0 Bytes", "1.0 kB", "2.0 kB"],
+        ["3.0 kB", "4.0 kB", "5.0 kB"],
+    ]
+
+
+def test_non_numeric_falls_back():
+    values = np.array(["1000", None, "foo"], dtype=object)
+    assert hnp.intword(values).tolist() == ["1.0 thousand", None, "foo"]
+    assert hnp.intword(np.array([1500.0, np.nan])).tolist()[0] == "1.5 thousand"
+
+
+DELTA_ARGS = [
+    ("naturaldelta", ()),
+    ("naturaldelta", (False, "microseconds")),
+    ("precisedelta", ()),
+    ("precisedelta", ("microseconds",)),
+    ("precisedelta", ("milliseconds", ["seconds", "days"], "%0.1f")),
+    ("precisedelta", ("years",)),
+]
+
+
+@pytest.mark.parametrize("name, args", DELTA_ARGS)
+def test_timedelta64_matches_ns(name, args):
+    values = VALUES + [-v for v in VALUES[1:-1]] + [1_500, 3_723_000_000_500]
+    result = getattr(hnp, name)(np.array(values, dtype="m8[ns]"), *args)
+    expected = [getattr(humanize, name + "_ns")(v, *args) for v in values]
+    assert result.tolist() == expected
+
+
+@pytest.mark.parametrize("name, args", DELTA_ARGS)
+def test_delta_seconds_match_scalar(name, args):
+    values = [v for v in VALUES if abs(v) < 10**12] + [-30, 86_400, -90_000, 10**13]
+    floats = [0.5, -0.5, 89.9, -3_600.7, 1e13, float("nan")]
+    result = getattr(hnp, name)(np.array(values), *args)
+    assert result.tolist() == [getattr(humanize, name)(v, *args) for v in values]
+    result = getattr(hnp, name)(np.array(floats), *args).tolist()
+    expected = [getattr(humanize, name)(v, *args) for v in floats]
+    assert result[:-1] == expected[:-1]
+    assert np.isnan(result[-1]) and np.isnan(expected[-1])
+
+
+def test_delta_buffers():
+    latencies = array("q", [4, 1_500, 120_000])
+    assert hnp.naturaldelta(memoryview(latencies)).tolist() == [
+        "4 seconds",
+        "25 minutes",
+        "a day",
+    ]
+    view = np.frombuffer(latencies, dtype="m8[ms]")
+    assert hnp.naturaldelta(view, minimum_unit="milliseconds").tolist() == [
+        "4 milliseconds",
+        "a second",
+        "2 minutes",
+    ]
+
+    values = np.array([[90, "NaT"], [3_600, 1]], dtype="m8[s]")
+    result = hnp.precisedelta(values)
+    assert result.shape == (2, 2)
+    assert result[0, 0] == "1 minute and 30 seconds"
+    assert np.isnat(result[0, 1])
+    assert result[1].tolist() == ["1 hour", "1 second"]
+
+
+@pytest.mark.parametrize(
+    "unit, values",
+    [
+        ("D", [10**6, -(10**6), 106_751, 106_752, 2**62]),
+        ("s", [10**10, -(10**10), 9_223_372_036, 9_223_372_037, -(2**62)]),
+    ],
+)
+def test_timedelta64_beyond_ns_range(unit, values):
+    arr = np.array(values, dtype=f"m8[{unit}]")
+    ns = [v * 10**9 * (86_400 if unit == "D" else 1) for v in values]
+    assert hnp.naturaldelta(arr).tolist() == [humanize.naturaldelta_ns(v) for v in ns]
+    assert hnp.precisedelta(arr).tolist() == [humanize.precisedelta_ns(v) for v in ns]
+
+    delta = dt.timedelta(**{"days" if unit == "D" else "seconds": values[0]})
+    assert hnp.naturaldelta(arr)[0] == humanize.naturaldelta(delta)
+    assert hnp.precisedelta(arr)[0] == humanize.precisedelta(delta)
@@ -1,6 +1,8 @@
 """Tests for time humanizing."""
 
 import datetime as dt
+import threading
+from array import array
 
 import pytest
 from freezegun import freeze_time
@@ -39,33 +41,6 @@ VALUE_ERROR_TEST = FakeDate(290149024, 2, 2)
 OVERFLOW_ERROR_TEST = FakeDate(120390192341, 2, 2)
 
 
-def assertEqualDatetime(dt1, dt2):
-    assert (dt1 - dt2).seconds == 0
-
-
-def assertEqualTimedelta(td1, td2):
-    assert td1.days == td2.days
-    assert td1.seconds == td2.seconds
-
-
-# These are not considered "public" interfaces, but require tests anyway.
-
-
-def test_date_and_delta():
-    now = dt.datetime.now()
-    td = dt.timedelta
-    int_tests = (3, 29, 86399, 86400, 86401 * 30)
-    date_tests = [now - td(seconds=x) for x in int_tests]
-    td_tests = [td(seconds=x) for x in int_tests]
-    results = [(now - td(seconds=x), td(seconds=x)) for x in int_tests]
-    for t in (int_tests, date_tests, td_tests):
-        for arg, result in zip(t, results):
-            date, d = time._date_and_delta(arg)
-            assertEqualDatetime(date, result[0])
-            assertEqualTimedelta(d, result[1])
-    assert time._date_and_delta("NaN") == (None, "NaN")
-
-
 # Tests for the public interface of humanize.time
 
 
@@ -164,6 +139,106 @@ def test_naturaltime(test_input, expected):
     assert humanize.naturaltime(test_input) == expected
 
 
+def test_naturaltime_many():
+    when = dt.datetime(2020, 2, 2, 12)
+    values = [
+        when,
+        when - dt.timedelta(minutes=3),
+        when + dt.timedelta(days=500),
+        dt.timedelta(seconds=-30),
+        30,
+        "NaN",
+    ]
+    expected = [
+        "now",
+        "3 minutes ago",
+        "1 year, 4 months from now",
+        "30 seconds from now",
+        "30 seconds from now",
+        "NaN",
+    ]
+    result = humanize.naturaltime_many(values, future=True, when=when)
+    assert not isinstance(result, list)
+    assert list(result) == expected
+    assert [humanize.naturaltime(v, True, when=when) for v in values] == expected
+
+
+@pytest.mark.parametrize(
+    "test_input, minimum_unit, expected",
+    [
+        (dt.timedelta(seconds=-150), "seconds", ("2 minutes ago", 30)),
+        (dt.timedelta(seconds=-30), "seconds", ("30 seconds ago", 1)),
+        (dt.timedelta(seconds=-119), "seconds", ("a minute ago", 1)),
+        (dt.timedelta(hours=-23), "seconds", ("23 hours ago", 3600)),
+        (dt.timedelta(seconds=30), "seconds", ("30 seconds from now", 1e-6)),
+        (dt.timedelta(seconds=0.5), "seconds", ("now", 1.5)),
+        (dt.timedelta(0), "seconds", ("now", 1)),
+        (dt.timedelta(microseconds=-10), "microseconds", ("10 microseconds ago", 1e-6)),
+        (dt.timedelta(days=-10), "seconds", ("10 days ago", 86400)),
+        (dt.timedelta(days=-32), "seconds", ("a month ago", 29 * 86400)),
+    ],
+)
+def test_naturaltime_transition(test_input, minimum_unit, expected):
+    when = dt.datetime(2020, 2, 2, 12)
+    text, at = humanize.naturaltime_transition(
+        when + test_input, minimum_unit=minimum_unit, when=when
+    )
+    assert (text, (at - when).total_seconds()) == expected
+    assert text == humanize.naturaltime(
+        when + test_input, minimum_unit=minimum_unit, when=when
+    )
+    assert (
+        humanize.naturaltime(when + test_input, minimum_unit=minimum_unit, when=at)
+        != text
+    )
+
+
+def test_naturaltime_transition_constant():
+    assert humanize.naturaltime_transition(30) == ("30 seconds ago", None)
+    assert humanize.naturaltime_transition("NaN") == ("NaN", None)
+
+
+def test_natural_time_scheduler():
+    when = dt.datetime(2020, 2, 2, 12)
+    scheduler = humanize.NaturalTimeScheduler()
+    assert scheduler.next_change is None
+    assert (
+        scheduler.add(1, when - dt.timedelta(seconds=5), when=when) == "5 seconds ago"
+    )
+    assert (
+        scheduler.add(2, when - dt.timedelta(minutes=5), when=when) == "5 minutes ago"
+    )
+    assert scheduler.add(3, 90, when=when) == "a minute ago"
+    assert len(scheduler) == 3
+    assert scheduler.next_change == when + dt.timedelta(seconds=1)
+
+    assert scheduler.update(when + dt.timedelta(microseconds=999_999)) == {}
+    assert scheduler.update(when + dt.timedelta(seconds=1)) == {1: "6 seconds ago"}
+    assert scheduler.update(when + dt.timedelta(seconds=60)) == {
+        1: "a minute ago",
+        2: "6 minutes ago",
+    }
+    assert scheduler[3] == "a minute ago"
+
+    # Replaced and removed items are not rendered from their old entries
+    scheduler.add(1, when - dt.timedelta(hours=3), when=when)
+    scheduler.remove(2)
+    assert 2 not in scheduler
+    assert scheduler.next_change == when + dt.timedelta(hours=1)
+    assert scheduler.update(when + dt.timedelta(minutes=30)) == {}
+    assert scheduler.update(when + dt.timedelta(hours=1)) == {1: "4 hours ago"}
+
+
+@freeze_time("2020-02-02")
+def test_naturaltime_many_single_now():
+    values = [NOW - dt.timedelta(seconds=s) for s in (0, 1, 3600)]
+    assert list(humanize.naturaltime_many(values)) == [
+        "now",
+        "a second ago",
+        "an hour ago",
+    ]
+
+
 def nt_nomonths(d):
     return humanize.naturaltime(d, months=False)
 
@@ -270,6 +345,39 @@ def test_naturaldate(test_input, expected):
     assert humanize.naturaldate(test_input) == expected
 
 
+def test_naturalday_many():
+    clock = humanize.FrozenClock(dt.datetime(2020, 2, 2, 23))
+    values = [
+        dt.date(2020, 2, 2),
+        dt.datetime(2020, 2, 3, 1),
+        dt.date(2019, 1, 1),
+        None,
+    ]
+    with humanize.use_clock(clock):
+        assert list(humanize.naturalday_many(values)) == [
+            "today",
+            "tomorrow",
+            "Jan 01",
+            None,
+        ]
+        assert list(humanize.naturaldate_many(values)) == [
+            "today",
+            "tomorrow",
+            "Jan 01 2019",
+            None,
+        ]
+
+        # Cached outputs follow the date when it rolls over
+        clock.advance(dt.timedelta(hours=2))
+        assert humanize.naturalday(values[0]) == "yesterday"
+        assert [humanize.naturalday(v, "%d/%m") for v in values] == [
+            "yesterday",
+            "today",
+            "01/01",
+            None,
+        ]
+
+
 @pytest.mark.parametrize(
     "seconds, expected",
     [
@@ -335,6 +443,73 @@ def test_naturaldelta_minimum_unit_explicit(minimum_unit, seconds, expected):
     assert humanize.naturaldelta(delta, minimum_unit=minimum_unit) == expected
 
 
+@pytest.mark.parametrize("minimum_unit", ["seconds", "milliseconds"])
+@pytest.mark.parametrize("months", [True, False])
+def test_naturaldelta_fixed_width(months, minimum_unit):
+    values = [
+        dt.timedelta(microseconds=4000),
+        dt.timedelta(seconds=1),
+        dt.timedelta(seconds=45),
+        dt.timedelta(days=200),
+        dt.timedelta(days=500),
+        dt.timedelta(days=999_999_999),
+    ]
+    texts = [
+        humanize.naturaldelta(v, months, minimum_unit, fixed_width=True) for v in values
+    ]
+    assert len({len(text) for text in texts}) == 1
+    for value, text in zip(values, texts):
+        assert text.rstrip() == humanize.naturaldelta(value, months, minimum_unit)
+    assert humanize.naturaldelta("NaN", fixed_width=True) == "NaN"
+
+
+@pytest.mark.parametrize(
+    "months, minimum_unit, test_input, expected",
+    [
+        (True, "seconds", dt.timedelta(microseconds=999_999), "a moment"),
+        (True, "seconds", dt.timedelta(seconds=1), "a second"),
+        (True, "seconds", dt.timedelta(seconds=119), "a minute"),
+        (True, "seconds", dt.timedelta(seconds=120), "2 minutes"),
+        (True, "seconds", dt.timedelta(hours=2, microseconds=-1), "an hour"),
+        (True, "seconds", dt.timedelta(days=30), "30 days"),
+        (True, "seconds", dt.timedelta(days=31), "a month"),
+        (True, "seconds", dt.timedelta(days=61), "2 months"),
+        (True, "seconds", dt.timedelta(days=364, hours=23), "11 months"),
+        (True, "seconds", dt.timedelta(days=365), "a year"),
+        (True, "seconds", dt.timedelta(days=366), "1 year, 1 day"),
+        (True, "seconds", dt.timedelta(days=396), "1 year, 1 month"),
+        (True, "seconds", dt.timedelta(days=729), "1 year, 11 months"),
+        (True, "seconds", dt.timedelta(days=365 * 1234), "1,234 years"),
+        (False, "seconds", dt.timedelta(days=396), "1 year, 31 days"),
+        (False, "seconds", dt.timedelta(days=364), "364 days"),
+        (True, "milliseconds", dt.timedelta(microseconds=999), "0 milliseconds"),
+        (True, "MICROSECONDS", dt.timedelta(microseconds=999), "999 microseconds"),
+        (True, "microseconds", dt.timedelta(microseconds=1000), "1 millisecond"),
+        (True, "seconds", -1, "a day"),
+        (True, "seconds", "7", "7 seconds"),
+        (True, "seconds", "NaN", "NaN"),
+    ],
+)
+def test_delta_formatter(months, minimum_unit, test_input, expected):
+    fmt = humanize.DeltaFormatter(months, minimum_unit)
+    assert fmt(test_input) == expected
+    assert humanize.naturaldelta(test_input, months, minimum_unit) == expected
+
+
+def test_delta_formatter_fixed():
+    fmt = humanize.DeltaFormatter()
+    assert fmt.fixed(dt.timedelta(seconds=45)) == "45 seconds".ljust(fmt.width)
+    assert fmt.fixed(dt.timedelta(days=999_999_999)).rstrip() == "2,739,726 years"
+    assert fmt.fixed("NaN") == "NaN"
+
+
+def test_delta_formatter_minimum_unit():
+    with pytest.raises(ValueError):
+        humanize.DeltaFormatter(minimum_unit="hours")
+    with pytest.raises(KeyError):
+        humanize.DeltaFormatter(minimum_unit="fortnights")
+
+
 @pytest.mark.parametrize(
     "seconds, expected",
     [
@@ -605,6 +780,89 @@ def test_precisedelta_suppress_units(val, min_unit, suppress, expected):
     )
 
 
+@pytest.mark.parametrize(
+    "minimum_unit, suppress, test_input, expected",
+    [
+        ("seconds", (), dt.timedelta(days=31), "1 month and 0 days"),
+        ("seconds", ("days",), dt.timedelta(days=31), "1 month and 12 hours"),
+        ("days", (), dt.timedelta(days=31), "1 month and 0.50 days"),
+        ("years", (), dt.timedelta(days=730), "2.0 years"),
+        ("seconds", ("years",), dt.timedelta(days=400), "13 months and 3 days"),
+        ("hours", ("hours",), dt.timedelta(days=1, hours=12), "1.50 days"),
+        ("microseconds", (), dt.timedelta(microseconds=1), "1 microsecond"),
+        ("microseconds", (), dt.timedelta(0), "0 microseconds"),
+        ("seconds", (), dt.timedelta(days=999_999_999), "2,739,726 years and 9 days"),
+        ("seconds", (), dt.timedelta(seconds=-90), "1 minute and 30 seconds"),
+        ("seconds", (), "NaN", "NaN"),
+    ],
+)
+def test_precise_delta_formatter(minimum_unit, suppress, test_input, expected):
+    fmt = humanize.PreciseDeltaFormatter(minimum_unit, suppress)
+    assert fmt(test_input) == expected
+    assert humanize.precisedelta(test_input, minimum_unit, suppress) == expected
+
+
+@pytest.mark.parametrize(
+    "test_input, minimum_unit, expected",
+    [
+        (0, "seconds", "a moment"),
+        (999_999_999, "seconds", "a moment"),
+        (1_500_000_000, "seconds", "a second"),
+        (-45 * 10**9, "seconds", "45 seconds"),
+        (1_999, "microseconds", "1 microsecond"),
+        (4_000_000, "milliseconds", "4 milliseconds"),
+        (500 * 86_400 * 10**9, "seconds", "1 year, 4 months"),
+        (10**27, "seconds", "31,709,791,983 years"),
+    ],
+)
+def test_naturaldelta_ns(test_input, minimum_unit, expected):
+    assert humanize.naturaldelta_ns(test_input, minimum_unit=minimum_unit) == expected
+
+
+def test_ns_many():
+    values = array("q", [-1_500, 0, 90 * 10**9, 2**63 - 1])
+    assert list(humanize.naturaldelta_ns_many(memoryview(values))) == [
+        humanize.naturaldelta_ns(v) for v in values
+    ]
+    assert list(humanize.precisedelta_ns_many(values, minimum_unit="microseconds")) == [
+        humanize.precisedelta_ns(v, minimum_unit="microseconds") for v in values
+    ]
+    assert list(humanize.naturaldelta_ns_many([])) == []
+
+
+def test_naturaltime_ns():
+    when = 1_600_000_000 * 10**9
+    assert humanize.naturaltime_ns(when, when=when) == "now"
+    assert humanize.naturaltime_ns(when - 3 * 10**9, when=when) == "3 seconds ago"
+    assert (
+        humanize.naturaltime_ns(when + 3 * 10**9, when=when) == "3 seconds from now"
+    )
+    assert humanize.naturaltime_ns(0) == humanize.naturaltime(
+        dt.datetime.now() - dt.datetime.fromtimestamp(0)
+    )
+
+
+@pytest.mark.parametrize(
+    "test_input, minimum_unit, suppress, expected",
+    [
+        (90 * 10**9, "seconds", (), "1 minute and 30 seconds"),
+        (-90 * 10**9, "seconds", (), "1 minute and 30 seconds"),
+        (1_500, "microseconds", (), "1.50 microseconds"),
+        (1_001_000, "microseconds", (), "1 millisecond and 1 microsecond"),
+        (2_500_000, "microseconds", ("milliseconds",), "2500 microseconds"),
+        (3_600 * 10**9, "seconds", ("hours",), "60 minutes"),
+        (
+            10**27,
+            "seconds",
+            (),
+            "31,709,791,983 years, 9 months, 4 days, 1 hour, 46 minutes and 40 seconds",
+        ),
+    ],
+)
+def test_precisedelta_ns(test_input, minimum_unit, suppress, expected):
+    assert humanize.precisedelta_ns(test_input, minimum_unit, suppress) == expected
+
+
 def test_precisedelta_bogus_call():
     assert humanize.precisedelta(None) is None
 
@@ -614,6 +872,9 @@ def test_precisedelta_bogus_call():
     with pytest.raises(ValueError):
         humanize.naturaldelta(1, minimum_unit="years")
 
+    with pytest.raises(ValueError):
+        humanize.PreciseDeltaFormatter("months", suppress=["months", "years"])
+
 
 def test_time_unit():
     years, minutes = time.Unit["YEARS"], time.Unit["MINUTES"]
@@ -623,3 +884,44 @@ def test_time_unit():
 
     with pytest.raises(TypeError):
         years < "foo"
+
+
+def test_frozen_clock():
+    clock = humanize.FrozenClock(dt.datetime(2020, 2, 2, 12))
+    with humanize.use_clock(clock):
+        assert humanize.naturaltime(dt.datetime(2020, 2, 2, 11, 59)) == "a minute ago"
+        assert humanize.naturalday(dt.date(2020, 2, 1)) == "yesterday"
+        assert humanize.naturaldate(dt.date(2019, 2, 2)) == "Feb 02 2019"
+        assert humanize.precisedelta(dt.datetime(2020, 2, 2, 11)) == "1 hour"
+        assert humanize.naturaltime_ns(int(clock().timestamp() * 10**9)) == "now"
+        clock.advance(dt.timedelta(days=1))
+        assert humanize.naturalday(dt.date(2020, 2, 1)) == "Feb 01"
+        assert list(humanize.naturaltime_many([dt.datetime(2020, 2, 3, 12)])) == ["now"]
+    assert humanize.naturalday(dt.date.today()) == "today"
+
+
+def test_set_clock_is_per_thread():
+    clock = humanize.FrozenClock(dt.datetime(2000, 1, 1))
+    previous = humanize.set_clock(clock)
+    try:
+        assert previous is None
+        assert time._now() is clock.now
+        result = []
+        thread = threading.Thread(target=lambda: result.append(time._now()))
+        thread.start()
+        thread.join()
+        assert result[0] > clock.now
+    finally:
+        assert humanize.set_clock(previous) is clock
+    assert time._now() > clock.now
+
+
+def test_coarse_clock():
+    clock = humanize.CoarseClock(resolution=60)
+    first = clock()
+    assert clock() is first
+    clock = humanize.CoarseClock(resolution=0)
+    first = clock()
+    assert clock() is not first
+    with humanize.use_clock(humanize.CoarseClock()):
+        assert humanize.naturaltime(dt.datetime.now()) == "now"